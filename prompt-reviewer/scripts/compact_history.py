@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Compact the prompt review history file.
+
+Usage:
+  compact_history.py [--merge latest|mean] [--retention-weeks N] [--dry-run]
+
+Options:
+  --merge MODE          How to collapse records for the same (week, provider, project):
+                        'latest' keeps the newest record (default), 'mean' keeps the
+                        newest record's metadata with averaged composite and axes
+  --retention-weeks N   Move improvements/strengths payloads of weeks older than N
+                        weeks into the side archive (default: 26, 0 = keep all)
+  --dry-run             Report what would change without rewriting anything
+
+Backfill retries and re-reviews leave several records per key, which
+show_trend would otherwise average together. Compaction keeps one record per
+key, sorts records by week (so show_trend's tail reader rarely needs a full
+scan) and rewrites ~/.claude/prompt-review-history.jsonl atomically via a temp
+file and rename. Stripped payloads are appended to
+~/.claude/prompt-review-archive.jsonl.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+HISTORY_FILE = Path.home() / ".claude" / "prompt-review-history.jsonl"
+ARCHIVE_FILE = Path.home() / ".claude" / "prompt-review-archive.jsonl"
+
+AXES = [
+    "clarity", "context", "autonomy", "constraints",
+    "checkpoints", "followup", "collaboration",
+    "adaptability", "outcome",
+]
+
+PAYLOAD_FIELDS = ("improvements", "strengths")
+
+
+def iso_week(dt: datetime) -> str:
+    """Return ISO week string like '2025-W03'."""
+    return f"{dt.isocalendar()[0]}-W{dt.isocalendar()[1]:02d}"
+
+
+def human_size(size_bytes: int) -> str:
+    """Convert bytes to human readable string."""
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(size_bytes) < 1024:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024
+    return f"{size_bytes:.1f} TB"
+
+
+def record_key(rec: dict) -> tuple:
+    """Return the (week, provider, project) key a record supersedes on."""
+    provider = rec.get("provider") or rec.get("source", "unknown")
+    return (rec.get("week"), provider, rec.get("project"))
+
+
+def load_history(path: Path) -> tuple[list[dict], list[str]]:
+    """Load records in file order. Returns (records, unparseable lines)."""
+    records = []
+    bad_lines = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                bad_lines.append(line.rstrip("\n"))
+    return records, bad_lines
+
+
+def merge_records(recs: list[dict], mode: str) -> dict:
+    """Collapse records sharing a key into one (recs are in file order)."""
+    latest = max(enumerate(recs), key=lambda item: (item[1].get("timestamp") or "", item[0]))[1]
+    if mode == "latest" or len(recs) == 1:
+        return latest
+
+    merged = dict(latest)
+    merged["composite"] = round(sum(r.get("composite", 0) for r in recs) / len(recs), 3)
+    merged["axes"] = {
+        axis: round(sum(r.get("axes", {}).get(axis, 0) for r in recs) / len(recs), 1)
+        for axis in AXES
+    }
+    merged["merged_from"] = len(recs)
+    return merged
+
+
+def compact(records: list[dict], mode: str, cutoff_week: str | None) -> tuple[list[dict], list[dict]]:
+    """Dedupe records per key and strip old payloads.
+
+    Returns (kept records sorted by week, archive entries for stripped payloads).
+    """
+    groups = {}
+    for rec in records:
+        groups.setdefault(record_key(rec), []).append(rec)
+
+    kept = [merge_records(recs, mode) for recs in groups.values()]
+    kept.sort(key=lambda r: (r.get("week") or "", r.get("timestamp") or ""))
+
+    archived = []
+    if cutoff_week:
+        for rec in kept:
+            week = rec.get("week")
+            if not week or week >= cutoff_week:
+                continue
+            payload = {k: rec.get(k) for k in PAYLOAD_FIELDS if rec.get(k)}
+            if not payload:
+                continue
+            week, provider, project = record_key(rec)
+            archived.append({
+                "week": week,
+                "provider": provider,
+                "project": project,
+                "timestamp": rec.get("timestamp"),
+                **payload,
+            })
+            for k in payload:
+                rec[k] = None
+    return kept, archived
+
+
+def write_atomic(path: Path, lines: list[str], expected_stat: os.stat_result):
+    """Write lines to a temp file next to path, then rename over it.
+
+    Aborts if path changed since it was read (e.g. a concurrent save_review).
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            for line in lines:
+                f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the history's own permissions
+        os.chmod(tmp_name, expected_stat.st_mode & 0o777)
+        current = path.stat()
+        if (current.st_size, current.st_mtime_ns) != (expected_stat.st_size, expected_stat.st_mtime_ns):
+            raise RuntimeError(f"{path} changed during compaction; re-run to retry")
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def append_archive(path: Path, entries: list[dict]) -> int:
+    """Append entries to the archive and fsync. Returns the size before appending."""
+    with open(path, "a") as f:
+        size = f.tell()
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    return size
+
+
+def truncate_archive(path: Path, size: int):
+    """Undo append_archive() by cutting the archive back to size."""
+    if size == 0:
+        path.unlink(missing_ok=True)
+    else:
+        os.truncate(path, size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact prompt review history")
+    parser.add_argument("--merge", choices=["latest", "mean"], default="latest",
+                        help="How to collapse duplicate records (default: latest)")
+    parser.add_argument("--retention-weeks", type=int, default=26,
+                        help="Archive improvements/strengths older than N weeks (0 = keep all)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would change without rewriting")
+    args = parser.parse_args()
+
+    if not HISTORY_FILE.exists():
+        print("No review history found.")
+        return
+
+    before_stat = HISTORY_FILE.stat()
+    records, bad_lines = load_history(HISTORY_FILE)
+
+    cutoff_week = None
+    if args.retention_weeks > 0:
+        cutoff_week = iso_week(datetime.now() - timedelta(weeks=args.retention_weeks))
+
+    kept, archived = compact(records, args.merge, cutoff_week)
+    # Unparseable lines are preserved verbatim rather than silently dropped
+    lines = [json.dumps(rec) for rec in kept] + bad_lines
+    after_size = sum(len(line.encode()) + 1 for line in lines)
+    reclaimed = before_stat.st_size - after_size
+
+    print("## History Compaction\n")
+    print(f"Records: {len(records)} -> {len(kept)} ({len(records) - len(kept)} superseded, merge: {args.merge})")
+    if cutoff_week:
+        print(f"Payloads archived: {len(archived)} (weeks before {cutoff_week})")
+    if bad_lines:
+        print(f"Unparseable lines kept: {len(bad_lines)}")
+    print(f"Size: {human_size(before_stat.st_size)} -> {human_size(after_size)}")
+    print(f"Reclaimed: {human_size(reclaimed)}")
+    print("")
+
+    if args.dry_run:
+        print("Dry run - history not rewritten.")
+        return
+
+    # Archive first so a crash never loses payloads; if the history rewrite
+    # fails, cut the archive back so a retry does not append them twice
+    archive_size = append_archive(ARCHIVE_FILE, archived) if archived else None
+    try:
+        write_atomic(HISTORY_FILE, lines, before_stat)
+    except BaseException as e:
+        if archive_size is not None:
+            truncate_archive(ARCHIVE_FILE, archive_size)
+        if not isinstance(e, RuntimeError):
+            raise
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"History rewritten: {HISTORY_FILE}")
+    if archived:
+        print(f"Archive appended: {ARCHIVE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Show where session archives use disk space and what is worth purging.
+
+Usage:
+  du_sessions.py [--provider NAME] [--top N] [--json]
+
+Options:
+  --provider NAME   Limit to one provider (claude, codex, opencode)
+  --top N           Rows per ranked section (default: 10)
+  --json            Output the full provider x week x project breakdown as JSON
+  --profile         Print per-phase timing and I/O counters as JSON on stderr
+                    (or set PROMPT_REVIEWER_PROFILE=1)
+  --profile-dump PATH  Also write cProfile stats to PATH
+
+Walks each provider tree once with os.scandir and counts allocated disk
+(st_blocks), not apparent size. Session files are bucketed by provider, ISO
+week and project, then joined with the review history so reviewed weeks show
+up as purge candidates and unreviewed weeks as backfill/archive candidates.
+Files in a provider tree that are not sessions are reported as "other".
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.profiling import PROFILER, add_profile_args, configure_profiling
+from list_weeks import iso_week, load_reviewed_weeks
+from purge_sessions import PROVIDERS, human_size, scan_opencode_sessions
+
+# Codex session_meta (first line) can embed long instructions; cwd sits near the start
+CODEX_HEADER_BYTES = 8192
+_CWD_RE = re.compile(rb'"cwd"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def disk_usage(st: os.stat_result) -> int:
+    """Allocated bytes for a stat result (falls back to size where st_blocks is missing)."""
+    blocks = getattr(st, "st_blocks", None)
+    return blocks * 512 if blocks is not None else st.st_size
+
+
+def walk_files(root: Path):
+    """Yield (DirEntry, stat) for every regular file under root, one scandir pass."""
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        with PROFILER.phase("walk"):
+            try:
+                entries = list(os.scandir(current))
+            except OSError:
+                continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    PROFILER.count("files_visited")
+                    with PROFILER.phase("stat"):
+                        st = entry.stat(follow_symlinks=False)
+                    yield entry, st
+            except OSError:
+                continue
+
+
+def codex_project(path: str) -> str:
+    """Read the cwd from a Codex session header without parsing the whole line."""
+    try:
+        with PROFILER.phase("decode"), open(path, "rb") as f:
+            head = f.read(CODEX_HEADER_BYTES)
+        PROFILER.count("bytes_read", len(head))
+    except OSError:
+        return "unknown"
+    match = _CWD_RE.search(head)
+    if not match:
+        return "unknown"
+    try:
+        return json.loads(b'"' + match.group(1) + b'"')
+    except ValueError:
+        return "unknown"
+
+
+def scan_claude(claude_dir: Path, buckets: dict, other: dict):
+    """Bucket Claude Code sessions by (provider, week, project)."""
+    projects_dir = claude_dir / "projects"
+    if not projects_dir.exists():
+        return
+    for entry, st in walk_files(projects_dir):
+        if entry.name.endswith(".jsonl") and not entry.name.startswith("agent-"):
+            # Same dir-name -> project mapping as extract_sessions.py
+            parts = Path(entry.path).relative_to(projects_dir).parts
+            project = parts[0].replace("-", "/")[1:] if len(parts) > 1 else "unknown"
+            week = iso_week(datetime.fromtimestamp(st.st_mtime))
+            _add(buckets, ("claude", week, project), st)
+        else:
+            _add(other, "claude", st)
+
+
+def scan_codex(codex_dir: Path, buckets: dict, other: dict):
+    """Bucket Codex rollouts by (provider, week, session cwd)."""
+    sessions_dir = codex_dir / "sessions"
+    if not sessions_dir.exists():
+        return
+    for entry, st in walk_files(sessions_dir):
+        if entry.name.startswith("rollout-") and entry.name.endswith(".jsonl"):
+            week = iso_week(datetime.fromtimestamp(st.st_mtime))
+            _add(buckets, ("codex", week, codex_project(entry.path)), st)
+        else:
+            _add(other, "codex", st)
+
+
+def scan_opencode(buckets: dict):
+    """Bucket OpenCode history and stored sessions (project = storage dir)."""
+    for path, dt in scan_opencode_sessions():
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        project = "all" if path.suffix == ".jsonl" else path.parent.name
+        _add(buckets, ("opencode", iso_week(dt), project), st)
+
+
+def _add(table: dict, key, st: os.stat_result):
+    files, disk = table.get(key, (0, 0))
+    table[key] = (files + 1, disk + disk_usage(st))
+
+
+def rollup(buckets: dict, key_fn) -> dict:
+    """Sum (files, disk) of buckets under a coarser key."""
+    out = {}
+    for key, (files, disk) in buckets.items():
+        k = key_fn(key)
+        f, d = out.get(k, (0, 0))
+        out[k] = (f + files, d + disk)
+    return out
+
+
+def render_report(buckets: dict, other: dict, reviewed: dict, top: int) -> str:
+    """Render the markdown disk usage report with ranked candidates."""
+    by_provider = rollup(buckets, lambda k: k[0])
+    by_week = rollup(buckets, lambda k: (k[0], k[1]))
+    by_project = rollup(buckets, lambda k: (k[0], k[2]))
+
+    def is_reviewed(provider, week):
+        return provider in reviewed.get(week, [])
+
+    total = sum(d for _, d in by_provider.values()) + sum(d for _, d in other.values())
+    lines = ["## Session Disk Usage", "", f"**Total:** {human_size(total)}", ""]
+
+    lines.append("| Provider | Session Files | Session Disk | Reviewed | Unreviewed | Other |")
+    lines.append("|----------|---------------|--------------|----------|------------|-------|")
+    for provider in sorted(set(by_provider) | set(other)):
+        files, disk = by_provider.get(provider, (0, 0))
+        done = sum(d for (p, w), (_, d) in by_week.items() if p == provider and is_reviewed(p, w))
+        lines.append(
+            f"| {provider} | {files} | {human_size(disk)} | {human_size(done)} | "
+            f"{human_size(disk - done)} | {human_size(other.get(provider, (0, 0))[1])} |"
+        )
+    lines.append("")
+
+    ranked = sorted(by_week.items(), key=lambda item: item[1][1], reverse=True)
+    purge = [(k, v) for k, v in ranked if is_reviewed(*k)][:top]
+    pending = [(k, v) for k, v in ranked if not is_reviewed(*k)][:top]
+
+    reclaimable = sum(d for k, (_, d) in by_week.items() if is_reviewed(*k))
+    lines.append(f"### Purge Candidates (reviewed, {human_size(reclaimable)} reclaimable)")
+    lines.append("")
+    if purge:
+        lines.append("| Provider | Week | Files | Disk | Command |")
+        lines.append("|----------|------|-------|------|---------|")
+        for (provider, week), (files, disk) in purge:
+            lines.append(
+                f"| {provider} | {week} | {files} | {human_size(disk)} | "
+                f"`purge_sessions.py --provider {provider} --week {week} --dry-run` |"
+            )
+        lines.append("")
+        lines.append("Clear all of them (except the current week) with `purge_sessions.py --all-reviewed --dry-run`.")
+    else:
+        lines.append("None - no reviewed week still has session files.")
+    lines.append("")
+
+    if pending:
+        lines.append("### Largest Unreviewed Weeks (backfill first, or purge with --archive)")
+        lines.append("")
+        lines.append("| Provider | Week | Files | Disk |")
+        lines.append("|----------|------|-------|------|")
+        for (provider, week), (files, disk) in pending:
+            lines.append(f"| {provider} | {week} | {files} | {human_size(disk)} |")
+        lines.append("")
+
+    lines.append("### Largest Projects")
+    lines.append("")
+    lines.append("| Provider | Project | Files | Disk |")
+    lines.append("|----------|---------|-------|------|")
+    for (provider, project), (files, disk) in sorted(by_project.items(), key=lambda i: i[1][1], reverse=True)[:top]:
+        lines.append(f"| {provider} | {project} | {files} | {human_size(disk)} |")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze session archive disk usage")
+    parser.add_argument("--provider", choices=list(PROVIDERS), help="Limit to one provider")
+    parser.add_argument("--top", type=int, default=10, help="Rows per ranked section")
+    parser.add_argument("--json", action="store_true", help="Output full breakdown as JSON")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    configure_profiling(args, "du_sessions")
+
+    home = Path.home()
+    providers = [args.provider] if args.provider else list(PROVIDERS)
+    buckets = {}
+    other = {}
+    if "claude" in providers:
+        scan_claude(home / ".claude", buckets, other)
+    if "codex" in providers:
+        scan_codex(home / ".codex", buckets, other)
+    if "opencode" in providers:
+        scan_opencode(buckets)
+
+    with PROFILER.phase("history"):
+        reviewed = load_reviewed_weeks()
+
+    if not buckets and not other:
+        print("No session data found.")
+        return
+
+    with PROFILER.phase("render"):
+        if args.json:
+            rows = [
+                {
+                    "provider": provider,
+                    "week": week,
+                    "project": project,
+                    "files": files,
+                    "disk_bytes": disk,
+                    "reviewed": provider in reviewed.get(week, []),
+                }
+                for (provider, week, project), (files, disk) in sorted(buckets.items())
+            ]
+            print(json.dumps({
+                "buckets": rows,
+                "other": {p: {"files": f, "disk_bytes": d} for p, (f, d) in sorted(other.items())},
+            }, indent=2))
+        else:
+            print(render_report(buckets, other, reviewed, args.top))
+
+
+if __name__ == "__main__":
+    main()
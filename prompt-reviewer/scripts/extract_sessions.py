@@ -12,6 +12,9 @@ Options:
   --since DATE     Start date (YYYY-MM-DD or 'today', 'yesterday', 'week', 'month')
   --until DATE     End date (YYYY-MM-DD), defaults to now
   --limit N        Max sessions to return (default: 50)
+  --profile        Print per-phase timing and I/O counters as JSON on stderr
+                   (or set PROMPT_REVIEWER_PROFILE=1)
+  --profile-dump PATH  Also write cProfile stats to PATH
 
 Output: JSON with session metadata and user prompts.
 
@@ -26,6 +29,11 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.daemon import file_cached, find_files, forward_to_daemon, subdirectories
+from lib.profiling import PROFILER, add_profile_args, configure_profiling
+
 
 def parse_date(date_str: str) -> datetime:
     """Parse date string into datetime."""
@@ -48,16 +56,21 @@ def project_path_to_dir_name(project_path: str) -> str:
     return project_path.replace("/", "-")
 
 
+@file_cached
 def extract_claude_messages(jsonl_path: Path) -> list[dict]:
     """Extract user messages from a Claude Code session file."""
     messages = []
+    nbytes = decoded = skipped = 0
     try:
         with open(jsonl_path, "r") as f:
+            nbytes = os.fstat(f.fileno()).st_size
             for line in f:
                 if not line.strip():
+                    skipped += 1
                     continue
                 try:
                     entry = json.loads(line)
+                    decoded += 1
                     # User messages have type="user" and contain the actual user content
                     if entry.get("type") == "user" and not entry.get("isMeta"):
                         msg = entry.get("message", {})
@@ -80,24 +93,38 @@ def extract_claude_messages(jsonl_path: Path) -> list[dict]:
                                 "content": content[:2000],
                             })
                 except json.JSONDecodeError:
+                    skipped += 1
                     continue
     except Exception as e:
         print(f"Error reading {jsonl_path}: {e}", file=sys.stderr)
+    _count_read(nbytes, decoded, skipped)
     return messages
 
 
+def _count_read(nbytes: int, decoded: int, skipped: int):
+    """Record one file's read counters with the profiler."""
+    PROFILER.count("bytes_read", nbytes)
+    PROFILER.count("lines_decoded", decoded)
+    PROFILER.count("lines_skipped", skipped)
+
+
+@file_cached
 def extract_codex_messages(jsonl_path: Path) -> list[dict]:
     """Extract user messages from a Codex session file."""
     messages = []
     seen_content = set()  # Deduplicate messages
     session_timestamp = None  # Capture from session metadata
+    nbytes = decoded = skipped = 0
     try:
         with open(jsonl_path, "r") as f:
+            nbytes = os.fstat(f.fileno()).st_size
             for line in f:
                 if not line.strip():
+                    skipped += 1
                     continue
                 try:
                     entry = json.loads(line)
+                    decoded += 1
                     content = None
                     timestamp = entry.get("timestamp", session_timestamp)
 
@@ -145,9 +172,11 @@ def extract_codex_messages(jsonl_path: Path) -> list[dict]:
                         })
 
                 except json.JSONDecodeError:
+                    skipped += 1
                     continue
     except Exception as e:
         print(f"Error reading {jsonl_path}: {e}", file=sys.stderr)
+    _count_read(nbytes, decoded, skipped)
     return messages
 
 
@@ -164,9 +193,10 @@ def find_claude_sessions(
 
     sessions = []
 
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
+    with PROFILER.phase("walk"):
+        project_dirs = subdirectories(projects_dir)
+
+    for project_dir in project_dirs:
 
         # Apply project filter
         if project_filter:
@@ -175,15 +205,21 @@ def find_claude_sessions(
                 continue
 
         # Find session files (UUID.jsonl)
-        for session_file in project_dir.glob("*.jsonl"):
+        with PROFILER.phase("walk"):
+            session_files = find_files(project_dir, "*.jsonl", recursive=False)
+
+        for session_file in session_files:
             if session_file.name.startswith("agent-"):
                 continue
+            PROFILER.count("files_visited")
 
-            mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
+            with PROFILER.phase("stat"):
+                mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
             if mtime < since or mtime > until:
                 continue
 
-            user_messages = extract_claude_messages(session_file)
+            with PROFILER.phase("decode"):
+                user_messages = extract_claude_messages(session_file)
             if not user_messages:
                 continue
 
@@ -201,6 +237,22 @@ def find_claude_sessions(
     return sessions
 
 
+@file_cached
+def codex_session_project(jsonl_path: Path) -> str:
+    """Return the cwd recorded in a Codex session_meta first line, or 'unknown'."""
+    try:
+        with open(jsonl_path, "r") as f:
+            first_line = f.readline()
+            PROFILER.count("bytes_read", len(first_line))
+            if first_line:
+                meta = json.loads(first_line)
+                if meta.get("type") == "session_meta":
+                    return meta.get("payload", {}).get("cwd", "unknown")
+    except Exception:
+        pass
+    return "unknown"
+
+
 def find_codex_sessions(
     codex_dir: Path,
     since: datetime,
@@ -214,30 +266,27 @@ def find_codex_sessions(
     sessions = []
 
     # Codex stores by year/month/day
-    for session_file in sessions_dir.rglob("*.jsonl"):
+    with PROFILER.phase("walk"):
+        session_files = find_files(sessions_dir, "*.jsonl")
+
+    for session_file in session_files:
         # Skip non-rollout files
         if not session_file.name.startswith("rollout-"):
             continue
+        PROFILER.count("files_visited")
 
-        mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
+        with PROFILER.phase("stat"):
+            mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
         if mtime < since or mtime > until:
             continue
 
-        user_messages = extract_codex_messages(session_file)
+        with PROFILER.phase("decode"):
+            user_messages = extract_codex_messages(session_file)
         if not user_messages:
             continue
 
-        # Extract project from session metadata
-        project = "unknown"
-        try:
-            with open(session_file, "r") as f:
-                first_line = f.readline()
-                if first_line:
-                    meta = json.loads(first_line)
-                    if meta.get("type") == "session_meta":
-                        project = meta.get("payload", {}).get("cwd", "unknown")
-        except Exception:
-            pass
+        with PROFILER.phase("decode"):
+            project = codex_session_project(session_file)
 
         session_timestamp = user_messages[0].get("timestamp", mtime.isoformat())
 
@@ -253,6 +302,7 @@ def find_codex_sessions(
     return sessions
 
 
+@file_cached
 def extract_opencode_messages(jsonl_path: Path) -> list[dict]:
     """Extract user messages from OpenCode prompt history file.
 
@@ -260,13 +310,17 @@ def extract_opencode_messages(jsonl_path: Path) -> list[dict]:
     Format: {"input": "...", "parts": [...]}
     """
     messages = []
+    nbytes = decoded = skipped = 0
     try:
         with open(jsonl_path, "r") as f:
+            nbytes = os.fstat(f.fileno()).st_size
             for line in f:
                 if not line.strip():
+                    skipped += 1
                     continue
                 try:
                     entry = json.loads(line)
+                    decoded += 1
                     content = entry.get("input", "")
 
                     # Skip empty prompts
@@ -292,9 +346,11 @@ def extract_opencode_messages(jsonl_path: Path) -> list[dict]:
                         "content": full_content[:2000],
                     })
                 except json.JSONDecodeError:
+                    skipped += 1
                     continue
     except Exception as e:
         print(f"Error reading {jsonl_path}: {e}", file=sys.stderr)
+    _count_read(nbytes, decoded, skipped)
     return messages
 
 
@@ -312,12 +368,15 @@ def find_opencode_sessions(
     history_file = opencode_state_dir / "prompt-history.jsonl"
     if not history_file.exists():
         return []
+    PROFILER.count("files_visited")
 
-    mtime = datetime.fromtimestamp(history_file.stat().st_mtime)
+    with PROFILER.phase("stat"):
+        mtime = datetime.fromtimestamp(history_file.stat().st_mtime)
     if mtime < since or mtime > until:
         return []
 
-    user_messages = extract_opencode_messages(history_file)
+    with PROFILER.phase("decode"):
+        user_messages = extract_opencode_messages(history_file)
     if not user_messages:
         return []
 
@@ -333,6 +392,8 @@ def find_opencode_sessions(
 
 
 def main():
+    forward_to_daemon("extract_sessions")
+
     parser = argparse.ArgumentParser(description="Extract sessions for prompt review analysis")
     parser.add_argument("--source", choices=["claude", "codex", "opencode", "both", "all"], default="both",
                         help="Which tool to analyze (both=claude+codex, all=claude+codex+opencode)")
@@ -341,7 +402,9 @@ def main():
                         help="Start date (YYYY-MM-DD or today/yesterday/week/month)")
     parser.add_argument("--until", help="End date (YYYY-MM-DD)")
     parser.add_argument("--limit", type=int, default=50, help="Max sessions to return")
+    add_profile_args(parser)
     args = parser.parse_args()
+    configure_profiling(args, "extract_sessions")
 
     home = Path.home()
     claude_dir = home / ".claude"
@@ -363,8 +426,9 @@ def main():
         sessions.extend(find_opencode_sessions(opencode_state_dir, since, until))
 
     # Sort by timestamp (newest first) and limit
-    sessions.sort(key=lambda s: s["timestamp"] or "", reverse=True)
-    sessions = sessions[:args.limit]
+    with PROFILER.phase("sort"):
+        sessions.sort(key=lambda s: s["timestamp"] or "", reverse=True)
+        sessions = sessions[:args.limit]
 
     result = {
         "query": {
@@ -382,7 +446,8 @@ def main():
         "sessions": sessions,
     }
 
-    print(json.dumps(result, indent=2))
+    with PROFILER.phase("render"):
+        print(json.dumps(result, indent=2))
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+# Prompt reviewer shared library
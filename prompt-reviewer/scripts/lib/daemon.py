@@ -0,0 +1,254 @@
+"""
+Client side and hot caches for the optional prompt-reviewer daemon.
+
+Scripts call forward_to_daemon() first thing in main(). When review_daemon.py
+is listening on the Unix socket, the command runs inside the daemon and its
+output is replayed here; otherwise the script carries on in-process.
+
+Inside the daemon is_hot() is true and three caches stay warm between requests:
+  - find_files() and subdirectories() keep every session directory's
+    listing and only re-list a directory whose mtime changed, so a warm
+    lookup costs one stat per directory instead of a full walk
+  - file_cached functions keep per-file parse results keyed on
+    (mtime_ns, size), so unchanged session files are never re-read
+  - history_records() keeps the parsed history and only reads bytes
+    appended since the last call (a replaced file is reloaded)
+
+Set PROMPT_REVIEWER_NO_DAEMON=1 to always run in-process.
+"""
+
+import functools
+import json
+import os
+import socket
+import sys
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+SOCKET_PATH = Path(os.environ.get(
+    "PROMPT_REVIEWER_SOCKET",
+    Path.home() / ".claude" / "prompt-reviewer.sock",
+))
+
+CONNECT_TIMEOUT = 0.5
+REQUEST_TIMEOUT = 600
+
+# A directory modified this recently may change again within the same
+# mtime tick, so its listing is not kept
+RACY_NS = 2 * 10**9
+
+_hot = False
+_file_cache = {}
+_history = {}
+_listings = {}
+
+
+def is_hot():
+    """True when running inside the daemon."""
+    return _hot
+
+
+def set_hot(value=True):
+    """Mark this process as the daemon (enables the caches)."""
+    global _hot
+    _hot = value
+
+
+# --- Client ---------------------------------------------------------------
+
+def request(payload, timeout=REQUEST_TIMEOUT):
+    """Send one JSON request to the daemon. Returns the response dict or None."""
+    if not SOCKET_PATH.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(SOCKET_PATH))
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+
+
+def forward_to_daemon(command, argv=None):
+    """Run command in the daemon if one is up; exits with its status.
+
+    Returns without doing anything when already inside the daemon, when
+    PROMPT_REVIEWER_NO_DAEMON is set, when profiling is requested (the
+    profile must describe this process), or when the daemon is unreachable.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if _hot or os.environ.get("PROMPT_REVIEWER_NO_DAEMON"):
+        return
+    if os.environ.get("PROMPT_REVIEWER_PROFILE") or any(a.startswith("--profile") for a in argv):
+        return
+
+    response = request({
+        "command": command,
+        "argv": argv,
+        "home": str(Path.home()),
+        "cwd": os.getcwd(),
+    })
+    if not response or "exit" not in response:
+        return
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    sys.exit(response["exit"])
+
+
+# --- Hot caches -----------------------------------------------------------
+
+def file_cached(fn):
+    """Memoize fn(path, ...) on the file's (mtime_ns, size) while hot.
+
+    Outside the daemon the wrapper is a pass-through with no extra stat.
+    Cached results are shared, so callers must not mutate them.
+    """
+    @functools.wraps(fn)
+    def wrapper(path, *args, **kwargs):
+        if not _hot:
+            return fn(path, *args, **kwargs)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return fn(path, *args, **kwargs)
+        key = (fn.__module__, fn.__qualname__, str(path), args, tuple(sorted(kwargs.items())))
+        sig = (st.st_mtime_ns, st.st_size)
+        hit = _file_cache.get(key)
+        if hit and hit[0] == sig:
+            return hit[1]
+        result = fn(path, *args, **kwargs)
+        _file_cache[key] = (sig, result)
+        return result
+
+    return wrapper
+
+
+def find_files(root, pattern, recursive=True):
+    """Return the files under root whose name matches pattern.
+
+    Like Path.rglob(pattern) (Path.glob with recursive=False), which is what
+    runs outside the daemon. Inside it the listings come from the in-memory
+    directory index.
+    """
+    root = Path(root)
+    if not _hot:
+        return list(root.rglob(pattern) if recursive else root.glob(pattern))
+    found = []
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        files, subdirs = _listing(directory)
+        found.extend(Path(directory, name) for name in files if fnmatchcase(name, pattern))
+        if recursive:
+            stack.extend(os.path.join(directory, name) for name in reversed(subdirs))
+    return found
+
+
+def subdirectories(root):
+    """Return root's subdirectories (from the directory index while hot)."""
+    root = Path(root)
+    if not _hot:
+        return [d for d in root.iterdir() if d.is_dir()]
+    return [root / name for name in _listing(str(root))[1]]
+
+
+def _listing(directory):
+    """Return (file names, subdirectory names) of directory, re-listing on mtime change."""
+    try:
+        st = os.stat(directory)
+    except OSError:
+        _listings.pop(directory, None)
+        return [], []
+    hit = _listings.get(directory)
+    if hit and hit[0] == st.st_mtime_ns:
+        return hit[1], hit[2]
+
+    files, subdirs = [], []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    (subdirs if entry.is_dir() else files).append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        _listings.pop(directory, None)
+        return [], []
+    files.sort()
+    subdirs.sort()
+    if time.time_ns() - st.st_mtime_ns > RACY_NS:
+        _listings[directory] = (st.st_mtime_ns, files, subdirs)
+    else:
+        _listings.pop(directory, None)
+    return files, subdirs
+
+
+def history_records(path):
+    """Return all parsed records of a JSONL history file, reading incrementally.
+
+    Only bytes appended since the previous call are parsed. A different
+    inode or a shrunken file (e.g. after compact_history.py) forces a reload.
+    Returns the cached list; callers must not mutate it.
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+    except OSError:
+        _history.pop(str(path), None)
+        return []
+
+    state = _history.get(str(path))
+    if state is None or state["ino"] != st.st_ino or st.st_size < state["offset"]:
+        state = {"ino": st.st_ino, "offset": 0, "records": []}
+        _history[str(path)] = state
+
+    if st.st_size > state["offset"]:
+        with open(path, "rb") as f:
+            f.seek(state["offset"])
+            data = f.read(st.st_size - state["offset"])
+        # Leave a trailing partial line for the next call
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                state["records"].append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+        state["offset"] += end
+
+    return state["records"]
+
+
+def prune_caches():
+    """Drop cached entries for files that no longer exist. Returns count dropped."""
+    dropped = 0
+    for key in list(_file_cache):
+        if not os.path.exists(key[2]):
+            del _file_cache[key]
+            dropped += 1
+    for key in list(_history):
+        if not os.path.exists(key):
+            del _history[key]
+            dropped += 1
+    for key in list(_listings):
+        if not os.path.isdir(key):
+            del _listings[key]
+            dropped += 1
+    return dropped
+
+
+def cache_stats():
+    """Return cache sizes for status output."""
+    return {
+        "cached_files": len(_file_cache),
+        "indexed_dirs": len(_listings),
+        "history_records": sum(len(s["records"]) for s in _history.values()),
+    }
@@ -0,0 +1,122 @@
+"""
+Per-phase timing and I/O counters for prompt-reviewer scripts.
+
+Enable with --profile or PROMPT_REVIEWER_PROFILE=1. On exit a JSON block is
+written to stderr with wall time per phase, files visited, bytes read, lines
+decoded vs skipped, and peak RSS. --profile-dump PATH (or
+PROMPT_REVIEWER_PROFILE_DUMP=PATH) also writes a cProfile stats file.
+
+Phase times are inclusive and accumulate across repeated entries, so a phase
+entered once per file reports the total for all files.
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+COUNTERS = ("files_visited", "bytes_read", "lines_decoded", "lines_skipped")
+
+
+class Profiler:
+    """Collects phase timings and counters; a no-op until enabled."""
+
+    def __init__(self):
+        self.enabled = False
+        self.script = None
+        self.started = None
+        self.phases = {}
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self._cprofile = None
+        self._dump_path = None
+
+    def enable(self, script, dump_path=None):
+        """Start collecting. Registers the stderr report to run at exit."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.script = script
+        self.started = time.perf_counter()
+        if dump_path:
+            import cProfile
+            self._dump_path = dump_path
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        atexit.register(self.report)
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block under a phase name."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+            entry["seconds"] += time.perf_counter() - start
+            entry["calls"] += 1
+
+    def count(self, counter, n=1):
+        """Add n to a counter."""
+        if self.enabled:
+            self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def snapshot(self):
+        """Return the current profile as a dict."""
+        return {
+            "script": self.script,
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "phases": {
+                name: {"seconds": round(p["seconds"], 6), "calls": p["calls"]}
+                for name, p in self.phases.items()
+            },
+            "counters": dict(self.counters),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "cprofile_dump": self._dump_path,
+        }
+
+    def report(self):
+        """Write the profile JSON block to stderr and the cProfile dump if requested."""
+        if not self.enabled:
+            return
+        if self._cprofile:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self._dump_path)
+        print(json.dumps({"profile": self.snapshot()}, indent=2), file=sys.stderr)
+
+
+def peak_rss_bytes():
+    """Return peak resident set size of this process in bytes, or None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+PROFILER = Profiler()
+
+
+def add_profile_args(parser):
+    """Add --profile and --profile-dump to an argparse parser."""
+    parser.add_argument("--profile", action="store_true",
+                        help="Print per-phase timing and I/O counters as JSON on stderr")
+    parser.add_argument("--profile-dump", metavar="PATH", default=None,
+                        help="Also write cProfile stats to PATH")
+
+
+def configure_profiling(args, script):
+    """Enable PROFILER from parsed args or the PROMPT_REVIEWER_PROFILE env vars."""
+    env = os.environ.get("PROMPT_REVIEWER_PROFILE", "").lower()
+    dump_path = getattr(args, "profile_dump", None) or os.environ.get("PROMPT_REVIEWER_PROFILE_DUMP")
+    if getattr(args, "profile", False) or env not in ("", "0", "false", "no") or dump_path:
+        PROFILER.enable(script, dump_path=dump_path)
@@ -8,6 +8,9 @@ Usage:
 Options:
   --provider NAME   Filter to specific provider (claude, codex, opencode)
   --prompt          Output full backfill prompt for next unreviewed week
+  --profile         Print per-phase timing and I/O counters as JSON on stderr
+                    (or set PROMPT_REVIEWER_PROFILE=1)
+  --profile-dump PATH  Also write cProfile stats to PATH
 
 Shows:
   - All weeks with session data (Claude, Codex, OpenCode)
@@ -19,10 +22,17 @@ Output is a markdown table ready for copy/paste or piping.
 
 import argparse
 import json
+import os
+import sys
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.daemon import file_cached, find_files, forward_to_daemon, history_records, is_hot
+from lib.profiling import PROFILER, add_profile_args, configure_profiling
+
 HISTORY_FILE = Path.home() / ".claude" / "prompt-review-history.jsonl"
 
 
@@ -31,21 +41,30 @@ def iso_week(dt: datetime) -> str:
     return f"{dt.isocalendar()[0]}-W{dt.isocalendar()[1]:02d}"
 
 
+@file_cached
 def has_user_messages(jsonl_path: Path) -> bool:
     """Check if a Claude session file contains any user messages."""
+    decoded = skipped = 0
     try:
-        with open(jsonl_path, "r") as f:
+        with open(jsonl_path, "rb") as f:
             for line in f:
+                PROFILER.count("bytes_read", len(line))
                 if not line.strip():
+                    skipped += 1
                     continue
                 try:
                     entry = json.loads(line)
+                    decoded += 1
                     if entry.get("type") == "user":
                         return True
-                except json.JSONDecodeError:
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    skipped += 1
                     continue
     except Exception:
         pass
+    finally:
+        PROFILER.count("lines_decoded", decoded)
+        PROFILER.count("lines_skipped", skipped)
     return False
 
 
@@ -60,14 +79,20 @@ def scan_claude_weeks(claude_dir: Path) -> dict[str, int]:
     if not projects_dir.exists():
         return weeks
 
-    for session_file in projects_dir.rglob("*.jsonl"):
+    with PROFILER.phase("walk"):
+        session_files = find_files(projects_dir, "*.jsonl")
+
+    for session_file in session_files:
         if session_file.name.startswith("agent-"):
             continue
+        PROFILER.count("files_visited")
         try:
             # Only count if file has actual user messages
-            if not has_user_messages(session_file):
-                continue
-            mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
+            with PROFILER.phase("decode"):
+                if not has_user_messages(session_file):
+                    continue
+            with PROFILER.phase("stat"):
+                mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
             weeks[iso_week(mtime)] += 1
         except Exception:
             continue
@@ -81,9 +106,14 @@ def scan_codex_weeks(codex_dir: Path) -> dict[str, int]:
     if not sessions_dir.exists():
         return weeks
 
-    for session_file in sessions_dir.rglob("rollout-*.jsonl"):
+    with PROFILER.phase("walk"):
+        session_files = find_files(sessions_dir, "rollout-*.jsonl")
+
+    for session_file in session_files:
+        PROFILER.count("files_visited")
         try:
-            mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
+            with PROFILER.phase("stat"):
+                mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
             weeks[iso_week(mtime)] += 1
         except Exception:
             continue
@@ -102,21 +132,28 @@ def scan_opencode_weeks(opencode_state_dir: Path) -> dict[str, int]:
     if not history_file.exists():
         return weeks
 
+    PROFILER.count("files_visited")
     try:
-        mtime = datetime.fromtimestamp(history_file.stat().st_mtime)
+        with PROFILER.phase("stat"):
+            mtime = datetime.fromtimestamp(history_file.stat().st_mtime)
         week = iso_week(mtime)
 
         # Count prompts in the file
         prompt_count = 0
-        with open(history_file) as f:
+        with PROFILER.phase("decode"), open(history_file) as f:
+            PROFILER.count("bytes_read", os.fstat(f.fileno()).st_size)
             for line in f:
                 if line.strip():
                     try:
                         entry = json.loads(line)
+                        PROFILER.count("lines_decoded")
                         if entry.get("input", "").strip():
                             prompt_count += 1
                     except json.JSONDecodeError:
+                        PROFILER.count("lines_skipped")
                         continue
+                else:
+                    PROFILER.count("lines_skipped")
 
         if prompt_count > 0:
             weeks[week] = prompt_count
@@ -132,20 +169,29 @@ def load_reviewed_weeks(provider_filter: str | None = None) -> dict[str, list[st
     if not HISTORY_FILE.exists():
         return reviewed
 
+    for rec in _iter_history():
+        week = rec.get("week")
+        provider = rec.get("provider") or rec.get("source", "unknown")
+        if week:
+            if provider_filter is None or provider == provider_filter:
+                reviewed[week].append(provider)
+    return dict(reviewed)
+
+
+def _iter_history():
+    """Yield parsed history records (from the daemon's hot index when available)."""
+    if is_hot():
+        yield from history_records(HISTORY_FILE)
+        return
     with open(HISTORY_FILE) as f:
+        PROFILER.count("bytes_read", os.fstat(f.fileno()).st_size)
         for line in f:
             if not line.strip():
                 continue
             try:
-                rec = json.loads(line)
-                week = rec.get("week")
-                provider = rec.get("provider") or rec.get("source", "unknown")
-                if week:
-                    if provider_filter is None or provider == provider_filter:
-                        reviewed[week].append(provider)
+                yield json.loads(line)
             except json.JSONDecodeError:
                 continue
-    return dict(reviewed)
 
 
 def week_to_dates(week_str: str) -> tuple[str, str]:
@@ -228,10 +274,10 @@ python3 ~/.claude/skills/prompt-reviewer/scripts/purge_sessions.py \\
   --provider {provider} --week {week} --dry-run
 ```
 
-Then if they confirm, run without --dry-run:
+The dry run writes a plan file. Then if they confirm, apply exactly that plan:
 ```bash
 python3 ~/.claude/skills/prompt-reviewer/scripts/purge_sessions.py \\
-  --provider {provider} --week {week}
+  --apply ~/.claude/purge-plans/{provider}-{week}.json
 ```
 
 NEVER delete without asking first. The user may want to keep the raw sessions.
@@ -239,11 +285,15 @@ NEVER delete without asking first. The user may want to keep the raw sessions.
 
 
 def main():
+    forward_to_daemon("list_weeks")
+
     parser = argparse.ArgumentParser(description="List available session weeks")
     parser.add_argument("--provider", help="Filter to specific provider")
     parser.add_argument("--prompt", action="store_true",
                         help="Output full backfill prompt for next unreviewed week")
+    add_profile_args(parser)
     args = parser.parse_args()
+    configure_profiling(args, "list_weeks")
 
     home = Path.home()
 
@@ -253,7 +303,8 @@ def main():
     opencode_weeks = scan_opencode_weeks(home / ".local" / "state" / "opencode")
 
     # Load reviewed weeks
-    reviewed = load_reviewed_weeks(args.provider)
+    with PROFILER.phase("history"):
+        reviewed = load_reviewed_weeks(args.provider)
 
     # Combine all weeks
     all_weeks = set(claude_weeks.keys()) | set(codex_weeks.keys()) | set(opencode_weeks.keys())
@@ -3,21 +3,72 @@
 Delete session files for a specific week after they've been reviewed.
 
 Usage:
-  purge_sessions.py --provider codex --week 2025-W36 [--dry-run]
+  purge_sessions.py --provider codex --week 2025-W36 --dry-run [--plan PATH]
+  purge_sessions.py --all-reviewed [--older-than N] [--provider NAME] --dry-run
+  purge_sessions.py --apply PLAN [--workers N]
 
 Options:
   --provider NAME   Provider to purge (claude, codex, opencode)
   --week YYYY-WNN   Week to purge (e.g., 2025-W36)
-  --dry-run         Show what would be deleted without deleting
+  --dry-run         Show what would be deleted and write a plan file
+  --plan PATH       Where --dry-run writes the plan
+                    (default: ~/.claude/purge-plans/{provider}-{week}.json)
+  --apply PLAN      Delete exactly the files in PLAN; files whose inode, size or
+                    mtime changed since the dry run are skipped
+  --workers N       Threads used for unlinking (default: 8)
+  --all-reviewed    Purge every (provider, week) recorded in the review history,
+                    using one scan per provider tree (plan: all-reviewed.json)
+  --older-than N    With --all-reviewed, only weeks before the week N weeks ago;
+                    the default 0 still skips the current week
+  --archive DIR     Before unlinking, stream the files into DIR/{provider}-{week}.zip
+                    and verify it; originals are only deleted once verified
+  --profile         Print per-phase timing and I/O counters as JSON on stderr
+                    (or set PROMPT_REVIEWER_PROFILE=1)
+  --profile-dump PATH  Also write cProfile stats to PATH
 
-ALWAYS use --dry-run first to preview what will be deleted.
+ALWAYS use --dry-run first to preview what will be deleted, then --apply the
+plan it wrote so only the files the user saw are removed.
+
+Archives are ordinary zip files with per-member compression, so they can be
+listed and single sessions read without unpacking the rest:
+  python3 -m zipfile -l ARCHIVE
+  unzip -p ARCHIVE .codex/sessions/2025/09/01/rollout-....jsonl
+Member names are paths relative to ~, and __index__.json records each
+member's original path, size, mtime and SHA-256.
 """
 
 import argparse
+import hashlib
 import json
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.profiling import PROFILER, add_profile_args, configure_profiling
+from list_weeks import iso_week, load_reviewed_weeks
+
+PROVIDERS = ("claude", "codex", "opencode")
+
+PLAN_DIR = Path.home() / ".claude" / "purge-plans"
+PLAN_VERSION = 1
+
+UNLINK_WORKERS = 8
+UNLINK_BATCH = 256
+
+# OpenCode session JSON: read this much to find time.created before a full parse
+OPENCODE_HEADER_BYTES = 4096
+OPENCODE_INDEX = Path.home() / ".claude" / "opencode-created-index.json"
+_CREATED_RE = re.compile(rb'"time"\s*:\s*\{[^{}]*?"created"\s*:\s*(\d+(?:\.\d+)?)')
+
+ARCHIVE_INDEX = "__index__.json"
+ARCHIVE_CHUNK = 1024 * 1024
+
 
 def week_to_date_range(week_str: str) -> tuple[datetime, datetime]:
     """Convert ISO week string to start/end datetimes."""
@@ -32,48 +83,157 @@ def week_to_date_range(week_str: str) -> tuple[datetime, datetime]:
     return start_date, end_date
 
 
-def find_claude_sessions(claude_dir: Path, start: datetime, end: datetime) -> list[Path]:
-    """Find Claude Code sessions in date range."""
+def scan_claude_sessions(claude_dir: Path) -> list[tuple[Path, datetime]]:
+    """Walk Claude Code sessions once, returning (path, mtime) pairs."""
     sessions = []
     projects_dir = claude_dir / "projects"
     if not projects_dir.exists():
         return sessions
 
-    for session_file in projects_dir.rglob("*.jsonl"):
+    with PROFILER.phase("walk"):
+        session_files = list(projects_dir.rglob("*.jsonl"))
+
+    for session_file in session_files:
         if session_file.name.startswith("agent-"):
             continue
+        PROFILER.count("files_visited")
         try:
-            mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
-            if start <= mtime < end:
-                sessions.append(session_file)
+            with PROFILER.phase("stat"):
+                mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
+            sessions.append((session_file, mtime))
         except Exception:
             continue
     return sessions
 
 
-def find_codex_sessions(codex_dir: Path, start: datetime, end: datetime) -> list[Path]:
-    """Find Codex sessions in date range."""
+def scan_codex_sessions(codex_dir: Path) -> list[tuple[Path, datetime]]:
+    """Walk Codex sessions once, returning (path, mtime) pairs."""
     sessions = []
     sessions_dir = codex_dir / "sessions"
     if not sessions_dir.exists():
         return sessions
 
-    for session_file in sessions_dir.rglob("rollout-*.jsonl"):
+    with PROFILER.phase("walk"):
+        session_files = list(sessions_dir.rglob("rollout-*.jsonl"))
+
+    for session_file in session_files:
+        PROFILER.count("files_visited")
         try:
-            mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
-            if start <= mtime < end:
-                sessions.append(session_file)
+            with PROFILER.phase("stat"):
+                mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
+            sessions.append((session_file, mtime))
         except Exception:
             continue
     return sessions
 
 
-def find_opencode_sessions(start: datetime, end: datetime) -> list[Path]:
-    """Find OpenCode prompt history if modified in date range.
+def read_opencode_created(path: str) -> float | None:
+    """Return time.created (ms) from an OpenCode session JSON.
+
+    Only a bounded prefix is read when time.created appears in it, which is
+    the normal layout; otherwise the rest is read and parsed in full.
+    """
+    with open(path, "rb") as f:
+        head = f.read(OPENCODE_HEADER_BYTES)
+        PROFILER.count("bytes_read", len(head))
+        match = _CREATED_RE.search(head)
+        if match:
+            return float(match.group(1))
+        rest = f.read()
+    PROFILER.count("bytes_read", len(rest))
+    data = json.loads(head + rest)
+    PROFILER.count("lines_decoded")
+    return data.get("time", {}).get("created")
+
+
+def load_opencode_index() -> dict:
+    """Load the cached {path: [ino, mtime_ns, created_ms]} index."""
+    try:
+        return json.loads(OPENCODE_INDEX.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_opencode_index(index: dict):
+    """Write the created-time index atomically."""
+    try:
+        OPENCODE_INDEX.parent.mkdir(parents=True, exist_ok=True)
+        tmp = OPENCODE_INDEX.with_name(OPENCODE_INDEX.name + ".tmp")
+        tmp.write_text(json.dumps(index, separators=(",", ":")))
+        os.replace(tmp, OPENCODE_INDEX)
+    except OSError:
+        pass
+
+
+def scan_opencode_storage(storage_dir: Path, since: datetime | None = None) -> list[tuple[Path, datetime]]:
+    """Return (path, created) for OpenCode session JSON files.
+
+    Created times come from the cached index when a file's inode and mtime
+    are unchanged, otherwise from a header-only read. With since, files in
+    directories whose mtime predates it are never opened: a session file is
+    created in its directory, so the directory mtime bounds time.created.
+    """
+    index = load_opencode_index()
+    changed = False
+    since_ts = since.timestamp() if since else None
+    sessions = []
+    seen = set()
+    listed_dirs = set()
+
+    stack = [str(storage_dir)]
+    while stack:
+        current = stack.pop()
+        with PROFILER.phase("walk"):
+            try:
+                entries = list(os.scandir(current))
+                dir_mtime = os.stat(current).st_mtime
+            except OSError:
+                continue
+        # Subdirectories still need walking; only this directory's files are pruned
+        prune_files = since_ts is not None and dir_mtime < since_ts
+        if not prune_files:
+            listed_dirs.add(current)
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+                continue
+            if prune_files or not entry.name.endswith(".json"):
+                continue
+            PROFILER.count("files_visited")
+            try:
+                with PROFILER.phase("stat"):
+                    st = entry.stat()
+                cached = index.get(entry.path)
+                if cached and cached[0] == st.st_ino and cached[1] == st.st_mtime_ns:
+                    created = cached[2]
+                else:
+                    with PROFILER.phase("decode"):
+                        created = read_opencode_created(entry.path)
+                    index[entry.path] = [st.st_ino, st.st_mtime_ns, created]
+                    changed = True
+            except (OSError, ValueError):
+                continue
+            seen.add(entry.path)
+            if created:
+                sessions.append((Path(entry.path), datetime.fromtimestamp(created / 1000)))
+
+    # Forget files that disappeared from directories we listed
+    for path in list(index):
+        if path not in seen and os.path.dirname(path) in listed_dirs:
+            del index[path]
+            changed = True
+    if changed:
+        save_opencode_index(index)
+    return sessions
+
+
+def scan_opencode_sessions(since: datetime | None = None) -> list[tuple[Path, datetime]]:
+    """Collect OpenCode files with the time each one belongs to.
 
     OpenCode stores prompts in ~/.local/state/opencode/prompt-history.jsonl
-    This is a single file with all prompts (no timestamps per-prompt).
-    We use file mtime to determine if it falls in the date range.
+    This is a single file with all prompts (no timestamps per-prompt), so
+    its mtime is used. Session storage files carry time.created.
     """
     sessions = []
     home = Path.home()
@@ -81,31 +241,61 @@ def find_opencode_sessions(start: datetime, end: datetime) -> list[Path]:
     # Primary location: ~/.local/state/opencode/prompt-history.jsonl
     history_file = home / ".local" / "state" / "opencode" / "prompt-history.jsonl"
     if history_file.exists():
+        PROFILER.count("files_visited")
         try:
-            mtime = datetime.fromtimestamp(history_file.stat().st_mtime)
-            if start <= mtime < end:
-                sessions.append(history_file)
+            with PROFILER.phase("stat"):
+                mtime = datetime.fromtimestamp(history_file.stat().st_mtime)
+            sessions.append((history_file, mtime))
         except Exception:
             pass
 
     # Also check session storage in ~/.local/share/opencode/storage/session/
     storage_dir = home / ".local" / "share" / "opencode" / "storage" / "session"
     if storage_dir.exists():
-        for session_file in storage_dir.rglob("*.json"):
-            try:
-                with open(session_file) as f:
-                    data = json.load(f)
-                created = data.get("time", {}).get("created")
-                if created:
-                    dt = datetime.fromtimestamp(created / 1000)
-                    if start <= dt < end:
-                        sessions.append(session_file)
-            except Exception:
-                continue
+        sessions.extend(scan_opencode_storage(storage_dir, since))
 
     return sessions
 
 
+def scan_provider(provider: str) -> list[tuple[Path, datetime]]:
+    """Single scan of a provider's session tree."""
+    home = Path.home()
+    if provider == "claude":
+        return scan_claude_sessions(home / ".claude")
+    if provider == "codex":
+        return scan_codex_sessions(home / ".codex")
+    if provider == "opencode":
+        return scan_opencode_sessions()
+    return []
+
+
+def _in_range(scanned: list[tuple[Path, datetime]], start: datetime, end: datetime) -> list[Path]:
+    return [path for path, dt in scanned if start <= dt < end]
+
+
+def find_claude_sessions(claude_dir: Path, start: datetime, end: datetime) -> list[Path]:
+    """Find Claude Code sessions in date range."""
+    return _in_range(scan_claude_sessions(claude_dir), start, end)
+
+
+def find_codex_sessions(codex_dir: Path, start: datetime, end: datetime) -> list[Path]:
+    """Find Codex sessions in date range."""
+    return _in_range(scan_codex_sessions(codex_dir), start, end)
+
+
+def find_opencode_sessions(start: datetime, end: datetime) -> list[Path]:
+    """Find OpenCode prompt history and stored sessions in date range."""
+    return _in_range(scan_opencode_sessions(since=start), start, end)
+
+
+def bucket_by_week(scanned: list[tuple[Path, datetime]]) -> dict[str, list[Path]]:
+    """Group scanned files by ISO week."""
+    weeks = {}
+    for path, dt in scanned:
+        weeks.setdefault(iso_week(dt), []).append(path)
+    return weeks
+
+
 def human_size(size_bytes: int) -> str:
     """Convert bytes to human readable string."""
     for unit in ["B", "KB", "MB", "GB"]:
@@ -115,16 +305,388 @@ def human_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
+def _plan_entries(sessions: list[Path], **extra) -> list[dict]:
+    """Stat each file once and record what the dry run showed."""
+    files = []
+    for f in sorted(sessions):
+        try:
+            st = os.lstat(f)
+        except OSError:
+            continue
+        files.append({
+            "path": str(f),
+            "size": st.st_size,
+            "ino": st.st_ino,
+            "mtime_ns": st.st_mtime_ns,
+            **extra,
+        })
+    return files
+
+
+def build_plan(provider: str, week: str, sessions: list[Path]) -> dict:
+    """Build a plan for one provider and week."""
+    return _plan_document(provider, week, _plan_entries(sessions))
+
+
+def build_multi_plan(buckets: dict[tuple[str, str], list[Path]]) -> dict:
+    """Build one plan covering several (provider, week) buckets.
+
+    Entries carry their own provider and week so --archive can still write
+    one archive per bucket.
+    """
+    files = []
+    for (provider, week), sessions in sorted(buckets.items()):
+        files.extend(_plan_entries(sessions, provider=provider, week=week))
+    return _plan_document("all", "reviewed", files)
+
+
+def _plan_document(provider: str, week: str, files: list[dict]) -> dict:
+    return {
+        "version": PLAN_VERSION,
+        "provider": provider,
+        "week": week,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "files": files,
+    }
+
+
+def write_plan(plan: dict, path: Path):
+    """Write a plan file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(plan, indent=1))
+    os.replace(tmp, path)
+
+
+def load_plan(path: Path) -> dict:
+    """Read and sanity-check a plan file."""
+    plan = json.loads(Path(path).read_text())
+    if plan.get("version") != PLAN_VERSION or not isinstance(plan.get("files"), list):
+        raise ValueError(f"{path} is not a purge plan (version {PLAN_VERSION})")
+    return plan
+
+
+def _unlink_batch(entries: list[dict]) -> dict:
+    """Re-stat and unlink one batch of plan entries.
+
+    A file is only deleted if its inode, size and mtime still match the plan.
+    """
+    result = {"deleted": 0, "freed": 0, "missing": 0, "changed": [], "errors": []}
+    for entry in entries:
+        path = entry["path"]
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            result["missing"] += 1
+            continue
+        except OSError as e:
+            result["errors"].append(f"{path}: {e}")
+            continue
+        if (st.st_ino, st.st_size, st.st_mtime_ns) != (entry["ino"], entry["size"], entry["mtime_ns"]):
+            result["changed"].append(path)
+            continue
+        try:
+            os.unlink(path)
+            result["deleted"] += 1
+            result["freed"] += entry["size"]
+        except OSError as e:
+            result["errors"].append(f"{path}: {e}")
+    return result
+
+
+def delete_files(entries: list[dict], workers: int = UNLINK_WORKERS) -> dict:
+    """Unlink plan entries in batches on a thread pool, printing progress."""
+    batches = [entries[i:i + UNLINK_BATCH] for i in range(0, len(entries), UNLINK_BATCH)]
+    totals = {"deleted": 0, "freed": 0, "missing": 0, "changed": [], "errors": []}
+    processed = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for batch, result in zip(batches, pool.map(_unlink_batch, batches)):
+            processed += len(batch)
+            for key in ("deleted", "freed", "missing"):
+                totals[key] += result[key]
+            totals["changed"].extend(result["changed"])
+            totals["errors"].extend(result["errors"])
+            if len(batches) > 1:
+                print(f"  {processed}/{len(entries)} files processed", flush=True)
+    return totals
+
+
+def print_delete_summary(totals: dict, planned: int):
+    """Print the outcome of delete_files()."""
+    for err in totals["errors"]:
+        print(f"  Error deleting {err}")
+    if totals["changed"]:
+        print(f"\nSkipped {len(totals['changed'])} file(s) modified since the dry run:")
+        for path in totals["changed"][:20]:
+            print(f"  {path}")
+        if len(totals["changed"]) > 20:
+            print(f"  ... and {len(totals['changed']) - 20} more")
+    if totals["missing"]:
+        print(f"Already gone: {totals['missing']} file(s)")
+    print("")
+    print(f"Deleted {totals['deleted']}/{planned} files")
+    print(f"Freed {human_size(totals['freed'])}")
+
+
+def _archive_name(path: str) -> str:
+    """Return the member name for a file: relative to ~ when possible."""
+    home = str(Path.home())
+    if path.startswith(home + os.sep):
+        return os.path.relpath(path, home)
+    return path.lstrip(os.sep)
+
+
+def _next_archive_path(archive_dir: Path, provider: str, week: str) -> Path:
+    """Pick {provider}-{week}.zip, or a numbered sibling if it already exists."""
+    path = archive_dir / f"{provider}-{week}.zip"
+    n = 2
+    while path.exists():
+        path = archive_dir / f"{provider}-{week}.{n}.zip"
+        n += 1
+    return path
+
+
+def archive_files(entries: list[dict], archive_dir: Path, provider: str, week: str) -> tuple[Path, list[dict]]:
+    """Stream plan entries into a verified zip archive.
+
+    Each member is compressed on its own so it can be read without
+    decompressing the others. The archive is written to a .partial file,
+    checked against the SHA-256 of every source file, then renamed into
+    place. Returns (archive path, entries that were archived).
+    """
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    final_path = _next_archive_path(archive_dir, provider, week)
+    tmp_path = final_path.with_name(final_path.name + ".partial")
+
+    members = []
+    archived = []
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+            for entry in entries:
+                name = _archive_name(entry["path"])
+                info = zipfile.ZipInfo(name, date_time=datetime.fromtimestamp(
+                    max(entry["mtime_ns"] / 1e9, 315532800)).timetuple()[:6])
+                info.compress_type = zipfile.ZIP_DEFLATED
+                digest = hashlib.sha256()
+                try:
+                    with open(entry["path"], "rb") as src, zf.open(info, "w", force_zip64=True) as dst:
+                        while chunk := src.read(ARCHIVE_CHUNK):
+                            digest.update(chunk)
+                            dst.write(chunk)
+                except OSError as e:
+                    print(f"  Error archiving {entry['path']}: {e}")
+                    continue
+                PROFILER.count("bytes_read", entry["size"])
+                members.append({
+                    "name": name,
+                    "path": entry["path"],
+                    "size": entry["size"],
+                    "mtime_ns": entry["mtime_ns"],
+                    "sha256": digest.hexdigest(),
+                })
+                archived.append(entry)
+
+            zf.writestr(ARCHIVE_INDEX, json.dumps({
+                "version": 1,
+                "provider": provider,
+                "week": week,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "members": members,
+            }, indent=1))
+
+        verify_archive(tmp_path)
+        os.replace(tmp_path, final_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return final_path, archived
+
+
+def verify_archive(archive_path: Path):
+    """Re-read every member and compare against the index. Raises ValueError on mismatch."""
+    with zipfile.ZipFile(archive_path) as zf:
+        index = json.loads(zf.read(ARCHIVE_INDEX))
+        for member in index["members"]:
+            digest = hashlib.sha256()
+            with zf.open(member["name"]) as f:
+                while chunk := f.read(ARCHIVE_CHUNK):
+                    digest.update(chunk)
+            if digest.hexdigest() != member["sha256"]:
+                raise ValueError(f"archive verification failed for {member['name']}")
+
+
+def archive_then_delete(entries: list[dict], archive_dir: Path, provider: str, week: str, workers: int) -> dict | None:
+    """Archive entries, then unlink only the ones that made it into an archive.
+
+    Entries are grouped by their own provider/week when present (multi-week
+    plans), falling back to the given provider and week. Returns None if no
+    archive could be written.
+    """
+    groups = {}
+    for entry in entries:
+        groups.setdefault((entry.get("provider", provider), entry.get("week", week)), []).append(entry)
+
+    print(f"### Archiving to {archive_dir}/...\n")
+    archived_all = []
+    failures = []
+    for (group_provider, group_week), group in sorted(groups.items()):
+        try:
+            with PROFILER.phase("archive"):
+                archive_path, archived = archive_files(group, archive_dir, group_provider, group_week)
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            failures.append(f"{group_provider} {group_week}: archive failed, not deleted: {e}")
+            continue
+        size = archive_path.stat().st_size
+        raw = sum(e["size"] for e in archived)
+        print(f"Archived {len(archived)}/{len(group)} files to {archive_path}")
+        print(f"  Compressed {human_size(raw)} -> {human_size(size)} (verified)")
+        archived_all.extend(archived)
+
+    for failure in failures:
+        print(f"Error: {failure}", file=sys.stderr)
+    if not archived_all and failures:
+        return None
+
+    print("")
+    print("### Deleting originals...\n")
+    with PROFILER.phase("unlink"):
+        totals = delete_files(archived_all, workers)
+    totals["errors"].extend(failures)
+    return totals
+
+
+def purge_all_reviewed(args):
+    """Purge every reviewed (provider, week) older than the cutoff in one pass.
+
+    Each provider tree is walked once and files are bucketed by week in
+    memory, then joined against the weeks recorded in the review history.
+    """
+    providers = [args.provider] if args.provider else list(PROVIDERS)
+    cutoff = iso_week(datetime.now() - timedelta(weeks=args.older_than))
+
+    with PROFILER.phase("history"):
+        reviewed = load_reviewed_weeks()
+
+    buckets = {}
+    for provider in providers:
+        for week, paths in bucket_by_week(scan_provider(provider)).items():
+            if week < cutoff and provider in reviewed.get(week, []):
+                buckets[(provider, week)] = paths
+
+    if not buckets:
+        print(f"No reviewed sessions older than {cutoff} found for {', '.join(providers)}")
+        return
+
+    with PROFILER.phase("stat"):
+        plan = build_multi_plan(buckets)
+
+    sizes = {}
+    for entry in plan["files"]:
+        key = (entry["provider"], entry["week"])
+        count, size = sizes.get(key, (0, 0))
+        sizes[key] = (count + 1, size + entry["size"])
+    total_size = sum(size for _, size in sizes.values())
+
+    print(f"## Reviewed Sessions Before {cutoff}\n")
+    print("| Provider | Week | Files | Size |")
+    print("|----------|------|-------|------|")
+    for (provider, week), (count, size) in sorted(sizes.items()):
+        print(f"| {provider} | {week} | {count} | {human_size(size)} |")
+    print("")
+    print(f"Weeks: {len(sizes)}")
+    print(f"Files: {len(plan['files'])}")
+    print(f"Size: {human_size(total_size)}")
+    print("")
+
+    if args.dry_run:
+        plan_path = Path(args.plan).expanduser() if args.plan else PLAN_DIR / "all-reviewed.json"
+        write_plan(plan, plan_path)
+        print("(dry run - nothing deleted)\n")
+        print(f"Plan written to {plan_path}")
+        print(f"Run with --apply {plan_path} to delete exactly these {len(plan['files'])} files.")
+        return
+
+    if args.archive:
+        totals = archive_then_delete(plan["files"], Path(args.archive).expanduser(),
+                                     "all", "reviewed", args.workers)
+        if totals is None:
+            sys.exit(1)
+    else:
+        print("### Deleting...\n")
+        with PROFILER.phase("unlink"):
+            totals = delete_files(plan["files"], args.workers)
+    print_delete_summary(totals, len(plan["files"]))
+
+
+def apply_plan(plan_path: Path, workers: int, archive_dir: Path | None = None):
+    """Delete exactly the files recorded by a dry run."""
+    try:
+        plan = load_plan(plan_path)
+    except (OSError, ValueError) as e:
+        print(f"Error: could not read plan {plan_path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    entries = plan["files"]
+    total_size = sum(e["size"] for e in entries)
+    print(f"## Applying plan: {plan.get('provider', '?')} {plan.get('week', '?')}\n")
+    print(f"Plan: {plan_path} (created {plan.get('created', 'unknown')})")
+    print(f"Files: {len(entries)}")
+    print(f"Size: {human_size(total_size)}")
+    print("")
+    if archive_dir:
+        totals = archive_then_delete(entries, archive_dir, plan.get("provider", "unknown"),
+                                     plan.get("week", "unknown"), workers)
+        if totals is None:
+            sys.exit(1)
+    else:
+        print("### Deleting...\n")
+        with PROFILER.phase("unlink"):
+            totals = delete_files(entries, workers)
+    print_delete_summary(totals, len(entries))
+
+    # A fully applied plan is spent; keep it if anything was skipped
+    if not totals["changed"] and not totals["errors"]:
+        Path(plan_path).unlink(missing_ok=True)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Purge reviewed session files")
-    parser.add_argument("--provider", required=True,
-                        choices=["claude", "codex", "opencode"],
+    parser.add_argument("--provider",
+                        choices=list(PROVIDERS),
                         help="Provider to purge")
-    parser.add_argument("--week", required=True,
+    parser.add_argument("--week",
                         help="Week to purge (e.g., 2025-W36)")
     parser.add_argument("--dry-run", action="store_true",
-                        help="Show what would be deleted without deleting")
+                        help="Show what would be deleted and write a plan file")
+    parser.add_argument("--plan", default=None,
+                        help="Plan file path for --dry-run")
+    parser.add_argument("--apply", metavar="PLAN", default=None,
+                        help="Delete exactly the files listed in a dry-run plan")
+    parser.add_argument("--workers", type=int, default=UNLINK_WORKERS,
+                        help="Threads used for unlinking")
+    parser.add_argument("--archive", metavar="DIR", default=None,
+                        help="Archive files into DIR/{provider}-{week}.zip before deleting")
+    parser.add_argument("--all-reviewed", action="store_true",
+                        help="Purge every week already saved in review history")
+    parser.add_argument("--older-than", type=int, default=0, metavar="N",
+                        help="With --all-reviewed, only weeks older than N weeks ago (default: 0)")
+    add_profile_args(parser)
     args = parser.parse_args()
+    configure_profiling(args, "purge_sessions")
+
+    if args.apply:
+        if args.dry_run:
+            parser.error("--apply cannot be combined with --dry-run")
+        archive_dir = Path(args.archive).expanduser() if args.archive else None
+        apply_plan(Path(args.apply).expanduser(), args.workers, archive_dir)
+        return
+    if args.all_reviewed:
+        if args.week:
+            parser.error("--week cannot be combined with --all-reviewed")
+        purge_all_reviewed(args)
+        return
+    if not args.provider or not args.week:
+        parser.error("--provider and --week are required unless --apply or --all-reviewed is given")
 
     home = Path.home()
     start, end = week_to_date_range(args.week)
@@ -135,7 +697,7 @@ def main():
     elif args.provider == "codex":
         sessions = find_codex_sessions(home / ".codex", start, end)
     elif args.provider == "opencode":
-        sessions = find_opencode_sessions(home / ".local" / "share" / "opencode", start, end)
+        sessions = find_opencode_sessions(start, end)
     else:
         sessions = []
 
@@ -143,34 +705,38 @@ def main():
         print(f"No {args.provider} sessions found for {args.week}")
         return
 
-    # Calculate total size
-    total_size = sum(f.stat().st_size for f in sessions)
+    with PROFILER.phase("stat"):
+        plan = build_plan(args.provider, args.week, sessions)
+    total_size = sum(e["size"] for e in plan["files"])
 
     print(f"## {args.provider.capitalize()} Sessions for {args.week}\n")
-    print(f"Files: {len(sessions)}")
+    print(f"Files: {len(plan['files'])}")
     print(f"Size: {human_size(total_size)}")
     print("")
 
     if args.dry_run:
+        plan_path = Path(args.plan).expanduser() if args.plan else PLAN_DIR / f"{args.provider}-{args.week}.json"
+        write_plan(plan, plan_path)
+
         print("### Files (dry run - nothing deleted)\n")
-        for f in sorted(sessions)[:20]:
-            print(f"  {f}")
-        if len(sessions) > 20:
-            print(f"  ... and {len(sessions) - 20} more")
+        for entry in plan["files"][:20]:
+            print(f"  {entry['path']}")
+        if len(plan["files"]) > 20:
+            print(f"  ... and {len(plan['files']) - 20} more")
         print("")
-        print(f"Run without --dry-run to delete these {len(sessions)} files.")
+        print(f"Plan written to {plan_path}")
+        print(f"Run with --apply {plan_path} to delete exactly these {len(plan['files'])} files.")
+    elif args.archive:
+        totals = archive_then_delete(plan["files"], Path(args.archive).expanduser(),
+                                     args.provider, args.week, args.workers)
+        if totals is None:
+            sys.exit(1)
+        print_delete_summary(totals, len(plan["files"]))
     else:
         print("### Deleting...\n")
-        deleted = 0
-        for f in sessions:
-            try:
-                f.unlink()
-                deleted += 1
-            except Exception as e:
-                print(f"  Error deleting {f}: {e}")
-
-        print(f"Deleted {deleted}/{len(sessions)} files")
-        print(f"Freed {human_size(total_size)}")
+        with PROFILER.phase("unlink"):
+            totals = delete_files(plan["files"], args.workers)
+        print_delete_summary(totals, len(plan["files"]))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Optional long-lived daemon that keeps prompt-reviewer indexes hot.
+
+Usage:
+  review_daemon.py start [--detach]
+  review_daemon.py stop
+  review_daemon.py status
+
+Commands:
+  start      Listen on ~/.claude/prompt-reviewer.sock (foreground unless --detach)
+  stop       Ask a running daemon to exit
+  status     Show whether the daemon is up and how much it has cached
+
+While the daemon runs, list_weeks.py, extract_sessions.py, save_review.py and
+show_trend.py forward their arguments over the socket and print the daemon's
+output. Session directories are only re-listed when their mtime changes,
+session files are only re-read when their mtime or size changes, and
+the history file is read incrementally from the last offset. When the daemon
+is down the scripts run in-process as before.
+
+Override the socket path with PROMPT_REVIEWER_SOCKET.
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import socketserver
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib import daemon
+
+COMMANDS = ("extract_sessions", "list_weeks", "save_review", "show_trend")
+
+# Drop cache entries for deleted files this often (seconds)
+PRUNE_INTERVAL = 600
+
+
+def run_command(command: str, argv: list[str]) -> dict:
+    """Run a script's main() in-process, capturing output and exit status."""
+    module = importlib.import_module(command)
+    out, err = io.StringIO(), io.StringIO()
+    old_argv = sys.argv
+    sys.argv = [module.__file__] + list(argv)
+    code = 0
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            module.main()
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            err.write(f"{e.code}\n")
+            code = 1
+    except Exception:
+        traceback.print_exc(file=err)
+        code = 1
+    finally:
+        sys.argv = old_argv
+    return {"exit": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One newline-delimited JSON request and response per connection."""
+
+    def handle(self):
+        try:
+            req = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response = self.server.dispatch(req)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class ReviewDaemon(socketserver.UnixStreamServer):
+    """Serves requests one at a time so captured stdout never interleaves."""
+
+    def __init__(self, socket_path):
+        super().__init__(str(socket_path), _Handler)
+        self.started = time.time()
+        self.requests = 0
+        self.last_prune = time.time()
+
+    def dispatch(self, req: dict) -> dict:
+        command = req.get("command")
+        if command == "ping":
+            return {"status": "ok", "pid": os.getpid(), "uptime": round(time.time() - self.started, 1),
+                    "requests": self.requests, **daemon.cache_stats()}
+        if command == "shutdown":
+            # shutdown() blocks until serve_forever exits, so it cannot run on this thread
+            import threading
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"status": "stopping"}
+        if command not in COMMANDS:
+            return {"error": f"unknown command: {command}"}
+        # Scripts resolve ~ at import time; a different HOME must run in-process
+        if req.get("home") != str(Path.home()):
+            return {"error": "home mismatch"}
+
+        self.requests += 1
+        cwd = os.getcwd()
+        try:
+            if req.get("cwd"):
+                os.chdir(req["cwd"])
+            return run_command(command, req.get("argv") or [])
+        except OSError as e:
+            return {"error": str(e)}
+        finally:
+            os.chdir(cwd)
+
+    def service_actions(self):
+        if time.time() - self.last_prune > PRUNE_INTERVAL:
+            daemon.prune_caches()
+            self.last_prune = time.time()
+
+
+def start(detach: bool = False):
+    """Bind the socket and serve until stopped."""
+    socket_path = daemon.SOCKET_PATH
+    if daemon.request({"command": "ping"}, timeout=2):
+        print(f"Daemon already running on {socket_path}")
+        return
+    if socket_path.exists():
+        socket_path.unlink()  # stale socket from a crashed daemon
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if detach:
+        if os.fork():
+            print(f"Daemon starting on {socket_path}")
+            return
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+
+    daemon.set_hot()
+    # The socket is created 0600 by bind() itself, so no other user can
+    # connect in the window a chmod after bind would leave open
+    old_umask = os.umask(0o177)
+    try:
+        server = ReviewDaemon(socket_path)
+    finally:
+        os.umask(old_umask)
+    if not detach:
+        print(f"Daemon listening on {socket_path} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path.exists():
+            socket_path.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prompt reviewer daemon")
+    parser.add_argument("action", choices=["start", "stop", "status"])
+    parser.add_argument("--detach", action="store_true", help="Run in the background")
+    args = parser.parse_args()
+
+    if args.action == "start":
+        start(detach=args.detach)
+    elif args.action == "stop":
+        response = daemon.request({"command": "shutdown"}, timeout=5)
+        print("Daemon stopped." if response else "Daemon not running.")
+    else:
+        response = daemon.request({"command": "ping"}, timeout=5)
+        if not response:
+            print("Daemon not running.")
+            sys.exit(1)
+        print(json.dumps(response, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -25,9 +25,14 @@ Appends a JSON record to ~/.claude/prompt-review-history.jsonl
 import argparse
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.daemon import forward_to_daemon
+
 HISTORY_FILE = Path.home() / ".claude" / "prompt-review-history.jsonl"
 
 AXES = [
@@ -43,6 +48,8 @@ def iso_week(dt: datetime) -> str:
 
 
 def main():
+    forward_to_daemon("save_review")
+
     parser = argparse.ArgumentParser(description="Save prompt review scores to history")
     parser.add_argument("--composite", type=float, required=True, help="Composite score (0-1)")
     parser.add_argument("--sessions", type=int, required=True, help="Number of sessions reviewed")
@@ -4,25 +4,40 @@ Display prompt review score trends from history.
 
 Usage:
   show_trend.py [--weeks N] [--csv] [--project PATH] [--provider NAME]
+                [--group-by DIMS]
 
 Options:
   --weeks N         Number of weeks to show (default: 8)
   --csv             Output CSV instead of markdown
   --project PATH    Filter to reviews of a specific project
   --provider NAME   Filter to a specific provider (claude, codex, amp, opencode)
-
-Reads from ~/.claude/prompt-review-history.jsonl
+  --group-by DIMS   Compare groups instead of weeks, e.g. provider,model
+                    (dimensions: provider, model, project, source)
+  --profile         Print per-phase timing and I/O counters as JSON on stderr
+                    (or set PROMPT_REVIEWER_PROFILE=1)
+  --profile-dump PATH  Also write cProfile stats to PATH
+
+Reads from ~/.claude/prompt-review-history.jsonl. History is appended in time
+order, so the file is read backwards from EOF and reading stops once enough
+weeks have been seen. An out-of-order (backfilled) week triggers a full scan.
 """
 
 import argparse
 import csv
 import json
+import os
 import sys
 from collections import defaultdict
 from datetime import datetime, timedelta
 from io import StringIO
+from itertools import combinations
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.daemon import forward_to_daemon, history_records, is_hot
+from lib.profiling import PROFILER, add_profile_args, configure_profiling
+
 HISTORY_FILE = Path.home() / ".claude" / "prompt-review-history.jsonl"
 
 AXES = [
@@ -33,6 +48,13 @@ AXES = [
 
 SPARK_CHARS = "▁▂▃▄▅▆▇█"
 
+# Record metadata fields that can be grouped on
+DIMENSIONS = ("provider", "model", "project", "source")
+
+# Reverse reader tuning: block size and extra weeks read past the requested window
+TAIL_CHUNK_SIZE = 64 * 1024
+TAIL_WEEK_MARGIN = 2
+
 
 def spark(values: list[float], max_val: float = 1.0) -> str:
     """Generate sparkline string from values."""
@@ -55,6 +77,15 @@ def delta_str(current: float, previous: float) -> str:
     return f"{arrow}{diff:.2f}"
 
 
+def _matches(rec: dict, project_filter: str | None, provider_filter: str | None) -> bool:
+    """Check a record against the --project / --provider filters."""
+    if project_filter and rec.get("project") != project_filter:
+        return False
+    if provider_filter and rec.get("provider") != provider_filter:
+        return False
+    return True
+
+
 def load_records(
     project_filter: str | None = None,
     provider_filter: str | None = None,
@@ -62,20 +93,102 @@ def load_records(
     """Load all records from history file."""
     if not HISTORY_FILE.exists():
         return []
+    if is_hot():
+        return [r for r in history_records(HISTORY_FILE)
+                if _matches(r, project_filter, provider_filter)]
     records = []
+    decoded = skipped = 0
     with open(HISTORY_FILE, "r") as f:
+        PROFILER.count("files_visited")
+        PROFILER.count("bytes_read", os.fstat(f.fileno()).st_size)
         for line in f:
             if not line.strip():
+                skipped += 1
                 continue
             try:
                 rec = json.loads(line)
-                if project_filter and rec.get("project") != project_filter:
-                    continue
-                if provider_filter and rec.get("provider") != provider_filter:
+                decoded += 1
+                if not _matches(rec, project_filter, provider_filter):
                     continue
                 records.append(rec)
             except json.JSONDecodeError:
+                skipped += 1
                 continue
+    PROFILER.count("lines_decoded", decoded)
+    PROFILER.count("lines_skipped", skipped)
+    return records
+
+
+def iter_lines_reversed(path: Path, chunk_size: int = TAIL_CHUNK_SIZE):
+    """Yield raw lines of a file from last to first.
+
+    Reads fixed-size blocks backwards from EOF, so only the tail of the
+    file is touched when the caller stops early.
+    """
+    with open(path, "rb") as f:
+        PROFILER.count("files_visited")
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        remainder = b""
+        while pos > 0:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            PROFILER.count("bytes_read", read_size)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # First piece may be a partial line; keep it for the next block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line
+        yield remainder
+
+
+def load_recent_records(
+    num_weeks: int,
+    project_filter: str | None = None,
+    provider_filter: str | None = None,
+) -> list[dict]:
+    """Load records for the most recent weeks by reading history backwards.
+
+    Stops after num_weeks + TAIL_WEEK_MARGIN distinct weeks. Falls back to
+    load_records() if a record is missing its week or a week appears out of
+    order (e.g. a backfill appended after newer reviews).
+
+    Returns records in file order.
+    """
+    if num_weeks <= 0 or is_hot():
+        return load_records(project_filter, provider_filter)
+    if not HISTORY_FILE.exists():
+        return []
+
+    wanted = num_weeks + TAIL_WEEK_MARGIN
+    records = []
+    seen_weeks = set()
+    oldest_week = None
+    for line in iter_lines_reversed(HISTORY_FILE):
+        if not line.strip():
+            PROFILER.count("lines_skipped")
+            continue
+        try:
+            rec = json.loads(line)
+            PROFILER.count("lines_decoded")
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            PROFILER.count("lines_skipped")
+            continue
+        if not _matches(rec, project_filter, provider_filter):
+            continue
+
+        week = rec.get("week")
+        if not week or (oldest_week is not None and week > oldest_week):
+            return load_records(project_filter, provider_filter)
+        if week not in seen_weeks:
+            if len(seen_weeks) >= wanted:
+                break
+            seen_weeks.add(week)
+            oldest_week = week
+        records.append(rec)
+
+    records.reverse()
     return records
 
 
@@ -193,14 +306,72 @@ def render_markdown(aggregated: dict[str, dict], num_weeks: int) -> str:
     return "\n".join(lines)
 
 
-def render_provider_breakdown(records: list[dict]) -> str:
-    """Render composite score comparison across providers."""
-    providers = defaultdict(list)
+def _dim_value(rec: dict, dim: str) -> str:
+    """Return a record's value for a cube dimension."""
+    if dim == "provider":
+        return rec.get("provider") or rec.get("source") or "unknown"
+    return rec.get(dim) or "unknown"
+
+
+def build_cube(records: list[dict], dims: tuple[str, ...] = DIMENSIONS) -> dict:
+    """Aggregate records over every combination of dims in a single pass.
+
+    Returns {grouping: {values: cell}} where grouping is a tuple of dimension
+    names (in dims order, including the empty tuple for the grand total) and
+    values is the matching tuple of record values.
+    """
+    groupings = [g for r in range(len(dims) + 1) for g in combinations(dims, r)]
+    cube = {g: {} for g in groupings}
+
     for rec in records:
-        p = rec.get("provider") or rec.get("source", "unknown")
-        providers[p].append(rec["composite"])
+        values = {d: _dim_value(rec, d) for d in dims}
+        rec_axes = rec.get("axes", {})
+        for grouping in groupings:
+            key = tuple(values[d] for d in grouping)
+            cell = cube[grouping].get(key)
+            if cell is None:
+                cell = cube[grouping][key] = {
+                    "reviews": 0,
+                    "sessions": 0,
+                    "prompts": 0,
+                    "composites": [],
+                    "axes": {axis: 0.0 for axis, _ in AXES},
+                }
+            cell["reviews"] += 1
+            cell["sessions"] += rec.get("sessions", 0)
+            cell["prompts"] += rec.get("prompts", 0)
+            cell["composites"].append(rec["composite"])
+            for axis, _ in AXES:
+                cell["axes"][axis] += rec_axes.get(axis, 0)
+    return cube
+
+
+def query_cube(cube: dict, group_by: list[str]) -> list[tuple[tuple, dict]]:
+    """Answer a group-by query from the cube.
+
+    Returns (values, summary) rows sorted by values, with values ordered
+    as requested in group_by.
+    """
+    grouping = tuple(d for d in DIMENSIONS if d in group_by)
+    order = [grouping.index(d) for d in group_by]
+    rows = []
+    for key, cell in cube.get(grouping, {}).items():
+        n = cell["reviews"]
+        rows.append((tuple(key[i] for i in order), {
+            "reviews": n,
+            "sessions": cell["sessions"],
+            "prompts": cell["prompts"],
+            "composite": sum(cell["composites"]) / n,
+            "composites": cell["composites"],
+            "axes": {k: v / n for k, v in cell["axes"].items()},
+        }))
+    return sorted(rows, key=lambda row: row[0])
 
-    if len(providers) < 2:
+
+def render_provider_breakdown(cube: dict) -> str:
+    """Render composite score comparison across providers."""
+    rows = query_cube(cube, ["provider"])
+    if len(rows) < 2:
         return ""
 
     lines = [
@@ -210,16 +381,68 @@ def render_provider_breakdown(records: list[dict]) -> str:
         "|----------|---------|-----------|-------|",
     ]
 
-    for provider in sorted(providers.keys()):
-        scores = providers[provider]
-        avg = sum(scores) / len(scores)
-        sp = spark(scores)
-        lines.append(f"| {provider} | {len(scores)} | {avg:.2f} | {sp} |")
+    for (provider,), data in rows:
+        sp = spark(data["composites"])
+        lines.append(f"| {provider} | {data['reviews']} | {data['composite']:.2f} | {sp} |")
 
     lines.append("")
     return "\n".join(lines)
 
 
+def render_group_by(cube: dict, group_by: list[str]) -> str:
+    """Render a group-by comparison table answered from the cube."""
+    rows = query_cube(cube, group_by)
+    if not rows:
+        return "No review history found. Run a prompt review first to start tracking.\n"
+
+    titles = [d.capitalize() for d in group_by]
+    lines = [
+        f"### By {' × '.join(titles)}",
+        "",
+        "| " + " | ".join(titles) + " | Reviews | Sessions | Prompts | Avg Score | Spark |",
+        "|" + "|".join("-" * (len(t) + 2) for t in titles)
+        + "|---------|----------|---------|-----------|-------|",
+    ]
+    for values, data in rows:
+        lines.append(
+            "| " + " | ".join(values) + f" | {data['reviews']} | {data['sessions']} | "
+            f"{data['prompts']} | {data['composite']:.2f} | {spark(data['composites'])} |"
+        )
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def render_group_by_csv(cube: dict, group_by: list[str]) -> str:
+    """Render a group-by comparison as CSV."""
+    rows = query_cube(cube, group_by)
+    if not rows:
+        return ""
+
+    output = StringIO()
+    writer = csv.writer(output)
+    writer.writerow(list(group_by) + ["composite", "sessions", "prompts", "reviews"]
+                    + [axis for axis, _ in AXES])
+    for values, data in rows:
+        row = list(values) + [f"{data['composite']:.3f}", data["sessions"],
+                              data["prompts"], data["reviews"]]
+        row += [f"{data['axes'][axis]:.1f}" for axis, _ in AXES]
+        writer.writerow(row)
+
+    return output.getvalue()
+
+
+def parse_group_by(value: str) -> list[str]:
+    """Parse a comma-separated --group-by value into dimension names."""
+    dims = [d.strip() for d in value.split(",") if d.strip()]
+    unknown = [d for d in dims if d not in DIMENSIONS]
+    if unknown or not dims or len(set(dims)) != len(dims):
+        raise argparse.ArgumentTypeError(
+            f"expected comma-separated dimensions from: {', '.join(DIMENSIONS)}"
+        )
+    return dims
+
+
 def render_csv(aggregated: dict[str, dict], num_weeks: int) -> str:
     """Render trend as CSV."""
     weeks = list(aggregated.keys())[-num_weeks:]
@@ -243,17 +466,25 @@ def render_csv(aggregated: dict[str, dict], num_weeks: int) -> str:
 
 
 def main():
+    forward_to_daemon("show_trend")
+
     parser = argparse.ArgumentParser(description="Show prompt review score trends")
     parser.add_argument("--weeks", type=int, default=8, help="Number of weeks to display")
     parser.add_argument("--csv", action="store_true", help="Output as CSV")
     parser.add_argument("--project", default=None, help="Filter to project")
     parser.add_argument("--provider", default=None, help="Filter to provider")
+    parser.add_argument("--group-by", type=parse_group_by, default=None,
+                        help="Compare groups, e.g. provider,model")
+    add_profile_args(parser)
     args = parser.parse_args()
+    configure_profiling(args, "show_trend")
 
-    records = load_records(
-        project_filter=args.project,
-        provider_filter=args.provider,
-    )
+    with PROFILER.phase("read"):
+        records = load_recent_records(
+            args.weeks,
+            project_filter=args.project,
+            provider_filter=args.provider,
+        )
 
     if not records:
         if args.csv:
@@ -262,18 +493,30 @@ def main():
             print("No review history found. Run a prompt review first to start tracking.")
         sys.exit(0)
 
-    aggregated = aggregate_by_week(records)
-
-    if args.csv:
-        print(render_csv(aggregated, args.weeks))
-    else:
-        output = render_markdown(aggregated, args.weeks)
-        # Append provider breakdown if not filtering to a single provider
-        if not args.provider:
-            provider_section = render_provider_breakdown(records)
-            if provider_section:
-                output += "\n" + provider_section
-        print(output)
+    with PROFILER.phase("aggregate"):
+        aggregated = aggregate_by_week(records)
+
+    # Group-by and provider breakdown cover the displayed weeks only
+    shown = set(list(aggregated.keys())[-args.weeks:])
+    window = [r for r in records if r.get("week") in shown]
+
+    with PROFILER.phase("render"):
+        if args.group_by:
+            cube = build_cube(window)
+            if args.csv:
+                print(render_group_by_csv(cube, args.group_by))
+            else:
+                print(render_group_by(cube, args.group_by))
+        elif args.csv:
+            print(render_csv(aggregated, args.weeks))
+        else:
+            output = render_markdown(aggregated, args.weeks)
+            # Append provider breakdown if not filtering to a single provider
+            if not args.provider:
+                provider_section = render_provider_breakdown(build_cube(window, ("provider",)))
+                if provider_section:
+                    output += "\n" + provider_section
+            print(output)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,31 @@ Context Audit - Scan Claude environment and generate context registry.
 
 Usage:
     audit_context.py [--scan-root <path>] [--output <path>] [--report-only]
+                     [--depth N] [--nested] [--jobs N] [--no-cache]
+                     [--rules a,b] [--skip-rules a,b] [--list-rules]
+                     [--format text|json|ndjson]
 
 Examples:
     audit_context.py                              # Scan ~/repos, write to ~/.claude/context/
     audit_context.py --scan-root ~/projects       # Custom scan root
     audit_context.py --report-only                # Print report without writing registry
     audit_context.py --scan-root ~/repos --scan-root ~/work  # Multiple scan roots
+    audit_context.py --jobs 8                     # Scan projects on 8 threads
+    audit_context.py --depth 3                    # Find nested workspaces like ~/repos/org/app
+    audit_context.py --no-cache                   # Re-scan every project from scratch
+    audit_context.py --skip-rules duplicate,stale # Leave out some issue checks
+    audit_context.py --list-rules                 # Show available issue checks
+    audit_context.py --format ndjson              # Stream project/issue records, then a summary
+
+Unchanged projects are served from <output>/scan-cache.json; a project is
+re-scanned when its directory, .claude/, .claude/skills, .claude/hooks,
+settings.json, .mcp.json or CLAUDE.md changes.
+
+With --format ndjson one JSON object is printed per line as results are
+produced: {"type": "project", ...} for each project as soon as it is
+scanned (in walk order), {"type": "issue", ...} for each issue once the
+scan is done, and a final {"type": "summary", ...}. --format json prints
+the same records as one document.
 """
 
 import sys
@@ -19,9 +38,19 @@ from pathlib import Path
 # Add parent dir to path for lib imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from lib.scanner import scan_global_config, scan_projects
-from lib.reporter import format_audit_report, detect_issues
+from lib.scanner import scan_global_config, scan_projects, expand_path
+from lib.reporter import (
+    FORMATS,
+    RecordStream,
+    detect_issues,
+    format_audit_report,
+    issue_counts,
+    issue_record,
+    project_record,
+)
+from lib.rules import RULES, select_rules
 from lib.registry import write_registry
+from lib.scan_cache import load_scan_cache, save_scan_cache, save_scan_walk
 
 
 def main():
@@ -31,6 +60,13 @@ def main():
     scan_roots = []
     output_dir = os.path.expanduser("~/.claude/context")
     report_only = False
+    jobs = None
+    depth = 1
+    nested = False
+    use_cache = True
+    rules = None
+    skip_rules = None
+    fmt = "text"
 
     i = 0
     while i < len(args):
@@ -43,31 +79,114 @@ def main():
         elif args[i] == "--report-only":
             report_only = True
             i += 1
+        elif args[i] == "--jobs" and i + 1 < len(args):
+            try:
+                jobs = int(args[i + 1])
+            except ValueError:
+                print(f"--jobs expects a number, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--depth" and i + 1 < len(args):
+            try:
+                depth = int(args[i + 1])
+            except ValueError:
+                print(f"--depth expects a number, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--nested":
+            nested = True
+            i += 1
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
+        elif args[i] == "--rules" and i + 1 < len(args):
+            rules = [r.strip() for r in args[i + 1].split(",") if r.strip()]
+            i += 2
+        elif args[i] == "--skip-rules" and i + 1 < len(args):
+            skip_rules = [r.strip() for r in args[i + 1].split(",") if r.strip()]
+            i += 2
+        elif args[i] == "--format" and i + 1 < len(args):
+            fmt = args[i + 1]
+            if fmt not in FORMATS:
+                print(f"--format must be one of: {', '.join(FORMATS)}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--list-rules":
+            for name, info in RULES.items():
+                print(f"  {name.ljust(14)} {info['description']}")
+            sys.exit(0)
         elif args[i] in ("-h", "--help"):
             print(__doc__)
             sys.exit(0)
         else:
             print(f"Unknown argument: {args[i]}")
-            print("Usage: audit_context.py [--scan-root <path>] [--output <path>] [--report-only]")
+            print(__doc__)
             sys.exit(1)
 
+    try:
+        select_rules(rules, skip_rules)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+
     # Default scan root
     if not scan_roots:
         scan_roots = [os.path.expanduser("~/repos")]
 
+    stream = RecordStream(fmt) if fmt != "text" else None
+
     # Run scan
+    cache = load_scan_cache(output_dir) if use_cache else None
     global_config = scan_global_config()
-    projects = scan_projects(scan_roots)
-    issues = detect_issues(global_config, projects)
+    listings = {}
+    candidates = []
+    projects = scan_projects(
+        scan_roots, max_workers=jobs, depth=depth, nested=nested, cache=cache, listings=listings,
+        candidates=candidates,
+        on_project=(lambda p: stream.emit(project_record(p))) if stream else None,
+    )
 
-    # Print report
-    report = format_audit_report(global_config, projects, issues)
-    print(report)
+    issues = detect_issues(global_config, projects, rules=rules, skip_rules=skip_rules)
+    if stream:
+        for issue in issues:
+            stream.emit(issue_record(issue))
+    else:
+        # Print report
+        report = format_audit_report(global_config, projects, issues)
+        print(report)
 
     # Write registry
+    stats = None
     if not report_only:
-        write_registry(output_dir, global_config, projects)
-        print(f"Registry written to {output_dir}/")
+        scan = {
+            "roots": [str(expand_path(r)) for r in scan_roots],
+            "depth": depth,
+            "nested": nested,
+        }
+        stats = write_registry(output_dir, global_config, projects, scan=scan)
+        if cache is not None:
+            save_scan_cache(
+                output_dir, cache, keep_paths=[p["path"] for p in projects], walked=candidates
+            )
+            save_scan_walk(output_dir, {**scan, "children": listings, "candidates": candidates})
+
+    if stream:
+        stream.close({
+            "command": "audit",
+            "projects": len(projects),
+            "issues": issue_counts(issues),
+            "registry": None if stats is None else {
+                "path": str(output_dir),
+                "written": stats["written"],
+                "unchanged": stats["unchanged"],
+                "removed": len(stats["removed"]),
+            },
+        })
+    elif stats is not None:
+        print(
+            f"Registry written to {output_dir}/ ({stats['written']} files updated, "
+            f"{stats['unchanged']} unchanged, {len(stats['removed'])} removed)"
+        )
     else:
         print("(report only — registry not written)")
 
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Context Bench - Time the context scripts against synthetic machines.
+
+Usage:
+    bench_context.py                          # 100, 1000 and 10000 projects
+    bench_context.py --sizes 100,1000         # Custom project counts
+    bench_context.py --jobs N                 # Scan on N threads
+    bench_context.py --nested                 # Walk into nested projects
+    bench_context.py --cache                  # Use the scan cache (cold, then warm in check_drift)
+    bench_context.py --seed N                 # Fixture seed (default: 0)
+    bench_context.py --fixture-dir <path>     # Keep fixtures there and reuse them across runs
+    bench_context.py --generate N <path>      # Only build a fixture with N projects
+    bench_context.py --format json            # Results as one JSON document
+
+Each size gets a fixture from lib/fixture.py (a fake ~/.claude plus a scan
+root with N candidate directories, see that module) and is measured in a
+fresh subprocess with HOME pointed at the fixture. The stages are:
+
+    scan_global_config   ~/.claude settings, commands, skills and modes
+    scan_projects        walk the root (depth 2) and scan every candidate
+    detect_issues        all audit rules
+    write_registry       full registry write into an empty context dir
+    check_drift          re-scan and compare against the registry just written
+
+Per stage it reports wall time, read()/write() syscalls and bytes read
+(from /proc/self/io), files opened and directories listed (audit hooks),
+os.stat/os.lstat calls made from Python, and peak RSS (VmHWM, reset before
+each stage where the kernel allows it). Fixture files were just written, so
+the page cache is warm; numbers show CPU and syscall scaling, not disk.
+Linux only for the /proc counters; elsewhere those columns are empty.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.fixture import generate_fixture
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEPTH = 2
+FIXTURE_META = "fixture.json"
+
+STAGES = ("scan_global_config", "scan_projects", "detect_issues", "write_registry", "check_drift")
+
+
+# --- Fixtures -------------------------------------------------------------
+
+def prepare_fixture(base, n_projects, seed):
+    """Generate a fixture at base, or reuse one built with the same size and seed."""
+    base = Path(base)
+    meta_path = base / FIXTURE_META
+    try:
+        meta = json.loads(meta_path.read_text())
+        if meta.get("n_projects") == n_projects and meta.get("seed") == seed:
+            return meta, 0.0
+    except (OSError, ValueError):
+        pass
+
+    if base.exists():
+        shutil.rmtree(base)
+    start = time.perf_counter()
+    meta = generate_fixture(base, n_projects, seed=seed)
+    elapsed = time.perf_counter() - start
+    meta = {
+        "n_projects": n_projects,
+        "seed": seed,
+        "home": meta["home"],
+        "roots": meta["roots"],
+        "with_config": len(meta["projects"]),
+    }
+    meta_path.write_text(json.dumps(meta, indent=2))
+    return meta, elapsed
+
+
+# --- Worker (runs inside the benchmark subprocess) ------------------------
+
+_counts = {"opens": 0, "dir_lists": 0, "stats": 0}
+_counts_lock = threading.Lock()
+
+
+def _bump(name):
+    with _counts_lock:
+        _counts[name] += 1
+
+
+def _audit(event, args):
+    if event == "open":
+        _bump("opens")
+    elif event in ("os.scandir", "os.listdir"):
+        _bump("dir_lists")
+
+
+def _counting(fn):
+    def wrapper(*args, **kwargs):
+        _bump("stats")
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+def _install_counters():
+    sys.addaudithook(_audit)
+    os.stat = _counting(os.stat)
+    os.lstat = _counting(os.lstat)
+    _, baseline = _measure(lambda: None, overhead={})
+    _overhead.update(
+        (key, value) for key, value in baseline.items()
+        if key not in ("seconds", "peak_rss_bytes", "peak_rss_reset") and value is not None
+    )
+
+
+def _read_counts():
+    with _counts_lock:
+        return dict(_counts)
+
+
+def _proc_io():
+    try:
+        with open("/proc/self/io") as f:
+            return {k: int(v) for k, v in (line.split(": ") for line in f)}
+    except OSError:
+        return {}
+
+
+def _reset_peak_rss():
+    """Reset VmHWM so the next reading covers one stage. Returns success."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_bytes():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# Counter deltas caused by the measurement itself (reading /proc/self/io),
+# subtracted from every stage; set by _install_counters()
+_overhead = {}
+
+
+def _measure(fn, overhead=None):
+    """Run fn once; return (result, stage measurements)."""
+    overhead = _overhead if overhead is None else overhead
+    reset = _reset_peak_rss()
+    counts = _read_counts()
+    io = _proc_io()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    io_after = _proc_io()
+    counts_after = _read_counts()
+    raw = {
+        "read_calls": io_after["syscr"] - io["syscr"] if io else None,
+        "write_calls": io_after["syscw"] - io["syscw"] if io else None,
+        "bytes_read": io_after["rchar"] - io["rchar"] if io else None,
+        **{name: counts_after[name] - counts[name] for name in counts},
+    }
+    stage = {"seconds": round(seconds, 6)}
+    for key, value in raw.items():
+        stage[key] = None if value is None else value - overhead.get(key, 0)
+    stage["peak_rss_bytes"] = _peak_rss_bytes()
+    stage["peak_rss_reset"] = reset
+    return result, stage
+
+
+def run_worker(fixture_base, jobs=None, nested=False, use_cache=False):
+    """Run every stage against the fixture at fixture_base; return results."""
+    # Only the worker process needs the scanning modules
+    from lib.scanner import scan_global_config, scan_projects, expand_path
+    from lib.reporter import detect_issues
+    from lib.registry import write_registry
+    from lib.scan_cache import load_scan_cache, save_scan_cache, save_scan_walk
+    from sync_context import check_drift
+
+    meta = json.loads((Path(fixture_base) / FIXTURE_META).read_text())
+    context_dir = expand_path("~/.claude/context")
+    if context_dir.exists():
+        shutil.rmtree(context_dir)
+    cache = load_scan_cache(context_dir) if use_cache else None
+    roots = meta["roots"]
+
+    _install_counters()
+    stages = {}
+    global_config, stages["scan_global_config"] = _measure(scan_global_config)
+    listings = {}
+    candidates = []
+    projects, stages["scan_projects"] = _measure(
+        lambda: scan_projects(
+            roots, max_workers=jobs, depth=DEPTH, nested=nested, cache=cache, listings=listings,
+            candidates=candidates,
+        )
+    )
+    issues, stages["detect_issues"] = _measure(lambda: detect_issues(global_config, projects))
+    scan = {"roots": roots, "depth": DEPTH, "nested": nested}
+    _, stages["write_registry"] = _measure(
+        lambda: write_registry(str(context_dir), global_config, projects, scan=scan)
+    )
+    if cache is not None:
+        save_scan_cache(
+            context_dir, cache, keep_paths=[p["path"] for p in projects], walked=candidates
+        )
+        save_scan_walk(context_dir, {**scan, "children": listings, "candidates": candidates})
+    drift, stages["check_drift"] = _measure(
+        lambda: check_drift(context_dir, jobs=jobs, use_cache=use_cache)
+    )
+
+    return {
+        "n_projects": meta["n_projects"],
+        "projects_found": len(projects),
+        "issues": len(issues),
+        "drift": sum(1 for d in drift[0] if d["status"] != "OK") if drift else None,
+        "stages": stages,
+    }
+
+
+# --- Runner ---------------------------------------------------------------
+
+def run_size(fixture_base, jobs=None, nested=False, use_cache=False):
+    """Measure one fixture in a fresh interpreter with HOME set to it."""
+    meta = json.loads((Path(fixture_base) / FIXTURE_META).read_text())
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--worker", str(fixture_base)]
+    if jobs:
+        cmd += ["--jobs", str(jobs)]
+    if nested:
+        cmd.append("--nested")
+    if use_cache:
+        cmd.append("--cache")
+    env = {**os.environ, "HOME": meta["home"]}
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"benchmark worker failed:\n{proc.stderr}")
+    return json.loads(proc.stdout)
+
+
+def _human_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024
+
+
+def format_bench_report(results, jobs=None, nested=False, use_cache=False):
+    """Format benchmark results as a text table per size."""
+    lines = []
+    lines.append(
+        f"CONTEXT BENCHMARK (depth {DEPTH}{', nested' if nested else ''}, "
+        f"jobs {jobs or 1}, scan cache {'on' if use_cache else 'off'})"
+    )
+    header = (
+        f"    {'stage':<20} {'seconds':>9} {'reads':>8} {'writes':>7} {'opens':>7} "
+        f"{'dirs':>7} {'stats':>8} {'read':>9} {'peak RSS':>9}"
+    )
+    for r in results:
+        lines.append("")
+        lines.append(
+            f"  {r['n_projects']} candidates: {r['projects_found']} projects, "
+            f"{r['issues']} issues, {r['drift']} drift"
+            + (f" (fixture built in {r['fixture_seconds']:.2f}s)" if r.get("fixture_seconds") else "")
+        )
+        lines.append(header)
+        for name in STAGES:
+            s = r["stages"][name]
+            lines.append(
+                f"    {name:<20} {s['seconds']:>9.4f} {_dash(s['read_calls']):>8} "
+                f"{_dash(s['write_calls']):>7} {s['opens']:>7} {s['dir_lists']:>7} {s['stats']:>8} "
+                f"{_human_bytes(s['bytes_read']):>9} {_human_bytes(s['peak_rss_bytes']):>9}"
+            )
+        total = sum(r["stages"][name]["seconds"] for name in STAGES)
+        lines.append(f"    {'total':<20} {total:>9.4f}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _dash(value):
+    return "-" if value is None else value
+
+
+def main():
+    args = sys.argv[1:]
+
+    sizes = DEFAULT_SIZES
+    jobs = None
+    nested = False
+    use_cache = False
+    seed = 0
+    fixture_dir = None
+    generate = None
+    worker = None
+    fmt = "text"
+
+    i = 0
+    while i < len(args):
+        if args[i] == "--sizes" and i + 1 < len(args):
+            try:
+                sizes = [int(s) for s in args[i + 1].split(",") if s.strip()]
+            except ValueError:
+                print(f"--sizes expects comma-separated numbers, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--jobs" and i + 1 < len(args):
+            try:
+                jobs = int(args[i + 1])
+            except ValueError:
+                print(f"--jobs expects a number, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--seed" and i + 1 < len(args):
+            try:
+                seed = int(args[i + 1])
+            except ValueError:
+                print(f"--seed expects a number, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--nested":
+            nested = True
+            i += 1
+        elif args[i] == "--cache":
+            use_cache = True
+            i += 1
+        elif args[i] == "--fixture-dir" and i + 1 < len(args):
+            fixture_dir = Path(os.path.expanduser(args[i + 1])).resolve()
+            i += 2
+        elif args[i] == "--generate" and i + 2 < len(args):
+            try:
+                generate = (int(args[i + 1]), Path(os.path.expanduser(args[i + 2])).resolve())
+            except ValueError:
+                print(f"--generate expects a number and a path, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 3
+        elif args[i] == "--worker" and i + 1 < len(args):
+            worker = args[i + 1]
+            i += 2
+        elif args[i] == "--format" and i + 1 < len(args):
+            fmt = args[i + 1]
+            if fmt not in ("text", "json"):
+                print("--format must be one of: text, json")
+                sys.exit(1)
+            i += 2
+        elif args[i] in ("-h", "--help"):
+            print(__doc__)
+            sys.exit(0)
+        else:
+            print(f"Unknown argument: {args[i]}")
+            print(__doc__)
+            sys.exit(1)
+
+    if worker:
+        print(json.dumps(run_worker(worker, jobs=jobs, nested=nested, use_cache=use_cache)))
+        return
+
+    if generate:
+        n_projects, base = generate
+        meta, elapsed = prepare_fixture(base, n_projects, seed)
+        print(f"Fixture with {n_projects} candidates ({meta['with_config']} projects) at {base}/")
+        print(f"  HOME={meta['home']}  scan root: {', '.join(meta['roots'])}")
+        return
+
+    tmp = None
+    if fixture_dir is None:
+        tmp = tempfile.TemporaryDirectory(prefix="skill-issue-bench-")
+        fixture_dir = Path(tmp.name)
+
+    results = []
+    try:
+        for n in sizes:
+            base = fixture_dir / f"n{n}-seed{seed}"
+            if fmt == "text":
+                print(f"Preparing {n} candidates...", file=sys.stderr)
+            meta, fixture_seconds = prepare_fixture(base, n, seed)
+            result = run_size(base, jobs=jobs, nested=nested, use_cache=use_cache)
+            result["fixture_seconds"] = round(fixture_seconds, 3)
+            results.append(result)
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+    if fmt == "json":
+        print(json.dumps({
+            "depth": DEPTH,
+            "nested": nested,
+            "jobs": jobs,
+            "cache": use_cache,
+            "seed": seed,
+            "results": results,
+        }, indent=2))
+    else:
+        print(format_bench_report(results, jobs=jobs, nested=nested, use_cache=use_cache))
+
+
+if __name__ == "__main__":
+    main()
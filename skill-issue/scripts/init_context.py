@@ -7,11 +7,19 @@ Usage:
     init_context.py --project <path>         # Add a single project to existing registry
     init_context.py --non-interactive        # Accept all defaults, no prompts
     init_context.py --scan-root <path>       # Override default scan root
+    init_context.py --jobs N                 # Scan projects on N threads
+    init_context.py --depth N [--nested]     # Search N levels below each scan root
+    init_context.py --no-cache               # Ignore ~/.claude/context/scan-cache.json
+    init_context.py --format json|ndjson     # Non-interactive, machine-readable output
 
 Examples:
     init_context.py                          # Walk through setup
     init_context.py --project ~/repos/my-app # Add one project
     init_context.py --non-interactive --scan-root ~/projects
+
+--format json or ndjson implies --non-interactive. Project and issue records
+and a final summary record go to stdout (the same schema as
+audit_context.py --format); progress messages go to stderr.
 """
 
 import sys
@@ -21,9 +29,22 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from lib.scanner import scan_global_config, scan_projects, _scan_single_project, expand_path
-from lib.reporter import format_audit_report, detect_issues
-from lib.registry import write_registry
+from lib.scanner import (
+    scan_global_config,
+    scan_projects,
+    scan_project_paths,
+    expand_path,
+)
+from lib.reporter import (
+    FORMATS,
+    RecordStream,
+    detect_issues,
+    issue_counts,
+    issue_record,
+    project_record,
+)
+from lib.registry import load_registry, write_registry
+from lib.scan_cache import load_scan_cache, save_scan_cache, save_scan_walk
 
 
 def prompt_input(question, default=None):
@@ -35,9 +56,17 @@ def prompt_input(question, default=None):
         return input(f"  {question} > ").strip()
 
 
-def full_init(scan_roots=None, non_interactive=False):
-    """Full machine init — scan everything, write registry."""
+def full_init(scan_roots=None, non_interactive=False, jobs=None, depth=1, nested=False, use_cache=True,
+              stream=None):
+    """Full machine init — scan everything, write registry.
+
+    With a RecordStream, runs non-interactively, emits project and issue
+    records and sends progress messages to stderr.
+    """
     context_dir = expand_path("~/.claude/context")
+    out = sys.stderr if stream else sys.stdout
+    if stream:
+        non_interactive = True
 
     if context_dir.exists() and not non_interactive:
         print(f"Registry already exists at {context_dir}/")
@@ -50,7 +79,7 @@ def full_init(scan_roots=None, non_interactive=False):
     default_name = _default_machine_name()
     if non_interactive:
         machine_name = default_name
-        print(f"Step 1: Machine name: {machine_name}")
+        print(f"Step 1: Machine name: {machine_name}", file=out)
     else:
         print("\nStep 1: Machine Identity")
         machine_name = prompt_input("What should this machine be called?", default_name)
@@ -66,12 +95,19 @@ def full_init(scan_roots=None, non_interactive=False):
         root_input = prompt_input("Where do you keep your repos?", default_root)
         roots = [r.strip() for r in root_input.split(",")]
 
-    print(f"  Scanning: {', '.join(roots)}")
+    print(f"  Scanning: {', '.join(roots)}", file=out)
 
     # Step 3: Scan
-    print("\nStep 3: Scanning...")
+    print("\nStep 3: Scanning...", file=out)
+    cache = load_scan_cache(context_dir) if use_cache else None
     global_config = scan_global_config()
-    projects = scan_projects(roots)
+    listings = {}
+    candidates = []
+    projects = scan_projects(
+        roots, max_workers=jobs, depth=depth, nested=nested, cache=cache, listings=listings,
+        candidates=candidates,
+        on_project=(lambda p: stream.emit(project_record(p))) if stream else None,
+    )
 
     skills = global_config.get("skills", {})
     total_skills = (
@@ -81,9 +117,9 @@ def full_init(scan_roots=None, non_interactive=False):
     )
     mcp_count = sum(len(p.get("mcp_servers", [])) for p in projects)
 
-    print(f"  Found {len(projects)} projects with Claude config.")
-    print(f"  Found {mcp_count} MCP servers.")
-    print(f"  Found {total_skills} skills.")
+    print(f"  Found {len(projects)} projects with Claude config.", file=out)
+    print(f"  Found {mcp_count} MCP servers.", file=out)
+    print(f"  Found {total_skills} skills.", file=out)
 
     # Step 4: Review (interactive only)
     if not non_interactive and projects:
@@ -107,8 +143,18 @@ def full_init(scan_roots=None, non_interactive=False):
 
     # Step 5: Write registry
     step = "Step 5" if not non_interactive else "Step 4"
-    print(f"\n{step}: Writing Registry")
-    write_registry(str(context_dir), global_config, projects, machine_name=machine_name)
+    print(f"\n{step}: Writing Registry", file=out)
+    scan = {
+        "roots": [str(expand_path(r)) for r in roots],
+        "depth": depth,
+        "nested": nested,
+    }
+    stats = write_registry(str(context_dir), global_config, projects, machine_name=machine_name, scan=scan)
+    if cache is not None:
+        save_scan_cache(
+            context_dir, cache, keep_paths=[p["path"] for p in projects], walked=candidates
+        )
+        save_scan_walk(context_dir, {**scan, "children": listings, "candidates": candidates})
 
     # Count files written
     file_count = 1  # manifest
@@ -116,10 +162,26 @@ def full_init(scan_roots=None, non_interactive=False):
     file_count += len(list((context_dir / "mcps").glob("*.yaml")))
     file_count += len(list((context_dir / "machines").glob("*.yaml")))
 
-    print(f"  Created {file_count} registry files in {context_dir}/")
+    print(f"  Created {file_count} registry files in {context_dir}/", file=out)
 
     # Show issues
     issues = detect_issues(global_config, projects)
+    if stream:
+        for issue in issues:
+            stream.emit(issue_record(issue))
+        stream.close({
+            "command": "init",
+            "machine": machine_name,
+            "projects": len(projects),
+            "issues": issue_counts(issues),
+            "registry": {
+                "path": str(context_dir),
+                "written": stats["written"],
+                "unchanged": stats["unchanged"],
+                "removed": len(stats["removed"]),
+            },
+        })
+        return
     if issues:
         print(f"\n  Issues detected: {len(issues)}")
         for issue in issues[:5]:
@@ -131,64 +193,75 @@ def full_init(scan_roots=None, non_interactive=False):
     print(f"\nDone. Run `audit_context.py` anytime to refresh.")
 
 
-def project_init(project_path):
-    """Add a single project to an existing registry."""
+def project_init(project_path, jobs=None, use_cache=True, stream=None):
+    """Add a single project to an existing registry.
+
+    With a RecordStream, emits the project record and a summary instead of
+    the text confirmation; errors go to stderr.
+    """
     context_dir = expand_path("~/.claude/context")
+    out = sys.stderr if stream else sys.stdout
     project_path = expand_path(project_path)
 
     if not project_path.is_dir():
-        print(f"Error: {project_path} is not a directory")
+        print(f"Error: {project_path} is not a directory", file=out)
         sys.exit(1)
 
     if not context_dir.exists():
-        print(f"No registry found at {context_dir}/")
-        print("Run init_context.py first (without --project) to create the registry.")
+        print(f"No registry found at {context_dir}/", file=out)
+        print("Run init_context.py first (without --project) to create the registry.", file=out)
         sys.exit(1)
 
-    # Scan the project
-    from lib.scanner import _scan_single_project
-    project = _scan_single_project(project_path)
+    # Scan the project. Registered projects that have not changed come from
+    # the scan cache, so adding one project costs one scan.
+    cache = load_scan_cache(context_dir) if use_cache else None
+    found = scan_project_paths([project_path], cache=cache)
+    project = found[0] if found else None
 
     if not project:
-        print(f"No Claude config found in {project_path}")
-        print("Expected: .claude/ directory, CLAUDE.md, or .mcp.json")
+        print(f"No Claude config found in {project_path}", file=out)
+        print("Expected: .claude/ directory, CLAUDE.md, or .mcp.json", file=out)
         sys.exit(1)
 
     # Read existing registry and merge
     global_config = scan_global_config()
 
-    # Load existing projects from manifest
-    manifest_path = context_dir / "manifest.yaml"
-    existing_projects = []
-    if manifest_path.exists():
-        try:
-            import yaml
-            manifest = yaml.safe_load(manifest_path.read_text())
-            # Re-scan existing projects to get full data
-            existing_paths = [v.get("path", "") for v in (manifest.get("projects") or {}).values()]
-            for ep in existing_paths:
-                if ep and Path(ep).is_dir() and Path(ep).resolve() != project_path:
-                    scanned = _scan_single_project(Path(ep))
-                    if scanned:
-                        existing_projects.append(scanned)
-        except Exception:
-            pass
+    # Load existing projects from the registry
+    registry = load_registry(context_dir)
+    manifest = registry["manifest"] if registry else {}
+    # Re-scan existing projects to get full data
+    existing_paths = [v.get("path", "") for v in (manifest.get("projects") or {}).values()]
+    existing_paths = [
+        Path(ep) for ep in existing_paths
+        if ep and Path(ep).is_dir() and Path(ep).resolve() != project_path
+    ]
+    existing_projects = scan_project_paths(existing_paths, max_workers=jobs, cache=cache)
 
     # Add the new project
     all_projects = existing_projects + [project]
     all_projects = sorted(all_projects, key=lambda p: p["name"])
 
-    # Re-read machine name from existing manifest
-    machine_name = None
-    if manifest_path.exists():
-        try:
-            import yaml
-            manifest = yaml.safe_load(manifest_path.read_text())
-            machine_name = manifest.get("machine")
-        except Exception:
-            pass
-
-    write_registry(str(context_dir), global_config, all_projects, machine_name=machine_name)
+    # Keep the machine name from the existing manifest
+    machine_name = manifest.get("machine")
+
+    stats = write_registry(str(context_dir), global_config, all_projects, machine_name=machine_name)
+    if cache is not None:
+        save_scan_cache(context_dir, cache, keep_paths=[p["path"] for p in all_projects])
+
+    if stream:
+        stream.emit(project_record(project))
+        stream.close({
+            "command": "init-project",
+            "project": project["name"],
+            "projects": len(all_projects),
+            "registry": {
+                "path": str(context_dir),
+                "written": stats["written"],
+                "unchanged": stats["unchanged"],
+                "removed": len(stats["removed"]),
+            },
+        })
+        return
 
     parts = []
     if project.get("settings"):
@@ -222,6 +295,11 @@ def main():
     scan_roots = []
     project_path = None
     non_interactive = False
+    jobs = None
+    depth = 1
+    nested = False
+    use_cache = True
+    fmt = "text"
 
     i = 0
     while i < len(args):
@@ -234,6 +312,32 @@ def main():
         elif args[i] == "--non-interactive":
             non_interactive = True
             i += 1
+        elif args[i] == "--jobs" and i + 1 < len(args):
+            try:
+                jobs = int(args[i + 1])
+            except ValueError:
+                print(f"--jobs expects a number, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--depth" and i + 1 < len(args):
+            try:
+                depth = int(args[i + 1])
+            except ValueError:
+                print(f"--depth expects a number, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--nested":
+            nested = True
+            i += 1
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
+        elif args[i] == "--format" and i + 1 < len(args):
+            fmt = args[i + 1]
+            if fmt not in FORMATS:
+                print(f"--format must be one of: {', '.join(FORMATS)}")
+                sys.exit(1)
+            i += 2
         elif args[i] in ("-h", "--help"):
             print(__doc__)
             sys.exit(0)
@@ -242,10 +346,20 @@ def main():
             print(__doc__)
             sys.exit(1)
 
+    stream = RecordStream(fmt) if fmt != "text" else None
+
     if project_path:
-        project_init(project_path)
+        project_init(project_path, jobs=jobs, use_cache=use_cache, stream=stream)
     else:
-        full_init(scan_roots=scan_roots or None, non_interactive=non_interactive)
+        full_init(
+            scan_roots=scan_roots or None,
+            non_interactive=non_interactive,
+            jobs=jobs,
+            depth=depth,
+            nested=nested,
+            use_cache=use_cache,
+            stream=stream,
+        )
 
 
 if __name__ == "__main__":
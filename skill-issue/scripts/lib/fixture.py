@@ -0,0 +1,202 @@
+"""
+Synthetic ~/.claude and scan roots for benchmarking the context scripts.
+
+generate_fixture() builds, under one base directory:
+
+    home/.claude/          settings.json, commands/, and skills that are
+                           local, packaged (*.skill), symlinked (one broken),
+                           some with modes/*.md carrying cwd_match
+    home/repos/            N projects: most directly under the root, a share
+                           grouped under org-*/ (depth 2), some nested inside
+                           other projects, symlinks to existing projects,
+                           plain directories without config, node_modules and
+                           gitignored noise
+    skill-src/             targets of the symlinked skills
+
+Projects get a random mix of .git, CLAUDE.md, .claude/settings.json hooks
+(some pointing at missing scripts), .claude/hooks scripts, project skills,
+empty .claude/ dirs, and .mcp.json servers drawn from a shared pool so the
+duplicate, conflict and secrets rules have work to do. Output is
+deterministic for a given seed.
+"""
+
+import json
+import random
+from pathlib import Path
+
+# Share of candidate directories with each property
+GROUPED = 0.3       # placed under an org-*/ directory (depth 2)
+NESTED = 0.03       # nested inside another project
+SYMLINKED = 0.02    # extra symlink pointing at an existing project
+PLAIN = 0.1         # directory with no Claude config at all
+
+MCP_POOL = [
+    {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-filesystem", "."]},
+    {"command": "npx", "args": ["-y", "@modelcontextprotocol/server-github"],
+     "env": {"GITHUB_TOKEN": "x"}},
+    {"command": "uvx", "args": ["mcp-server-git"]},
+    {"command": "docker", "args": ["run", "-i", "--rm", "mcp/postgres"],
+     "env": {"DATABASE_URL": "x", "PGPASSWORD": "x"}},
+    {"url": "https://mcp.example.com/sse"},
+    {"command": "node", "args": ["tools/mcp.js"], "env": {"LOG_LEVEL": "info"}},
+]
+MCP_NAMES = ["filesystem", "github", "git", "postgres", "remote", "tools", "db", "search"]
+
+HOOK_EVENTS = ["PreToolUse", "PostToolUse", "Stop", "UserPromptSubmit"]
+
+MARKDOWN_BODY = "\n".join(
+    f"- Step {i}: keep the change small, run the checks, and write down what moved."
+    for i in range(60)
+)
+
+
+def generate_fixture(base, n_projects, seed=0):
+    """Build a fixture with n_projects candidate directories under base.
+
+    Returns {"home", "claude_home", "roots", "projects"} where projects is
+    the list of project directories created (symlinks excluded).
+    """
+    rng = random.Random(seed)
+    base = Path(base).resolve()
+    home = base / "home"
+    root = home / "repos"
+    root.mkdir(parents=True, exist_ok=True)
+
+    projects = []
+    n_orgs = max(1, n_projects // 100)
+    for i in range(n_projects):
+        name = f"p{i:05d}"
+        roll = rng.random()
+        if projects and roll < NESTED:
+            path = Path(rng.choice(projects)) / "packages" / name
+        elif roll < NESTED + GROUPED:
+            path = root / f"org-{rng.randrange(n_orgs):03d}" / name
+        else:
+            path = root / name
+        path.mkdir(parents=True, exist_ok=True)
+        if rng.random() >= PLAIN:
+            _write_project(path, rng)
+            projects.append(str(path))
+
+    for i in range(int(n_projects * SYMLINKED)):
+        if projects:
+            link = root / f"link-{i:04d}"
+            if not link.exists():
+                link.symlink_to(rng.choice(projects), target_is_directory=True)
+
+    _write_noise(root)
+    claude_home = _write_claude_home(home, base / "skill-src", projects, rng, n_projects)
+
+    return {
+        "home": str(home),
+        "claude_home": str(claude_home),
+        "roots": [str(root)],
+        "projects": projects,
+    }
+
+
+def _write_project(path, rng):
+    if rng.random() < 0.8:
+        (path / ".git").mkdir(exist_ok=True)
+    if rng.random() < 0.6:
+        (path / "CLAUDE.md").write_text(f"# {path.name}\n\n{MARKDOWN_BODY}\n")
+
+    if rng.random() < 0.7:
+        claude_dir = path / ".claude"
+        claude_dir.mkdir(exist_ok=True)
+        if rng.random() < 0.05:
+            return  # empty .claude/ for the stale rule
+
+        hooks_dir = claude_dir / "hooks"
+        scripts = []
+        if rng.random() < 0.3:
+            hooks_dir.mkdir(exist_ok=True)
+            for j in range(rng.randint(1, 3)):
+                script = hooks_dir / f"hook{j}.sh"
+                script.write_text("#!/bin/sh\nexit 0\n")
+                scripts.append(script.name)
+
+        if rng.random() < 0.5:
+            hooks = {}
+            for event in rng.sample(HOOK_EVENTS, rng.randint(1, 2)):
+                script = rng.choice(scripts) if scripts and rng.random() < 0.8 else "missing.sh"
+                hooks[event] = [{
+                    "matcher": rng.choice(["*", "Bash", "Edit|Write"]),
+                    "command": f"$CLAUDE_PROJECT_DIR/.claude/hooks/{script}",
+                }]
+            settings = {"permissions": {"allow": ["Bash(git status)"]}, "hooks": hooks}
+            (claude_dir / "settings.json").write_text(json.dumps(settings, indent=2))
+
+        if rng.random() < 0.3:
+            for j in range(rng.randint(1, 3)):
+                skill_dir = claude_dir / "skills" / f"local-skill-{j}"
+                skill_dir.mkdir(parents=True, exist_ok=True)
+                (skill_dir / "SKILL.md").write_text(_skill_md(f"local-skill-{j}"))
+
+    if rng.random() < 0.4:
+        servers = {}
+        for name in rng.sample(MCP_NAMES, rng.randint(1, 3)):
+            config = json.loads(json.dumps(rng.choice(MCP_POOL)))
+            if rng.random() < 0.1 and "args" in config:
+                config["args"].append(f"--port={rng.randint(3000, 3010)}")
+            servers[name] = config
+        (path / ".mcp.json").write_text(json.dumps({"mcpServers": servers}, indent=2))
+
+
+def _write_noise(root):
+    """Directories the walker should prune without descending."""
+    pkg = root / "node_modules" / "some-package"
+    (pkg / ".claude").mkdir(parents=True, exist_ok=True)
+    (pkg / "CLAUDE.md").write_text("# vendored\n")
+    (root / ".gitignore").write_text("scratch/\n")
+    scratch = root / "scratch" / "tmp-project"
+    scratch.mkdir(parents=True, exist_ok=True)
+    (scratch / "CLAUDE.md").write_text("# ignored\n")
+
+
+def _write_claude_home(home, skill_src, projects, rng, n_projects):
+    claude_home = home / ".claude"
+    skills_dir = claude_home / "skills"
+    skills_dir.mkdir(parents=True, exist_ok=True)
+    (claude_home / "settings.json").write_text(json.dumps(
+        {"permissions": {"defaultMode": "acceptEdits"}, "model": "default"}, indent=2
+    ))
+    commands = claude_home / "commands"
+    commands.mkdir(exist_ok=True)
+    for i in range(5):
+        (commands / f"command-{i}.md").write_text(f"Run command {i}.\n")
+
+    n_skills = max(10, n_projects // 50)
+    home_prefix = str(home)
+    for i in range(n_skills):
+        name = f"skill-{i:04d}"
+        kind = rng.random()
+        if kind < 0.1:
+            (skills_dir / f"{name}.skill").write_bytes(b"PK\x05\x06" + b"\0" * 18)
+            continue
+        if kind < 0.4:
+            skill_path = skill_src / name
+            (skills_dir / name).symlink_to(skill_path, target_is_directory=True)
+        else:
+            skill_path = skills_dir / name
+        skill_path.mkdir(parents=True, exist_ok=True)
+        (skill_path / "SKILL.md").write_text(_skill_md(name))
+
+        if rng.random() < 0.3:
+            modes = skill_path / "modes"
+            modes.mkdir(exist_ok=True)
+            for j in range(rng.randint(2, 6)):
+                if projects and rng.random() < 0.85:
+                    target = "~" + rng.choice(projects)[len(home_prefix):]
+                else:
+                    target = f"~/repos/gone-{i}-{j}"
+                (modes / f"mode-{j}.md").write_text(
+                    f"---\nname: mode-{j}\ncwd_match: {target}\n---\n\n{MARKDOWN_BODY}\n"
+                )
+
+    (skills_dir / "broken-link").symlink_to(skill_src / "does-not-exist", target_is_directory=True)
+    return claude_home
+
+
+def _skill_md(name):
+    return f"---\nname: {name}\ndescription: Synthetic skill {name}.\n---\n\n# {name}\n\n{MARKDOWN_BODY}\n"
@@ -0,0 +1,187 @@
+"""
+Bounded reads of YAML frontmatter from SKILL.md and mode files.
+
+Only the opening `---` line through the closing `---` line is read, never
+the markdown body, and reads stop after max_bytes. Frontmatter is parsed
+with the C YAML loader when PyYAML has one, and results are cached per
+path until the file's mtime or size changes, so scanning many skills with
+many modes costs one stat per file once warm.
+"""
+
+import os
+import threading
+
+try:
+    import yaml
+    _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    yaml = None
+
+MAX_FRONTMATTER_BYTES = 64 * 1024
+
+# Mode files keep cwd_match in the body (see references/mode-template.md),
+# near the top; a line scan gives up after this many bytes
+MAX_SCAN_BYTES = 16 * 1024
+
+# Files are read unbuffered in chunks of this size, so a short frontmatter
+# block costs one read() however long the body is
+CHUNK_SIZE = 4096
+
+_cache = {}
+_field_cache = {}
+_cache_lock = threading.Lock()
+
+
+class FrontmatterError(ValueError):
+    """The file has no usable frontmatter. str(e) is a user-facing message."""
+
+
+class Frontmatter:
+    """Parsed frontmatter plus where the body starts."""
+
+    __slots__ = ("data", "end", "lines")
+
+    def __init__(self, data, end, lines):
+        self.data = data    # dict; shared through the cache, do not mutate
+        self.end = end      # byte offset of the first body line
+        self.lines = lines  # lines read, including both --- lines
+
+
+def read_frontmatter(path, max_bytes=MAX_FRONTMATTER_BYTES):
+    """Read and parse the frontmatter block at the top of path.
+
+    Raises FrontmatterError when there is no frontmatter, the block is not
+    closed within max_bytes, or it is not a YAML mapping. OSError propagates.
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size, max_bytes)
+    with _cache_lock:
+        hit = _cache.get(path)
+    if hit and hit[0] == key:
+        if isinstance(hit[1], FrontmatterError):
+            raise hit[1]
+        return hit[1]
+
+    try:
+        result = _read(path, max_bytes)
+    except FrontmatterError as e:
+        result = e
+    with _cache_lock:
+        _cache[path] = (key, result)
+    if isinstance(result, FrontmatterError):
+        raise result
+    return result
+
+
+def extract_field(path, field, max_bytes=MAX_SCAN_BYTES):
+    """Return the first `field: value` line's value from the top of path.
+
+    Frontmatter wins when the file has it. Otherwise lines are scanned
+    until the field is found or max_bytes have been read; returns None if
+    the field is not there or the file cannot be read. Cached like
+    read_frontmatter().
+    """
+    path = os.fspath(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size, max_bytes)
+    with _cache_lock:
+        hit = _field_cache.get((path, field))
+    if hit and hit[0] == key:
+        return hit[1]
+
+    value = _extract(path, field, max_bytes)
+    with _cache_lock:
+        _field_cache[(path, field)] = (key, value)
+    return value
+
+
+def _extract(path, field, max_bytes):
+    try:
+        data = read_frontmatter(path).data
+        if field in data:
+            value = data[field]
+            return None if value is None else str(value)
+    except FrontmatterError:
+        pass
+    except OSError:
+        return None
+
+    prefix = f"{field}:".encode()
+    try:
+        with open(path, "rb", buffering=0) as f:
+            for line, _ in _lines(f, max_bytes):
+                stripped = line.strip()
+                if stripped.startswith(prefix):
+                    return stripped[len(prefix):].strip().decode("utf-8", "replace")
+    except OSError:
+        pass
+    return None
+
+
+def _lines(f, max_bytes):
+    """Yield (line, end offset) from an unbuffered file, reading at most max_bytes."""
+    buf = b""
+    offset = 0
+    read = 0
+    while True:
+        nl = buf.find(b"\n")
+        if nl < 0:
+            chunk = f.read(min(CHUNK_SIZE, max_bytes - read)) if read < max_bytes else b""
+            if not chunk:
+                if buf:
+                    yield buf, offset + len(buf)
+                return
+            read += len(chunk)
+            buf += chunk
+            continue
+        line, buf = buf[:nl + 1], buf[nl + 1:]
+        offset += len(line)
+        yield line, offset
+
+
+def _read(path, max_bytes):
+    with open(path, "rb", buffering=0) as f:
+        lines = _lines(f, max_bytes)
+        first, end = next(lines, (b"", 0))
+        if not first.startswith(b"---"):
+            raise FrontmatterError("No YAML frontmatter found")
+        if first.rstrip(b"\r\n") != b"---":
+            raise FrontmatterError("Invalid frontmatter format")
+
+        block = []
+        count = 1
+        for line, end in lines:
+            count += 1
+            if line.startswith(b"---"):
+                break
+            block.append(line)
+        else:
+            raise FrontmatterError("Invalid frontmatter format")
+
+    try:
+        text = b"".join(block).decode("utf-8")
+    except UnicodeDecodeError:
+        raise FrontmatterError("Frontmatter is not valid UTF-8")
+    data = _parse(text)
+    if not isinstance(data, dict):
+        raise FrontmatterError("Frontmatter must be a YAML dictionary")
+    return Frontmatter(data, end, count)
+
+
+def _parse(text):
+    if yaml:
+        try:
+            return yaml.load(text, Loader=_SafeLoader)
+        except yaml.YAMLError as e:
+            raise FrontmatterError(f"Invalid YAML in frontmatter: {e}")
+    # Without PyYAML, accept flat `key: value` lines
+    data = {}
+    for line in text.splitlines():
+        if ":" in line and not line.startswith((" ", "\t", "#")):
+            key, value = line.split(":", 1)
+            data[key.strip()] = value.strip() or None
+    return data
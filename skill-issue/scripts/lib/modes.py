@@ -0,0 +1,176 @@
+"""
+Resolve which mode of each skill applies to a working directory.
+
+Every skill under ~/.claude/skills may have modes/*.md files carrying a
+cwd_match path prefix. build_mode_index() puts all of them in one prefix
+trie keyed by path component; resolve_modes() walks a cwd down that trie
+once and returns, per skill, the mode with the longest matching prefix, in
+O(path depth) whatever the number of skills and modes.
+
+The trie is persisted to ~/.claude/context/mode-index.json together with a
+stamp of the skills directory, each skill's modes/ directory and each mode
+file (mtime and size). load_mode_index() rebuilds when any of them changed,
+so adding, removing or editing a mode takes effect on the next call.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from .frontmatter import extract_field
+
+INDEX_FILE = "mode-index.json"
+INDEX_VERSION = 1
+
+
+def _components(path):
+    return [p for p in os.path.realpath(os.path.expanduser(str(path))).split(os.sep) if p]
+
+
+def _stat_key(st):
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _walk_modes(skills_dir):
+    """Yield (skill, modes_dir, modes_dir stat or None, [mode file DirEntry]) per skill."""
+    try:
+        entries = sorted(os.scandir(skills_dir), key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.startswith(".") or entry.name.endswith(".skill"):
+            continue
+        modes_dir = os.path.join(entry.path, "modes")
+        try:
+            st = os.stat(modes_dir)
+            files = sorted(
+                (f for f in os.scandir(modes_dir) if f.name.endswith(".md")),
+                key=lambda f: f.name,
+            )
+        except OSError:
+            yield entry.name, modes_dir, None, []
+            continue
+        yield entry.name, modes_dir, st, files
+
+
+def mode_stamp(skills_dir):
+    """Stat everything a mode index depends on, as a JSON-able dict."""
+    try:
+        stamp = {str(skills_dir): _stat_key(os.stat(skills_dir))}
+    except OSError:
+        return {str(skills_dir): None}
+    for _skill, modes_dir, st, files in _walk_modes(skills_dir):
+        stamp[modes_dir] = _stat_key(st) if st else None
+        for f in files:
+            try:
+                stamp[f.path] = _stat_key(f.stat())
+            except OSError:
+                stamp[f.path] = None
+    return stamp
+
+
+def build_mode_index(claude_home="~/.claude"):
+    """Scan every skill's modes/ and return the index dict (trie plus stamp)."""
+    skills_dir = os.path.join(os.path.expanduser(str(claude_home)), "skills")
+    stamp = mode_stamp(skills_dir)
+    trie = {}
+    count = 0
+    for skill, _modes_dir, _st, files in _walk_modes(skills_dir):
+        for f in files:
+            cwd_match = extract_field(f.path, "cwd_match")
+            if not cwd_match:
+                continue
+            node = trie
+            for part in _components(cwd_match):
+                node = node.setdefault("c", {}).setdefault(part, {})
+            node.setdefault("m", {}).setdefault(skill, []).append({
+                "mode": f.name[:-len(".md")],
+                "cwd_match": cwd_match,
+                "file": f.path,
+            })
+            count += 1
+    return {
+        "version": INDEX_VERSION,
+        "skills_dir": skills_dir,
+        "stamp": stamp,
+        "modes": count,
+        "trie": trie,
+    }
+
+
+def load_mode_index(claude_home="~/.claude", context_dir="~/.claude/context", rebuild=False):
+    """Return the persisted mode index, rebuilding and saving it if stale.
+
+    context_dir=None skips persistence entirely.
+    """
+    skills_dir = os.path.join(os.path.expanduser(str(claude_home)), "skills")
+    path = Path(os.path.expanduser(str(context_dir))) / INDEX_FILE if context_dir else None
+
+    if path and not rebuild:
+        try:
+            index = json.loads(path.read_text())
+        except (OSError, ValueError):
+            index = None
+        if (isinstance(index, dict)
+                and index.get("version") == INDEX_VERSION
+                and index.get("skills_dir") == skills_dir
+                and index.get("stamp") == mode_stamp(skills_dir)):
+            return index
+
+    index = build_mode_index(claude_home)
+    if path:
+        _save(path, index)
+    return index
+
+
+def _save(path, index):
+    """Write the index atomically; an unwritable context dir is not an error."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{INDEX_FILE}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def resolve_modes(index, cwd, skill=None):
+    """Return the longest-matching modes for cwd, one record per skill.
+
+    Each record is {"skill", "mode", "cwd_match", "file", "candidates"}.
+    When several modes of a skill share the longest prefix, "mode",
+    "cwd_match" and "file" are None and "candidates" lists them all.
+    Skills with no matching mode are left out.
+    """
+    best = {}
+    node = index["trie"]
+    parts = _components(cwd)
+    for i in range(len(parts) + 1):
+        for name, modes in node.get("m", {}).items():
+            if skill is None or name == skill:
+                best[name] = modes
+        if i == len(parts):
+            break
+        node = node.get("c", {}).get(parts[i])
+        if node is None:
+            break
+
+    results = []
+    for name in sorted(best):
+        modes = best[name]
+        unique = modes[0] if len(modes) == 1 else {}
+        results.append({
+            "skill": name,
+            "mode": unique.get("mode"),
+            "cwd_match": unique.get("cwd_match"),
+            "file": unique.get("file"),
+            "candidates": [m["mode"] for m in modes],
+        })
+    return results
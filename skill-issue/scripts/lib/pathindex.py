@@ -0,0 +1,97 @@
+"""
+Path trie for ancestor/descendant queries over project paths.
+
+Paths are split into components, so /repos/app is never treated as a parent
+of /repos/app2. Lookups cost O(path depth) regardless of how many paths are
+indexed.
+"""
+
+import os
+
+
+class _Node:
+    __slots__ = ("children", "value", "has_value", "count")
+
+    def __init__(self):
+        self.children = {}
+        self.value = None
+        self.has_value = False
+        self.count = 0  # indexed paths at or below this node
+
+
+def _parts(path):
+    return [p for p in os.path.normpath(str(path)).split(os.sep) if p]
+
+
+class PathIndex:
+    """Map of filesystem paths to values, queryable by ancestry."""
+
+    def __init__(self, items=None):
+        self._root = _Node()
+        for path, value in items or []:
+            self.add(path, value)
+
+    def add(self, path, value=None):
+        """Index path with value (re-adding a path replaces its value)."""
+        parts = _parts(path)
+        node = self._root
+        trail = [node]
+        for part in parts:
+            node = node.children.setdefault(part, _Node())
+            trail.append(node)
+        if not node.has_value:
+            for n in trail:
+                n.count += 1
+        node.value = value
+        node.has_value = True
+
+    def _find(self, path):
+        node = self._root
+        for part in _parts(path):
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, path):
+        node = self._find(path)
+        return node is not None and node.has_value
+
+    def ancestors(self, path):
+        """Values of indexed paths strictly above path, nearest first."""
+        found = []
+        node = self._root
+        parts = _parts(path)
+        for part in parts:
+            if node.has_value:
+                found.append(node.value)
+            node = node.children.get(part)
+            if node is None:
+                break
+        return found[::-1]
+
+    def nearest_ancestor(self, path, default=None):
+        """Value of the closest indexed path strictly above path."""
+        found = self.ancestors(path)
+        return found[0] if found else default
+
+    def count_descendants(self, path):
+        """Number of indexed paths strictly below path."""
+        node = self._find(path)
+        if node is None:
+            return 0
+        return node.count - (1 if node.has_value else 0)
+
+    def descendants(self, path):
+        """Values of indexed paths strictly below path, in path order."""
+        node = self._find(path)
+        if node is None:
+            return []
+        found = []
+        stack = [node.children[k] for k in sorted(node.children, reverse=True)]
+        while stack:
+            n = stack.pop()
+            if n.has_value:
+                found.append(n.value)
+            stack.extend(n.children[k] for k in sorted(n.children, reverse=True))
+        return found
@@ -2,37 +2,57 @@
 Context registry read/write operations.
 
 Handles generating and reading YAML registry files under ~/.claude/context/.
+
+Alongside the YAML files, write_registry emits index.json: the manifest plus
+every project and MCP record in one compact JSON document. Readers load the
+index via load_registry() and only fall back to the YAML files when the
+index is missing, outdated, or manifest.yaml was edited after it was built.
+
+MCP records are content-addressed: mcps/<fingerprint>.yaml holds one
+distinct server config (see scanner.mcp_fingerprint) with every name and
+project using it, and the manifest maps each server name to its
+fingerprints.
+
+Every file is serialized in memory and compared with what is on disk; only
+files whose bytes differ are rewritten, each through a temp file and rename.
 """
 
+import json
 import os
 import socket
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .scanner import file_record, tracked_files
+
 try:
     import yaml
+    _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     yaml = None
 
+INDEX_FILE = "index.json"
+INDEX_FORMAT = "skill-issue-registry"
+INDEX_VERSION = 2
+
 
 def _yaml_dump(data):
     """Dump data to YAML string, falling back to manual formatting if PyYAML not available."""
     if yaml:
         return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
     # Minimal fallback — just JSON-ish output
-    import json
     return json.dumps(data, indent=2, default=str)
 
 
 def _yaml_load(text):
     """Load YAML from string."""
     if yaml:
-        return yaml.safe_load(text)
-    import json
+        return yaml.load(text, Loader=_SafeLoader)
     return json.loads(text)
 
 
-def write_registry(context_dir, global_config, projects, machine_name=None):
+def write_registry(context_dir, global_config, projects, machine_name=None, scan=None):
     """Write the full context registry to disk.
 
     Args:
@@ -40,6 +60,16 @@ def write_registry(context_dir, global_config, projects, machine_name=None):
         global_config: Dict from scanner.scan_global_config()
         projects: List of dicts from scanner.scan_projects()
         machine_name: Name for this machine (default: hostname)
+        scan: {"roots", "depth", "nested"} used to find the projects, recorded
+            in the manifest so sync knows where to look (default: keep the
+            previous manifest's)
+
+    Project and MCP record files that no longer correspond to anything in
+    the registry are deleted. The manifest's last_updated only moves when
+    the registry content changes, so an unchanged audit rewrites nothing.
+
+    Returns:
+        Dict with "written" and "unchanged" file counts and "removed" paths.
     """
     context_dir = Path(context_dir)
     context_dir.mkdir(parents=True, exist_ok=True)
@@ -49,39 +79,159 @@ def write_registry(context_dir, global_config, projects, machine_name=None):
 
     machine_name = machine_name or _default_machine_name()
     now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    previous = load_registry(context_dir) or {}
+    previous_projects = previous.get("projects") or {}
 
-    # Collect all MCP servers across projects
+    # Collect all MCP servers across projects, keyed by config fingerprint
     all_mcps = {}
     for proj in projects:
         for mcp in proj.get("mcp_servers", []):
-            name = mcp["name"]
-            if name not in all_mcps:
-                all_mcps[name] = {"config": mcp, "projects": []}
-            all_mcps[name]["projects"].append(proj["name"])
+            fp = mcp.get("fingerprint") or mcp["name"]
+            info = all_mcps.setdefault(fp, {"config": mcp, "names": [], "projects": []})
+            if mcp["name"] not in info["names"]:
+                info["names"].append(mcp["name"])
+            if proj["name"] not in info["projects"]:
+                info["projects"].append(proj["name"])
+
+    stats = {"written": 0, "unchanged": 0, "removed": []}
+
+    def write(path, content):
+        stats["written" if _write_if_changed(path, content) else "unchanged"] += 1
 
     # Write manifest.yaml
-    manifest = _build_manifest(global_config, projects, all_mcps, machine_name, now)
-    _write_yaml(context_dir / "manifest.yaml", manifest,
-                header=f"Context registry manifest\nGenerated by: skill-issue audit\nLast updated: {now}")
+    prev_manifest = previous.get("manifest")
+    if scan is None and prev_manifest:
+        scan = prev_manifest.get("scan")
+    manifest = _build_manifest(global_config, projects, all_mcps, machine_name, now, scan)
+    if prev_manifest and {**prev_manifest, "last_updated": now} == manifest:
+        manifest["last_updated"] = prev_manifest.get("last_updated", now)
+    write(context_dir / "manifest.yaml", _render_yaml(
+        manifest,
+        header=f"Context registry manifest\nGenerated by: skill-issue audit\nLast updated: {manifest['last_updated']}",
+    ))
 
     # Write project files
+    project_records = {}
+    keep = set()
     for proj in projects:
-        proj_data = _build_project_record(proj, global_config)
-        slug = proj["name"].replace("/", "-").replace(" ", "-").lower()
-        _write_yaml(context_dir / "projects" / f"{slug}.yaml", proj_data)
+        prev_files = (previous_projects.get(proj["name"]) or {}).get("files")
+        proj_data = _build_project_record(proj, global_config, prev_files)
+        path = context_dir / "projects" / f"{_slug(proj['name'])}.yaml"
+        write(path, _render_yaml(proj_data))
+        keep.add(path)
+        project_records[proj["name"]] = proj_data
 
     # Write MCP files
-    for mcp_name, mcp_info in all_mcps.items():
-        mcp_data = _build_mcp_record(mcp_name, mcp_info)
-        slug = mcp_name.replace("/", "-").replace(" ", "-").lower()
-        _write_yaml(context_dir / "mcps" / f"{slug}.yaml", mcp_data)
+    mcp_records = {}
+    for fp, mcp_info in sorted(all_mcps.items()):
+        mcp_data = _build_mcp_record(fp, mcp_info)
+        path = context_dir / "mcps" / f"{fp}.yaml"
+        write(path, _render_yaml(mcp_data))
+        keep.add(path)
+        mcp_records[fp] = mcp_data
 
-    # Write machine file
+    # Write machine file (other machines' files are left alone)
     machine_data = _build_machine_record(machine_name, global_config, projects)
-    _write_yaml(context_dir / "machines" / f"{machine_name}.yaml", machine_data)
+    write(context_dir / "machines" / f"{machine_name}.yaml", _render_yaml(machine_data))
+
+    # Drop records for projects and MCPs that are gone
+    for subdir in ("projects", "mcps"):
+        for path in sorted((context_dir / subdir).glob("*.yaml")):
+            if path not in keep:
+                path.unlink()
+                stats["removed"].append(str(path))
+
+    # Compiled index last, stamped with the manifest it was built from
+    write(context_dir / INDEX_FILE, _render_index(context_dir, manifest, project_records, mcp_records, machine_data))
+    return stats
+
+
+def load_registry(context_dir):
+    """Load the whole registry as {"manifest", "projects", "mcps"}.
+
+    "mcps" is keyed by config fingerprint; manifest["mcps"] maps server
+    names to their fingerprints.
+
+    Prefers index.json; falls back to reading the YAML files. Returns None
+    when there is no registry (or the manifest cannot be read).
+    """
+    context_dir = Path(context_dir)
+    index = _load_index(context_dir)
+    if index:
+        return {
+            "manifest": index["manifest"],
+            "projects": index.get("projects") or {},
+            "mcps": index.get("mcps") or {},
+        }
+
+    try:
+        manifest = _yaml_load((context_dir / "manifest.yaml").read_text())
+    except Exception:
+        return None
+    if not isinstance(manifest, dict):
+        return None
+
+    projects = {}
+    for name in manifest.get("projects") or {}:
+        record = _load_record(context_dir / "projects" / f"{_slug(name)}.yaml")
+        if record is not None:
+            projects[name] = record
+    mcps = {}
+    for info in (manifest.get("mcps") or {}).values():
+        for fp in (info or {}).get("fingerprints") or []:
+            if fp not in mcps:
+                record = _load_record(context_dir / "mcps" / f"{fp}.yaml")
+                if record is not None:
+                    mcps[fp] = record
+    return {"manifest": manifest, "projects": projects, "mcps": mcps}
+
+
+def _load_index(context_dir):
+    """Return the parsed index if it is current, else None."""
+    try:
+        index = json.loads((context_dir / INDEX_FILE).read_text())
+        manifest_mtime = (context_dir / "manifest.yaml").stat().st_mtime_ns
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict):
+        return None
+    if index.get("format") != INDEX_FORMAT or index.get("version") != INDEX_VERSION:
+        return None
+    # A hand-edited manifest.yaml wins over the index built before the edit
+    if index.get("manifest_mtime_ns") != manifest_mtime or not index.get("manifest"):
+        return None
+    return index
 
 
-def _build_manifest(global_config, projects, all_mcps, machine_name, now):
+def _load_record(path):
+    """Load one YAML record file. Returns dict or None."""
+    try:
+        record = _yaml_load(Path(path).read_text())
+    except Exception:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _render_index(context_dir, manifest, projects, mcps, machine):
+    """Serialize index.json, stamped with the current manifest.yaml mtime."""
+    index = {
+        "format": INDEX_FORMAT,
+        "version": INDEX_VERSION,
+        "manifest_mtime_ns": (context_dir / "manifest.yaml").stat().st_mtime_ns,
+        "manifest": manifest,
+        "projects": projects,
+        "mcps": mcps,
+        "machine": machine,
+    }
+    return json.dumps(index, separators=(",", ":"), default=str)
+
+
+def _slug(name):
+    """File name stem for a project or MCP record."""
+    return name.replace("/", "-").replace(" ", "-").lower()
+
+
+def _build_manifest(global_config, projects, all_mcps, machine_name, now, scan=None):
     """Build the manifest.yaml data structure."""
     skills = global_config.get("skills", {})
     symlinked = [s["name"] for s in skills.get("symlinked", [])]
@@ -89,7 +239,7 @@ def _build_manifest(global_config, projects, all_mcps, machine_name, now):
     local = skills.get("local", [])
     with_modes = skills.get("with_modes", {})
 
-    return {
+    manifest = {
         "version": 1,
         "machine": machine_name,
         "last_updated": now,
@@ -104,10 +254,7 @@ def _build_manifest(global_config, projects, all_mcps, machine_name, now):
             p["name"]: {"path": p["path"]}
             for p in projects
         },
-        "mcps": {
-            name: {"projects": info["projects"]}
-            for name, info in all_mcps.items()
-        },
+        "mcps": _mcp_name_index(all_mcps),
         "skills": {
             "count": len(symlinked) + len(packaged) + len(local),
             "symlinked": symlinked,
@@ -118,10 +265,28 @@ def _build_manifest(global_config, projects, all_mcps, machine_name, now):
             },
         },
     }
+    if scan:
+        manifest["scan"] = {
+            "roots": [str(r) for r in scan.get("roots") or []],
+            "depth": scan.get("depth", 1),
+            "nested": bool(scan.get("nested")),
+        }
+    return manifest
 
 
-def _build_project_record(proj, global_config):
-    """Build a project YAML record."""
+def _build_project_record(proj, global_config, previous_files=None):
+    """Build a project YAML record.
+
+    previous_files is the "files" section of the record being replaced;
+    hashes for files whose size and mtime are unchanged are carried over.
+    """
+    previous_files = previous_files or {}
+    files = {}
+    for label, path in tracked_files(proj).items():
+        record = file_record(path, previous_files.get(label))
+        if record:
+            files[label] = record
+
     return {
         "name": proj["name"],
         "path": proj["path"],
@@ -133,16 +298,36 @@ def _build_project_record(proj, global_config):
         "skills": proj.get("skills", []) or None,
         "mcp": proj.get("mcp"),
         "mcp_servers": [s["name"] for s in proj.get("mcp_servers", [])] or None,
+        "mcp_fingerprints": {
+            s["name"]: s["fingerprint"] for s in proj.get("mcp_servers", []) if s.get("fingerprint")
+        } or None,
+        "files": files or None,
     }
 
 
-def _build_mcp_record(name, mcp_info):
-    """Build an MCP server YAML record."""
+def _mcp_name_index(all_mcps):
+    """Map each MCP server name to the fingerprints and projects using it."""
+    index = {}
+    for fp, info in sorted(all_mcps.items()):
+        for name in info["names"]:
+            entry = index.setdefault(name, {"fingerprints": [], "projects": []})
+            entry["fingerprints"].append(fp)
+            entry["projects"].extend(p for p in info["projects"] if p not in entry["projects"])
+    return {name: index[name] for name in sorted(index)}
+
+
+def _build_mcp_record(fingerprint, mcp_info):
+    """Build a content-addressed MCP server YAML record.
+
+    Command, args and url are only fingerprinted, not stored, since args
+    often carry tokens and the registry may be committed.
+    """
     config = mcp_info["config"]
     return {
-        "name": name,
+        "fingerprint": fingerprint,
+        "names": sorted(mcp_info["names"]),
         "type": config.get("type", "unknown"),
-        "projects": mcp_info["projects"],
+        "projects": sorted(mcp_info["projects"]),
         "env_vars": config.get("env_vars", []) or None,
         "has_secrets": config.get("has_secrets", False),
     }
@@ -161,15 +346,43 @@ def _build_machine_record(machine_name, global_config, projects):
     }
 
 
-def _write_yaml(path, data, header=None):
-    """Write a YAML file with optional header comment."""
+def _render_yaml(data, header=None):
+    """Serialize data as YAML with an optional header comment."""
     content = ""
     if header:
         for line in header.splitlines():
             content += f"# {line}\n"
         content += "\n"
     content += _yaml_dump(data)
-    Path(path).write_text(content)
+    return content
+
+
+def _write_if_changed(path, content):
+    """Atomically replace path with content unless it already holds those bytes.
+
+    Returns True if the file was written.
+    """
+    path = Path(path)
+    data = content.encode()
+    try:
+        st = path.stat()
+        if st.st_size == len(data) and path.read_bytes() == data:
+            return False
+        mode = st.st_mode & 0o777
+    except OSError:
+        mode = 0o644
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return True
 
 
 def _default_machine_name():
@@ -1,12 +1,16 @@
 """
 Report formatting for context audit output.
 
-Produces styled text reports for terminal display.
+Produces styled text reports for terminal display, and stable JSON/NDJSON
+records (project, issue, drift, summary) for other tools.
 """
 
-import os
+import json
+import sys
 from datetime import datetime, timezone
 
+from .rules import run_rules
+
 
 def format_audit_report(global_config, projects, issues):
     """Format a full audit report as styled text.
@@ -152,93 +156,105 @@ def _project_richness(p):
     return score
 
 
-def detect_issues(global_config, projects):
+def detect_issues(global_config, projects, rules=None, skip_rules=None):
     """Detect issues across the Claude environment.
 
+    Runs the rules registered in lib/rules.py (all of them by default, or
+    those named in rules minus skip_rules).
+
     Returns list of issue dicts with: severity, category, message.
     """
-    issues = []
+    return run_rules(global_config, projects, rules=rules, skip_rules=skip_rules)
 
-    # Check for secrets in MCP configs
-    for p in projects:
-        for mcp in p.get("mcp_servers", []):
-            if mcp.get("has_secrets"):
-                n_vars = len(mcp.get("env_vars", []))
-                issues.append({
-                    "severity": "warn",
-                    "category": "secrets",
-                    "message": f"{p['name']}/.mcp.json — {mcp['name']} has {n_vars} env vars with potential credentials",
-                })
-
-    # Check for broken symlinks in skills
-    skills = global_config.get("skills", {})
-    for s in skills.get("symlinked", []):
-        if s.get("broken"):
-            issues.append({
-                "severity": "error",
-                "category": "broken",
-                "message": f"Skill symlink '{s['name']}' target does not exist",
-            })
 
-    # Check for stale projects (no settings, no hooks, no skills, no MCP)
-    for p in projects:
-        if (p.get("claude_dir")
-                and not p.get("settings")
-                and not p.get("hooks")
-                and not p.get("skills")
-                and not p.get("mcp_servers")
-                and not p.get("claude_md")):
-            issues.append({
-                "severity": "info",
-                "category": "stale",
-                "message": f"{p['name']}/.claude/ — empty config directory (no settings, hooks, or skills)",
-            })
+# --- Machine-readable output ------------------------------------------------
 
-    # Check for duplicate MCP server names with different configs
-    mcp_by_name = {}
-    for p in projects:
-        for mcp in p.get("mcp_servers", []):
-            mcp_by_name.setdefault(mcp["name"], []).append(p["name"])
-    for name, project_list in mcp_by_name.items():
-        if len(project_list) > 1:
-            issues.append({
-                "severity": "info",
-                "category": "duplicate",
-                "message": f"MCP '{name}' defined in {len(project_list)} projects: {', '.join(project_list)}",
-            })
+SCHEMA_VERSION = 1
+FORMATS = ("text", "json", "ndjson")
 
-    # Check for mode files referencing nonexistent cwd_match paths
-    for skill_name, modes in skills.get("with_modes", {}).items():
-        for mode in modes:
-            cwd = mode.get("cwd_match")
-            if cwd:
-                expanded = os.path.expanduser(cwd)
-                if not os.path.isdir(expanded):
-                    issues.append({
-                        "severity": "warn",
-                        "category": "mode-drift",
-                        "message": f"Skill '{skill_name}' mode '{mode['name']}' targets nonexistent path: {cwd}",
-                    })
-
-    # Check parent-level CLAUDE.md that could affect many projects
-    parent_mds = []
-    for p in projects:
-        md = p.get("claude_md")
-        if md:
-            md_path = os.path.dirname(md)
-            # If CLAUDE.md is at a parent level (e.g., ~/repos/.claude/CLAUDE.md)
-            child_projects = [
-                other["name"] for other in projects
-                if other["path"] != p["path"] and other["path"].startswith(p["path"])
-            ]
-            if child_projects:
-                parent_mds.append((p["name"], md, len(child_projects)))
-
-    for name, md, count in parent_mds:
-        issues.append({
-            "severity": "info",
-            "category": "parent",
-            "message": f"{name} has CLAUDE.md that inherits to {count} child project(s)",
-        })
-
-    return issues
+
+def project_record(p):
+    """Stable machine-readable record for a scanned project."""
+    return {
+        "type": "project",
+        "name": p["name"],
+        "path": p["path"],
+        "is_repo": bool(p.get("is_repo")),
+        "claude_md": p.get("claude_md"),
+        "settings": p.get("settings"),
+        "mcp": p.get("mcp"),
+        "hooks": len(p.get("hooks") or []),
+        "skills": list(p.get("skills") or []),
+        "mcp_servers": [
+            {
+                "name": m["name"],
+                "fingerprint": m.get("fingerprint"),
+                "type": m.get("type", "unknown"),
+                "has_secrets": bool(m.get("has_secrets")),
+            }
+            for m in p.get("mcp_servers") or []
+        ],
+    }
+
+
+def issue_record(issue):
+    """Stable machine-readable record for a detected issue."""
+    return {
+        "type": "issue",
+        "severity": issue.get("severity", "warn"),
+        "category": issue.get("category", ""),
+        "message": issue["message"],
+    }
+
+
+def drift_record(drift):
+    """Stable machine-readable record for a drift entry."""
+    return {
+        "type": "drift",
+        "status": drift["status"],
+        "path": drift["path"],
+        "detail": drift["detail"],
+    }
+
+
+def issue_counts(issues):
+    """Count issues by severity, for summary records."""
+    counts = {"total": len(issues), "error": 0, "warn": 0, "info": 0}
+    for issue in issues:
+        severity = issue.get("severity", "warn")
+        counts[severity] = counts.get(severity, 0) + 1
+    return counts
+
+
+class RecordStream:
+    """Write records as NDJSON lines as they arrive, or as one JSON document.
+
+    In ndjson mode every emit() is printed and flushed immediately. In json
+    mode records are grouped by type ("projects", "issues", "drift") and the
+    document is printed by close(), with the summary under "summary".
+    """
+
+    def __init__(self, fmt, out=None):
+        self.fmt = fmt
+        self.out = out or sys.stdout
+        self.groups = {}
+
+    def emit(self, record):
+        if self.fmt == "ndjson":
+            self.out.write(json.dumps(record) + "\n")
+            self.out.flush()
+        else:
+            key = {"project": "projects", "issue": "issues"}.get(record["type"], record["type"])
+            self.groups.setdefault(key, []).append(record)
+
+    def close(self, summary):
+        summary = {"type": "summary", "version": SCHEMA_VERSION, **summary}
+        if self.fmt == "ndjson":
+            self.emit(summary)
+        else:
+            doc = {"version": SCHEMA_VERSION}
+            for key, records in self.groups.items():
+                doc[key] = [{k: v for k, v in r.items() if k != "type"} for r in records]
+            doc["summary"] = {k: v for k, v in summary.items() if k not in ("type", "version")}
+            self.out.write(json.dumps(doc, indent=2) + "\n")
+            self.out.flush()
@@ -0,0 +1,276 @@
+"""
+Rule engine for audit issue detection.
+
+Each rule is a function registered with @rule that declares the facts it
+reads. The engine gathers only the facts the selected rules need, in a
+single pass over the scan results, through a shared memoized stat cache,
+then runs the rules in parallel. Issues come back in registration order so
+reports stay stable.
+
+Adding a check:
+
+    @rule("my-check", facts=("projects", "stats"), description="...")
+    def _my_check(facts):
+        return [issue dicts with severity, category, message]
+"""
+
+import os
+import shlex
+from concurrent.futures import ThreadPoolExecutor
+
+from .pathindex import PathIndex
+
+# name -> {"fn", "facts", "description"}, in registration order
+RULES = {}
+
+
+def rule(name, facts=(), description=""):
+    """Register a detector under name, declaring the facts it reads."""
+    def register(fn):
+        RULES[name] = {"fn": fn, "facts": tuple(facts), "description": description}
+        return fn
+    return register
+
+
+class StatCache:
+    """Memoized os.stat results shared by fact gathering and rules."""
+
+    def __init__(self):
+        self._stats = {}
+
+    def stat(self, path):
+        """Return os.stat(path) or None, following symlinks; cached per path."""
+        path = os.path.expanduser(str(path))
+        if path not in self._stats:
+            try:
+                self._stats[path] = os.stat(path)
+            except OSError:
+                self._stats[path] = None
+        return self._stats[path]
+
+    def exists(self, path):
+        return self.stat(path) is not None
+
+    def isdir(self, path):
+        st = self.stat(path)
+        return st is not None and (st.st_mode & 0o170000) == 0o040000
+
+
+# --- Facts ----------------------------------------------------------------
+
+def _gather_facts(global_config, projects, needed, stats):
+    """Build the requested facts with one pass over projects and skills."""
+    skills = global_config.get("skills", {})
+    facts = {"stats": stats, "projects": projects, "skills": skills}
+
+    want_mcp = "mcp_servers" in needed
+    want_hooks = "hook_commands" in needed
+    mcp_servers = []
+    hook_commands = []
+    if want_mcp or want_hooks:
+        for p in projects:
+            if want_mcp:
+                for mcp in p.get("mcp_servers", []):
+                    mcp_servers.append((p, mcp))
+            if want_hooks:
+                for hook in p.get("hooks", []):
+                    hook_commands.append((p, hook))
+    facts["mcp_servers"] = mcp_servers
+    facts["hook_commands"] = hook_commands
+
+    if "skill_symlinks" in needed:
+        facts["skill_symlinks"] = [
+            {**s, "exists": bool(s.get("target")) and stats.exists(s["target"])}
+            for s in skills.get("symlinked", [])
+        ]
+
+    if "mode_paths" in needed:
+        mode_paths = []
+        for skill_name, modes in skills.get("with_modes", {}).items():
+            for mode in modes:
+                cwd = mode.get("cwd_match")
+                if cwd:
+                    mode_paths.append({
+                        "skill": skill_name,
+                        "mode": mode["name"],
+                        "cwd_match": cwd,
+                        "is_dir": stats.isdir(cwd),
+                    })
+        facts["mode_paths"] = mode_paths
+
+    if "path_index" in needed:
+        facts["path_index"] = PathIndex((p["path"], p["name"]) for p in projects)
+
+    return facts
+
+
+# --- Engine ---------------------------------------------------------------
+
+def select_rules(rules=None, skip_rules=None):
+    """Resolve rule selections to an ordered list of names.
+
+    Raises ValueError for unknown rule names.
+    """
+    unknown = [r for r in (rules or []) + (skip_rules or []) if r not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown rule(s): {', '.join(unknown)} (available: {', '.join(RULES)})")
+    selected = [name for name in RULES if not rules or name in rules]
+    return [name for name in selected if name not in (skip_rules or [])]
+
+
+def run_rules(global_config, projects, rules=None, skip_rules=None, max_workers=None):
+    """Run the selected rules and return their issues in registration order."""
+    names = select_rules(rules, skip_rules)
+    needed = {fact for name in names for fact in RULES[name]["facts"]}
+    facts = _gather_facts(global_config, projects, needed, StatCache())
+
+    if len(names) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers or len(names)) as pool:
+            results = list(pool.map(lambda name: RULES[name]["fn"](facts), names))
+    else:
+        results = [RULES[name]["fn"](facts) for name in names]
+    return [issue for result in results for issue in result]
+
+
+# --- Built-in rules -------------------------------------------------------
+
+@rule("secrets", facts=("mcp_servers",), description="MCP configs with credential-like env vars")
+def _secrets(facts):
+    issues = []
+    for p, mcp in facts["mcp_servers"]:
+        if mcp.get("has_secrets"):
+            n_vars = len(mcp.get("env_vars", []))
+            issues.append({
+                "severity": "warn",
+                "category": "secrets",
+                "message": f"{p['name']}/.mcp.json — {mcp['name']} has {n_vars} env vars with potential credentials",
+            })
+    return issues
+
+
+@rule("broken", facts=("skill_symlinks",), description="Skill symlinks whose target is missing")
+def _broken(facts):
+    return [
+        {
+            "severity": "error",
+            "category": "broken",
+            "message": f"Skill symlink '{s['name']}' target does not exist",
+        }
+        for s in facts["skill_symlinks"]
+        if s.get("broken") or not s["exists"]
+    ]
+
+
+@rule("stale", facts=("projects",), description="Empty .claude/ directories")
+def _stale(facts):
+    issues = []
+    for p in facts["projects"]:
+        if (p.get("claude_dir")
+                and not p.get("settings")
+                and not p.get("hooks")
+                and not p.get("skills")
+                and not p.get("mcp_servers")
+                and not p.get("claude_md")):
+            issues.append({
+                "severity": "info",
+                "category": "stale",
+                "message": f"{p['name']}/.claude/ — empty config directory (no settings, hooks, or skills)",
+            })
+    return issues
+
+
+@rule("duplicate", facts=("mcp_servers",), description="Identical MCP configs defined in several projects")
+def _duplicate(facts):
+    by_fingerprint = {}
+    for p, mcp in facts["mcp_servers"]:
+        entry = by_fingerprint.setdefault(mcp.get("fingerprint") or mcp["name"], {"names": [], "projects": []})
+        if mcp["name"] not in entry["names"]:
+            entry["names"].append(mcp["name"])
+        entry["projects"].append(p["name"])
+
+    issues = []
+    for entry in by_fingerprint.values():
+        if len(entry["projects"]) < 2:
+            continue
+        names = entry["names"]
+        label = f"MCP '{names[0]}'" if len(names) == 1 else f"MCP config (as {', '.join(repr(n) for n in names)})"
+        issues.append({
+            "severity": "info",
+            "category": "duplicate",
+            "message": f"{label} defined in {len(entry['projects'])} projects: {', '.join(entry['projects'])}",
+        })
+    return issues
+
+
+@rule("mcp-conflict", facts=("mcp_servers",), description="One MCP server name with different configs")
+def _mcp_conflict(facts):
+    by_name = {}
+    for p, mcp in facts["mcp_servers"]:
+        by_name.setdefault(mcp["name"], {}).setdefault(mcp.get("fingerprint"), []).append(p["name"])
+
+    issues = []
+    for name, configs in by_name.items():
+        if len(configs) < 2:
+            continue
+        groups = "; ".join(", ".join(projects) for projects in configs.values())
+        issues.append({
+            "severity": "warn",
+            "category": "conflict",
+            "message": f"MCP '{name}' has {len(configs)} different configs across projects: {groups}",
+        })
+    return issues
+
+
+@rule("mode-drift", facts=("mode_paths",), description="Skill modes whose cwd_match path is missing")
+def _mode_drift(facts):
+    return [
+        {
+            "severity": "warn",
+            "category": "mode-drift",
+            "message": f"Skill '{m['skill']}' mode '{m['mode']}' targets nonexistent path: {m['cwd_match']}",
+        }
+        for m in facts["mode_paths"]
+        if not m["is_dir"]
+    ]
+
+
+@rule("parent", facts=("projects", "path_index"), description="CLAUDE.md inherited by nested projects")
+def _parent(facts):
+    issues = []
+    index = facts["path_index"]
+    for p in facts["projects"]:
+        if p.get("claude_md"):
+            count = index.count_descendants(p["path"])
+            if count:
+                issues.append({
+                    "severity": "info",
+                    "category": "parent",
+                    "message": f"{p['name']} has CLAUDE.md that inherits to {count} child project(s)",
+                })
+    return issues
+
+
+@rule("hook-missing", facts=("hook_commands", "stats"), description="Settings hooks that run a missing script")
+def _hook_missing(facts):
+    issues = []
+    stats = facts["stats"]
+    for p, hook in facts["hook_commands"]:
+        if hook.get("type") == "script" or not hook.get("command"):
+            continue
+        try:
+            program = shlex.split(hook["command"])[0]
+        except (ValueError, IndexError):
+            continue
+        program = program.replace("$CLAUDE_PROJECT_DIR", p["path"]).replace("${CLAUDE_PROJECT_DIR}", p["path"])
+        # Bare commands resolve through PATH; only check explicit paths
+        if not program.startswith(("/", "~/", "./", "../")):
+            continue
+        if not os.path.isabs(os.path.expanduser(program)):
+            program = os.path.join(p["path"], program)
+        if not stats.exists(program):
+            issues.append({
+                "severity": "warn",
+                "category": "hooks",
+                "message": f"{p['name']} {hook['type']} hook runs missing script: {hook['command']}",
+            })
+    return issues
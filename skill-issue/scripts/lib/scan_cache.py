@@ -0,0 +1,153 @@
+"""
+Persistent project scan cache.
+
+Stores each project's scan result in ~/.claude/context/scan-cache.json next
+to a fingerprint of the files and directories the scan reads. A project
+whose fingerprint is unchanged is served from the cache instead of being
+re-scanned (settings.json and .mcp.json are not re-parsed). Directories
+without config are cached too, with a project of None: until the directory
+itself changes they cost one stat.
+
+scan-walk.json, next to it, records the last walk of the scan roots (the
+directories listed, their child names and the candidate directories found)
+so sync can re-check them without walking the roots again.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_FILE = "scan-cache.json"
+WALK_FILE = "scan-walk.json"
+CACHE_VERSION = 4
+
+# Paths (relative to the project) whose stat covers everything the scan reads.
+# Directory mtimes change when entries are added, removed or renamed, which
+# covers the hooks/ and skills/ listings and .claude/CLAUDE.md appearing.
+FINGERPRINT_PATHS = (
+    "",
+    ".claude",
+    ".claude/skills",
+    ".claude/hooks",
+    ".claude/settings.json",
+    ".mcp.json",
+    "CLAUDE.md",
+)
+
+
+def fingerprint(path):
+    """Return a JSON-able fingerprint of a project directory.
+
+    Each entry is [mtime_ns, size] or None when the path is missing. The
+    .claude/ children are not stat'ed when .claude/ itself is missing.
+    """
+    fp = []
+    for rel in FINGERPRINT_PATHS:
+        if rel.startswith(".claude/") and fp[1] is None:
+            fp.append(None)
+            continue
+        try:
+            st = os.stat(os.path.join(path, rel) if rel else path)
+            fp.append([st.st_mtime_ns, st.st_size])
+        except OSError:
+            fp.append(None)
+    return fp
+
+
+def has_config(fp):
+    """True if a fingerprint shows any project marker (.claude/, .mcp.json, CLAUDE.md)."""
+    return fp[1] is not None or fp[5] is not None or fp[6] is not None
+
+
+def unchanged_miss(path, entry):
+    """True if entry caches path as having no config and the directory is unchanged.
+
+    Creating .claude/, CLAUDE.md or .mcp.json changes the directory's mtime,
+    so one stat is enough to tell the directory is still not a project.
+    """
+    if not entry or entry.get("project") is not None:
+        return False
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return entry["fingerprint"][0] == [st.st_mtime_ns, st.st_size]
+
+
+def load_scan_cache(context_dir):
+    """Load the cache as {path: {"fingerprint": [...], "project": {...} or None}}.
+
+    A missing, unreadable or outdated cache loads as empty.
+    """
+    path = Path(context_dir) / CACHE_FILE
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("entries") or {}
+
+
+def save_scan_cache(context_dir, cache, keep_paths=None, walked=None):
+    """Write the cache atomically.
+
+    keep_paths, if given, keeps only the project entries for those paths;
+    walked, if given, keeps only the entries without config for those paths
+    (the candidate directories of the walk just done).
+    """
+    keep = None if keep_paths is None else set(keep_paths)
+    keep_missing = None if walked is None else set(walked)
+
+    def kept(path, entry):
+        paths = keep_missing if entry["project"] is None else keep
+        return paths is None or path in paths
+
+    cache = {p: e for p, e in cache.items() if kept(p, e)}
+
+    # No sort_keys: cached project dicts must keep the scanner's key order,
+    # or registry records built from cache hits differ from fresh scans
+    _write_json(Path(context_dir) / CACHE_FILE, {"version": CACHE_VERSION, "entries": cache})
+
+
+def load_scan_walk(context_dir):
+    """Load the last walk as {"roots", "depth", "nested", "children", "candidates"}.
+
+    children maps every directory the walk listed to its child directory
+    names; candidates lists the directories it found. Returns None when
+    there is no usable record.
+    """
+    try:
+        data = json.loads((Path(context_dir) / WALK_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return None
+    return data.get("walk")
+
+
+def save_scan_walk(context_dir, walk):
+    """Write the walk record from a scan atomically (see load_scan_walk())."""
+    walk = {
+        "roots": [str(r) for r in walk["roots"]],
+        "depth": walk["depth"],
+        "nested": bool(walk["nested"]),
+        "children": walk["children"],
+        "candidates": [str(c) for c in walk["candidates"]],
+    }
+    _write_json(Path(context_dir) / WALK_FILE, {"version": CACHE_VERSION, "walk": walk})
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(data, separators=(",", ":"))
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
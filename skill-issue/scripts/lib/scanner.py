@@ -8,8 +8,13 @@ and other Claude config across scan roots and ~/.claude/.
 import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .frontmatter import extract_field
+from .scan_cache import fingerprint, has_config, unchanged_miss
+from .walker import iter_candidate_dirs
+
 
 def expand_path(p):
     """Expand ~ and resolve path."""
@@ -84,39 +89,113 @@ def scan_global_config(claude_home=None):
     return result
 
 
-def scan_projects(scan_roots):
+def scan_projects(scan_roots, max_workers=None, depth=1, nested=False, cache=None, extra_paths=None,
+                  listings=None, candidates=None, on_project=None):
     """Scan directories for projects with Claude configuration.
 
     Args:
-        scan_roots: List of paths to scan (depth 1-2 for .claude/, CLAUDE.md, .mcp.json)
+        scan_roots: List of paths to scan for .claude/, CLAUDE.md, .mcp.json
+        max_workers: Scan candidate directories on this many threads
+            (default: one at a time)
+        depth: Levels below each root to search (default: 1, the root's
+            immediate children)
+        nested: Also look for projects inside other projects
+        cache: Scan cache dict from load_scan_cache(); reused and updated in place
+        extra_paths: Directories to check directly, e.g. registered projects
+            that live outside every scan root
+        listings: Optional dict filled with the child directory names of
+            every directory walked (see walker.iter_candidate_dirs)
+        candidates: Optional list filled with the path of every candidate
+            directory the walk found (extra_paths not included)
+        on_project: Called with each project dict as soon as it is scanned,
+            in walk order (see scan_project_paths)
 
     Returns:
-        List of project dicts.
+        List of project dicts, sorted by name.
     """
-    projects = []
-    seen_paths = set()
+    paths = []
+    seen = set()
 
     for root in scan_roots:
         root = expand_path(root)
         if not root.is_dir():
             continue
+        paths.extend(iter_candidate_dirs(
+            root, depth=depth, nested=nested, seen=seen, listings=listings
+        ))
+    if candidates is not None:
+        candidates.extend(str(p) for p in paths)
+
+    for path in extra_paths or []:
+        path = expand_path(path)
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if (st.st_dev, st.st_ino) not in seen:
+            seen.add((st.st_dev, st.st_ino))
+            paths.append(path)
 
-        # Check the root itself and its immediate children
-        candidates = [root] + sorted(
-            d for d in root.iterdir() if d.is_dir() and not d.name.startswith(".")
-        )
+    projects = scan_project_paths(paths, max_workers=max_workers, cache=cache, on_project=on_project)
+    return sorted(projects, key=lambda p: p["name"])
 
-        for candidate in candidates:
-            path = candidate.resolve()
-            if path in seen_paths:
-                continue
 
-            project = _scan_single_project(path)
-            if project:
-                seen_paths.add(path)
-                projects.append(project)
+def scan_project_paths(paths, max_workers=None, cache=None, on_project=None):
+    """Scan a list of directories, returning project dicts for those with config.
 
-    return sorted(projects, key=lambda p: p["name"])
+    Each scan is a dozen small stat/read calls, so on network or large home
+    directories the work is latency-bound and threads help. Results keep
+    the order of paths regardless of max_workers.
+
+    With a cache dict, unchanged projects are served from it and fresh
+    scans are stored back into it.
+
+    on_project, if given, is called from the calling thread with each
+    project as its result comes in, so callers can stream output while
+    later paths are still being scanned.
+    """
+    paths = [Path(p) for p in paths]
+    if cache is None:
+        scan = _scan_single_project
+    else:
+        def scan(path):
+            return _cached_scan(path, cache)
+
+    if max_workers and max_workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return _collect(pool.map(scan, paths), on_project)
+    return _collect(map(scan, paths), on_project)
+
+
+def _collect(results, on_project):
+    projects = []
+    for project in results:
+        if project:
+            projects.append(project)
+            if on_project:
+                on_project(project)
+    return projects
+
+
+def _cached_scan(path, cache):
+    """Scan a directory unless its fingerprint matches the cached entry."""
+    key = str(path)
+    entry = cache.get(key)
+    if unchanged_miss(path, entry):
+        return None
+    fp = fingerprint(path)
+    if not has_config(fp):
+        if fp[0] is not None:
+            cache[key] = {"fingerprint": fp, "project": None}
+        return None
+    if entry and entry.get("fingerprint") == fp:
+        return entry["project"]
+    # Fingerprint is taken before scanning so a change mid-scan still
+    # invalidates the entry next time
+    project = _scan_single_project(path)
+    if project:
+        cache[key] = {"fingerprint": fp, "project": project}
+    return project
 
 
 def _scan_single_project(path):
@@ -201,6 +280,7 @@ def _scan_single_project(path):
                 env_vars = list((server_config.get("env", {}) or {}).keys())
                 project["mcp_servers"].append({
                     "name": server_name,
+                    "fingerprint": mcp_fingerprint(server_config),
                     "type": _detect_mcp_type(server_config),
                     "env_vars": env_vars,
                     "has_secrets": _has_secret_env_vars(server_config.get("env", {})),
@@ -212,16 +292,28 @@ def _scan_single_project(path):
 
 
 def _extract_cwd_match(mode_file):
-    """Extract cwd_match value from a mode markdown file."""
-    try:
-        text = mode_file.read_text()
-        for line in text.splitlines():
-            stripped = line.strip()
-            if stripped.startswith("cwd_match:"):
-                return stripped.split(":", 1)[1].strip()
-    except OSError:
-        pass
-    return None
+    """Extract cwd_match value from a mode markdown file.
+
+    Reads the frontmatter or the top of the file only, never the whole body.
+    """
+    return extract_field(mode_file, "cwd_match")
+
+
+def mcp_fingerprint(config):
+    """Fingerprint an MCP server config by what it runs, not what it is called.
+
+    Normalizes command, args, url and the sorted env var names (values are
+    left out so rotating a token is not a new server) and returns the first
+    16 hex digits of their SHA-256.
+    """
+    normalized = {
+        "command": str(config.get("command") or "").strip(),
+        "args": [str(a) for a in (config.get("args") or [])],
+        "url": str(config.get("url") or "").strip(),
+        "env": sorted((config.get("env") or {}).keys()),
+    }
+    encoded = json.dumps(normalized, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
 
 
 def _detect_mcp_type(config):
@@ -258,6 +350,49 @@ def file_hash(path):
         return None
 
 
+def tracked_files(project):
+    """Return {label: path} for every file whose content the registry tracks.
+
+    Labels are claude_md, settings and mcp, plus hooks/<script> for hook
+    scripts and skills/<name> for each project skill's SKILL.md.
+    """
+    files = {}
+    for key in ("claude_md", "settings", "mcp"):
+        if project.get(key):
+            files[key] = project[key]
+    claude_dir = project.get("claude_dir")
+    if claude_dir:
+        for hook in project.get("hooks") or []:
+            if hook.get("type") == "script":
+                files[f"hooks/{hook['command']}"] = os.path.join(claude_dir, "hooks", hook["command"])
+        for skill in project.get("skills") or []:
+            files[f"skills/{skill}"] = os.path.join(claude_dir, "skills", skill, "SKILL.md")
+    return files
+
+
+def file_record(path, previous=None):
+    """Return {"path", "hash", "size", "mtime_ns"} for a file, or None if missing.
+
+    When previous (an earlier record for the same path) has the same size
+    and mtime_ns, its hash is reused and the file is not read.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if (
+        previous
+        and previous.get("path") == str(path)
+        and previous.get("size") == st.st_size
+        and previous.get("mtime_ns") == st.st_mtime_ns
+        and previous.get("hash")
+    ):
+        content_hash = previous["hash"]
+    else:
+        content_hash = file_hash(path)
+    return {"path": str(path), "hash": content_hash, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
 def snapshot_project(project):
     """Create a hashable snapshot of a project's config state.
 
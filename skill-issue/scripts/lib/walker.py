@@ -0,0 +1,185 @@
+"""
+Pruned directory walker for scan roots.
+
+Finds candidate project directories below a scan root up to a given depth
+using os.scandir, without descending into dependency trees, build output,
+hidden directories or anything a .gitignore excludes. Once a directory
+looks like a project (.claude/, CLAUDE.md or .mcp.json) its children are
+skipped unless nested projects are requested.
+
+A scan root's immediate children are always candidates, whatever their
+name: ~/repos/build or a gitignored ~/repos/scratch can be a checkout. The
+ignore lists only stop the walker from descending into them.
+"""
+
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+
+# Directory names never worth descending into
+IGNORED_DIRS = {
+    "node_modules",
+    "bower_components",
+    "vendor",
+    "venv",
+    "env",
+    "__pycache__",
+    "site-packages",
+    "build",
+    "dist",
+    "out",
+    "target",
+    "coverage",
+}
+
+# Any of these in a directory's listing marks it as a project root
+PROJECT_MARKERS = {".claude", "CLAUDE.md", ".mcp.json"}
+
+
+def parse_ignore_file(path):
+    """Parse a .gitignore-style file into a list of (pattern, anchored) rules.
+
+    Only rules that can exclude directories matter here: negations are
+    skipped, a trailing slash is dropped, and a leading or embedded slash
+    anchors the pattern to the file's directory.
+    """
+    rules = []
+    try:
+        with open(path, errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or line.startswith("!"):
+                    continue
+                line = line.rstrip("/")
+                if not line:
+                    continue
+                anchored = "/" in line
+                rules.append((line.lstrip("/"), anchored))
+    except OSError:
+        pass
+    return rules
+
+
+def _is_ignored(name, rel_parts, rules):
+    """Check a directory against inherited ignore rules.
+
+    rules holds (base_depth, pattern, anchored); rel_parts are the path parts
+    from the scan root to the directory, so rel_parts[base_depth:] is the
+    path relative to the directory whose ignore file declared the rule.
+    """
+    for base_depth, pattern, anchored in rules:
+        if anchored:
+            if fnmatch("/".join(rel_parts[base_depth:]), pattern):
+                return True
+        elif fnmatch(name, pattern):
+            return True
+    return False
+
+
+def child_dir_names(entries):
+    """Sorted names of the non-hidden directories in a scandir listing."""
+    names = []
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        try:
+            if entry.is_dir():
+                names.append(entry.name)
+        except OSError:
+            continue
+    return sorted(names)
+
+
+def iter_candidate_dirs(root, depth=1, nested=False, seen=None, ignore_rules=None, scan_root=True,
+                        listings=None):
+    """Yield directories under root (root included) that may hold Claude config.
+
+    Args:
+        root: Resolved scan root.
+        depth: How many levels below root to visit (1 = root and its children).
+        nested: Keep descending below directories that are already projects.
+        seen: Shared set of (st_dev, st_ino) so the same directory reached
+            through another root or a symlink is yielded once.
+        ignore_rules: Extra (pattern, anchored) rules applied from root down.
+        scan_root: root is a scan root rather than a directory below one
+            (see below).
+        listings: Optional dict filled with {directory: [child dir names]}
+            for every directory the walk descended from, so a later sync
+            can spot new directories with one scandir each (see
+            child_dir_names()).
+
+    Directories at the depth limit are yielded without being listed, so
+    depth=1 costs a single scandir of the root. When root is a scan root,
+    its children matched by IGNORED_DIRS or a .gitignore are yielded but not
+    listed; deeper matches are skipped.
+    """
+    root = Path(root)
+    seen = set() if seen is None else seen
+    try:
+        st = root.stat()
+    except OSError:
+        return
+    if (st.st_dev, st.st_ino) in seen:
+        return
+    seen.add((st.st_dev, st.st_ino))
+
+    base_rules = [(0, pattern, anchored) for pattern, anchored in (ignore_rules or [])]
+    # (path, parts relative to root, level, st_dev, inherited rules, listable)
+    stack = [(str(root), (), 0, st.st_dev, base_rules, True)]
+    while stack:
+        path, parts, level, dev, rules, listable = stack.pop()
+        yield Path(path)
+        if level >= depth or not listable:
+            continue
+
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        names = {e.name for e in entries}
+        if level > 0 and not nested and names & PROJECT_MARKERS:
+            continue
+        if listings is not None:
+            listings[path] = child_dir_names(entries)
+        if ".gitignore" in names:
+            rules = rules + [
+                (len(parts), pattern, anchored)
+                for pattern, anchored in parse_ignore_file(os.path.join(path, ".gitignore"))
+            ]
+
+        children = []
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            try:
+                if not entry.is_dir():
+                    continue
+                if entry.is_symlink():
+                    # Follow the link so a checkout symlinked into the root is
+                    # deduped against its real location
+                    child_st = entry.stat()
+                    key = (child_st.st_dev, child_st.st_ino)
+                    child_path = os.path.realpath(entry.path)
+                    child_dev = child_st.st_dev
+                else:
+                    # d_ino comes free with the listing; the parent's device
+                    # stands in for st_dev to avoid a stat per directory
+                    key = (dev, entry.inode())
+                    child_path = entry.path
+                    child_dev = dev
+            except OSError:
+                continue
+            child_parts = parts + (name,)
+            ignored = name in IGNORED_DIRS or bool(rules) and _is_ignored(name, child_parts, rules)
+            if ignored and (level > 0 or not scan_root):
+                continue
+            if key in seen:
+                continue
+            seen.add(key)
+            children.append((child_path, child_parts, level + 1, child_dev, rules, not ignored))
+
+        # Reverse-sorted onto the stack so children are visited in name order
+        stack.extend(sorted(children, key=lambda c: c[1][-1], reverse=True))
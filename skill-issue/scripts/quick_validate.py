@@ -6,9 +6,12 @@ Quick validation script for skills - validates structure and content
 import sys
 import os
 import re
-import yaml
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.frontmatter import FrontmatterError, read_frontmatter
+
 def validate_skill(skill_path, strict=False):
     """
     Validate a skill directory.
@@ -28,26 +31,17 @@ def validate_skill(skill_path, strict=False):
     if not skill_md.exists():
         return False, "SKILL.md not found"
 
-    # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
-
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
-
-    frontmatter_text = match.group(1)
-    body = content[match.end():]
-
-    # Parse YAML frontmatter
+    # Read and parse frontmatter (bounded read, stops at the closing ---)
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
-    except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+        parsed = read_frontmatter(skill_md)
+    except FrontmatterError as e:
+        return False, str(e)
+    frontmatter = parsed.data
+
+    # Body, for the TODO and length checks
+    with open(skill_md, 'rb') as f:
+        f.seek(parsed.end)
+        body = f.read().decode('utf-8')
 
     # Define allowed properties
     ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
@@ -103,7 +97,7 @@ def validate_skill(skill_path, strict=False):
         return False, f"Incomplete skill: found TODO marker(s): {todo_matches[0]}..."
 
     # Check SKILL.md line count (recommended max 500)
-    line_count = len(content.splitlines())
+    line_count = parsed.lines + len(body.splitlines())
     if line_count > 500:
         warnings.append(f"SKILL.md has {line_count} lines (recommended max: 500). Consider splitting into references/.")
 
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Resolve Mode - Find the mode every skill should use for a directory.
+
+Usage:
+    resolve_mode.py                          # Modes matching the current directory
+    resolve_mode.py --cwd <path>             # Modes matching another directory
+    resolve_mode.py --skill <name>           # One skill: print its mode file
+    resolve_mode.py --format json            # Machine-readable output
+    resolve_mode.py --rebuild                # Ignore the persisted index
+    resolve_mode.py --claude-home <path>     # Skills under <path>/skills (default: ~/.claude)
+    resolve_mode.py --context-dir <path>     # Where mode-index.json lives (default: ~/.claude/context)
+
+Examples:
+    resolve_mode.py --skill divide-and-conquer
+    resolve_mode.py --cwd ~/repos/acme/api --format json
+
+Replaces the "Mode Selection" step of mode-based skills: instead of listing
+modes/*.md and reading each file's cwd_match, one call walks a prefix trie
+over every skill's cwd_match values and returns the longest match per
+skill. The trie is persisted in mode-index.json and rebuilt when a skill,
+a modes/ directory or a mode file changes.
+
+With --skill, the matching mode file's path is printed and the exit code
+is 0. When no mode matches the exit code is 1; when several modes share the
+longest prefix they are listed on stderr and the exit code is 2.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.modes import load_mode_index, resolve_modes
+
+
+def format_resolution(cwd, results):
+    """Format resolved modes as a text table."""
+    lines = [f"MODES for {cwd.replace(os.path.expanduser('~'), '~')}", ""]
+    if not results:
+        lines.append("  No skill has a mode matching this directory.")
+    for r in results:
+        if r["mode"]:
+            lines.append(f"  {r['skill'].ljust(24)} {r['mode'].ljust(20)} {r['cwd_match']}")
+        else:
+            lines.append(f"  {r['skill'].ljust(24)} ambiguous: {', '.join(r['candidates'])}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    args = sys.argv[1:]
+
+    cwd = os.getcwd()
+    skill = None
+    fmt = "text"
+    rebuild = False
+    claude_home = "~/.claude"
+    context_dir = "~/.claude/context"
+
+    i = 0
+    while i < len(args):
+        if args[i] == "--cwd" and i + 1 < len(args):
+            cwd = os.path.abspath(os.path.expanduser(args[i + 1]))
+            i += 2
+        elif args[i] == "--skill" and i + 1 < len(args):
+            skill = args[i + 1]
+            i += 2
+        elif args[i] == "--format" and i + 1 < len(args):
+            fmt = args[i + 1]
+            if fmt not in ("text", "json"):
+                print("--format must be one of: text, json")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--rebuild":
+            rebuild = True
+            i += 1
+        elif args[i] == "--claude-home" and i + 1 < len(args):
+            claude_home = args[i + 1]
+            i += 2
+        elif args[i] == "--context-dir" and i + 1 < len(args):
+            context_dir = args[i + 1]
+            i += 2
+        elif args[i] in ("-h", "--help"):
+            print(__doc__)
+            sys.exit(0)
+        else:
+            print(f"Unknown argument: {args[i]}")
+            print(__doc__)
+            sys.exit(1)
+
+    index = load_mode_index(claude_home, context_dir, rebuild=rebuild)
+    results = resolve_modes(index, cwd, skill=skill)
+
+    if fmt == "json":
+        print(json.dumps({"cwd": cwd, "modes": results}, indent=2))
+    elif skill is None:
+        print(format_resolution(cwd, results))
+    elif results and results[0]["file"]:
+        print(results[0]["file"])
+    elif results:
+        print(f"Several '{skill}' modes match: {', '.join(results[0]['candidates'])}", file=sys.stderr)
+
+    if skill is not None:
+        if not results:
+            sys.exit(1)
+        if not results[0]["file"]:
+            sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,101 +6,317 @@ Usage:
     sync_context.py                        # Check for drift (default)
     sync_context.py --check                # Same as above
     sync_context.py --update               # Re-scan and update registry
+    sync_context.py --watch                # Keep the registry live, print drift as NDJSON
     sync_context.py --context-dir <path>   # Custom registry location
+    sync_context.py --jobs N               # Scan projects on N threads
+    sync_context.py --depth N [--nested]   # Override the recorded scan depth
+    sync_context.py --no-cache             # Re-scan every project from scratch
+    sync_context.py --format json|ndjson   # Machine-readable --check/--update output
 
 Examples:
     sync_context.py                        # Show what changed since last audit
     sync_context.py --update               # Refresh registry to match filesystem
+    sync_context.py --watch | jq .         # Follow drift events as they happen
+
+Drift checks use the scan roots and depth that audit_context.py or
+init_context.py recorded in the manifest. Registered projects are re-checked
+directly. The last walk of the roots is kept in scan-walk.json next to the
+scan cache: each directory it listed is listed once more and compared with
+the child names it saw, every candidate directory it found is re-checked
+(one stat while a directory without config is unchanged), and only new
+names are walked. Without a walk record, or with --no-cache, the roots are
+walked in full; registries from before roots were recorded fall back to the
+parents of registered projects.
+
+--watch (Linux only) subscribes with inotify to the scan roots, every
+candidate directory below them, each project's .claude/, .claude/skills,
+.claude/hooks and project skill directories, and ~/.claude/skills. Changes
+re-scan only the affected project and rewrite only the registry files that
+changed. Each drift is printed as one JSON object per line.
+
+--format ndjson prints one {"type": "drift", "status", "path", "detail"}
+record per entry (OK entries included) followed by a {"type": "summary"}
+record; --format json prints them as one document. --watch always prints
+NDJSON in the same schema, each record with a "time": drift records from
+the initial sync, a {"type": "watching", "version"} record once watches
+are in place, then drift and {"type": "resync"} records as they happen.
 """
 
 import sys
 import os
+from fnmatch import fnmatch
 from pathlib import Path
 from datetime import datetime, timezone
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from lib import inotify
 from lib.scanner import (
     scan_global_config,
     scan_projects,
+    scan_project_paths,
     expand_path,
     file_hash,
-    snapshot_project,
+    tracked_files,
+    _scan_single_project,
 )
-from lib.reporter import format_audit_report, detect_issues
-from lib.registry import write_registry
+from lib.walker import (
+    IGNORED_DIRS,
+    PROJECT_MARKERS,
+    child_dir_names,
+    iter_candidate_dirs,
+    parse_ignore_file,
+)
+from lib.reporter import (
+    FORMATS,
+    SCHEMA_VERSION,
+    RecordStream,
+    detect_issues,
+    drift_record,
+    format_audit_report,
+    issue_counts,
+    issue_record,
+)
+from lib.registry import load_registry, write_registry
+from lib.scan_cache import load_scan_cache, load_scan_walk, save_scan_cache, save_scan_walk
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
 
+def _infer_scan_roots(manifest):
+    """Work out scan roots as the parents of registered projects (never ~).
 
-def load_manifest(context_dir):
-    """Load manifest.yaml from registry. Returns dict or None."""
-    manifest_path = context_dir / "manifest.yaml"
-    if not manifest_path.exists():
-        return None
-    try:
-        if yaml:
-            return yaml.safe_load(manifest_path.read_text())
-        else:
-            import json
-            return json.loads(manifest_path.read_text())
-    except Exception:
-        return None
+    Only used for registries written before the manifest recorded its scan
+    roots; see _scan_settings().
+    """
+    home = os.path.expanduser("~")
+    scan_roots = set()
+    for name, info in (manifest.get("projects") or {}).items():
+        path = info.get("path", "")
+        if path:
+            parent = str(Path(path).parent)
+            if parent != home:
+                scan_roots.add(parent)
+    return scan_roots
+
+
+def _scan_settings(manifest, depth=None, nested=None):
+    """Return {"roots", "depth", "nested"} to re-scan with.
+
+    Uses the scan settings recorded in the manifest, falling back to the
+    parents of registered projects and then ~/repos. depth and nested
+    override the recorded values when given.
+    """
+    recorded = (manifest or {}).get("scan") or {}
+    roots = recorded.get("roots")
+    if not roots:
+        roots = sorted(_infer_scan_roots(manifest)) if manifest else []
+    if not roots:
+        roots = [os.path.expanduser("~/repos")]
+    return {
+        "roots": roots,
+        "depth": depth if depth is not None else recorded.get("depth", 1),
+        "nested": nested if nested is not None else recorded.get("nested", False),
+    }
+
+
+def _scan_current(manifest, settings, jobs=None, cache=None, walk=None):
+    """Scan for the current projects. Returns (projects, walk).
+
+    Registered projects are re-checked directly. When walk (the record from
+    load_scan_walk()) covers the same roots, depth and nested setting, each
+    directory it listed costs one scandir, every candidate it found is
+    re-checked (one stat for a cached directory without config), and only
+    child names that were not there before are walked. A candidate that
+    gained or lost its config changes where a walk without --nested stops,
+    so that falls back to walking the roots in full, as does a missing or
+    different walk record. walk is the refreshed record for save_scan_walk().
+    """
+    manifest = manifest or {}
+    registered = [
+        info["path"] for info in (manifest.get("projects") or {}).values()
+        if info.get("path")
+    ]
+    roots = [str(expand_path(r)) for r in settings["roots"]]
+    if (walk is None
+            or walk.get("roots") != roots
+            or walk.get("depth") != settings["depth"]
+            or walk.get("nested") != settings["nested"]):
+        return _full_scan(settings, roots, registered, jobs, cache)
+
+    listings, new_dirs = _new_candidate_dirs(walk["children"], settings, roots)
+    listed = {directory: set(names) for directory, names in listings.items()}
+    # Candidates in a directory that is still listed must still be there;
+    # ones reached through a symlink are kept and re-checked
+    recorded = [
+        c for c in walk.get("candidates") or []
+        if c in listed or os.path.dirname(c) not in walk["children"]
+        or os.path.basename(c) in listed.get(os.path.dirname(c), ())
+    ]
+    candidates = list(dict.fromkeys(recorded + new_dirs))
+    paths = list(dict.fromkeys(registered + candidates))
+    projects = scan_project_paths([Path(p) for p in paths], max_workers=jobs, cache=cache)
+
+    if not settings["nested"] and _walk_stops_moved(walk, recorded, projects, roots, settings["depth"]):
+        return _full_scan(settings, roots, registered, jobs, cache)
+    walk = {**settings, "roots": roots, "children": listings, "candidates": candidates}
+    return sorted(projects, key=lambda p: p["name"]), walk
+
+
+def _scan_with_cache(context_dir, manifest, settings, jobs=None, use_cache=True):
+    """_scan_current() with the scan cache and walk record loaded and saved."""
+    if not use_cache:
+        projects, _walk = _scan_current(manifest, settings, jobs=jobs)
+        return projects
+    cache = load_scan_cache(context_dir)
+    walk = load_scan_walk(context_dir)
+    projects, walk = _scan_current(manifest, settings, jobs=jobs, cache=cache, walk=walk)
+    save_scan_cache(
+        context_dir, cache, keep_paths=[p["path"] for p in projects], walked=walk["candidates"]
+    )
+    save_scan_walk(context_dir, walk)
+    return projects
+
+
+def _full_scan(settings, roots, registered, jobs, cache):
+    listings = {}
+    candidates = []
+    projects = scan_projects(
+        roots,
+        max_workers=jobs,
+        depth=settings["depth"],
+        nested=settings["nested"],
+        cache=cache,
+        extra_paths=registered,
+        listings=listings,
+        candidates=candidates,
+    )
+    walk = {**settings, "roots": roots, "children": listings, "candidates": candidates}
+    return projects, walk
+
+
+def _walk_stops_moved(walk, candidates, projects, roots, depth):
+    """True if a recorded candidate above the depth limit gained or lost config.
+
+    Without --nested the walker does not descend into projects, so such a
+    directory was listed before exactly when it was not a project; ignored
+    names directly under a root are never descended into either way.
+    """
+    project_paths = {p["path"] for p in projects}
+    for c in candidates:
+        level = _level_below_roots(c, roots)
+        if level is None or level == 0 or level >= depth:
+            continue
+        descended = c in walk["children"]
+        if c in project_paths:
+            if descended:
+                return True
+        elif not descended and not (level == 1 and _ignored_name(os.path.dirname(c), os.path.basename(c))):
+            return True
+    return False
+
+
+def _ignored_name(directory, name, rules=None):
+    """True if name in directory matches IGNORED_DIRS or the directory's .gitignore."""
+    if rules is None:
+        rules = parse_ignore_file(os.path.join(directory, ".gitignore"))
+    return name in IGNORED_DIRS or any(fnmatch(name, pattern) for pattern, _anchored in rules)
+
+
+def _new_candidate_dirs(children, settings, roots):
+    """List each recorded directory once and walk only the new child names.
+
+    New names below a scan root's first level are skipped when they match
+    IGNORED_DIRS or the listed directory's own .gitignore, like the walker
+    does. Returns (listings, candidate paths).
+    """
+    depth, nested = settings["depth"], settings["nested"]
+    listings = {}
+    found = []
+    seen = set()
+    for directory, known in children.items():
+        try:
+            with os.scandir(directory) as it:
+                names = child_dir_names(list(it))
+        except OSError:
+            continue  # gone; candidates in it drop out of the walk record
+        listings[directory] = names
+        new = sorted(set(names) - set(known))
+        if not new:
+            continue
+
+        level = _level_below_roots(directory, roots)
+        if level is None:
+            level = depth - 1
+        rules = parse_ignore_file(os.path.join(directory, ".gitignore"))
+        for name in new:
+            ignored = _ignored_name(directory, name, rules)
+            if ignored and level > 0:
+                continue
+            walk_depth = 0 if ignored else depth - level - 1
+            found.extend(
+                str(d) for d in iter_candidate_dirs(
+                    Path(directory) / name,
+                    depth=walk_depth,
+                    nested=nested,
+                    seen=seen,
+                    scan_root=False,
+                    listings=listings,
+                )
+            )
+    return listings, found
+
+
+def _level_below_roots(directory, roots):
+    """How many levels directory sits below the scan root containing it."""
+    for root in roots:
+        if directory == root:
+            return 0
+        if directory.startswith(root.rstrip(os.sep) + os.sep):
+            return len(Path(directory).relative_to(root).parts)
+    return None
 
 
-def load_project_record(context_dir, name):
-    """Load a project YAML record. Returns dict or None."""
-    slug = name.replace("/", "-").replace(" ", "-").lower()
-    path = context_dir / "projects" / f"{slug}.yaml"
-    if not path.exists():
-        return None
-    try:
-        if yaml:
-            return yaml.safe_load(path.read_text())
-        else:
-            import json
-            return json.loads(path.read_text())
-    except Exception:
-        return None
+def load_manifest(context_dir):
+    """Load the registry manifest. Returns dict or None."""
+    registry = load_registry(context_dir)
+    return registry["manifest"] if registry else None
 
 
-def check_drift(context_dir):
-    """Compare registry against filesystem. Returns list of drift entries."""
-    manifest = load_manifest(context_dir)
+def check_drift(context_dir, jobs=None, depth=None, nested=None, use_cache=True, on_drift=None):
+    """Compare registry against filesystem. Returns list of drift entries.
+
+    on_drift, if given, is called with each entry as soon as it is found.
+    """
+    registry = load_registry(context_dir)
+    manifest = registry["manifest"] if registry else None
     if not manifest:
-        print(f"No registry found at {context_dir}/")
-        print("Run init_context.py first to create the registry.")
+        print(f"No registry found at {context_dir}/", file=sys.stderr)
+        print("Run init_context.py first to create the registry.", file=sys.stderr)
         return None
 
     last_updated = manifest.get("last_updated", "unknown")
-    drifts = []
+    settings = _scan_settings(manifest, depth, nested)
 
-    # Get current filesystem state
-    registered_projects = manifest.get("projects", {})
+    # Scan filesystem for current state
+    current_projects = _scan_with_cache(context_dir, manifest, settings, jobs=jobs, use_cache=use_cache)
 
-    # Determine scan roots from registered project paths.
-    # Use the most common parent directory (the actual scan root),
-    # not every project's parent — that would scan too broadly.
-    parent_counts = {}
-    for name, info in registered_projects.items():
-        proj_path = info.get("path", "")
-        if proj_path:
-            parent = str(Path(proj_path).parent)
-            parent_counts[parent] = parent_counts.get(parent, 0) + 1
-
-    # Use parents that contain multiple projects, or all if each is unique.
-    # Filter out home dir — it's never a scan root.
-    home = os.path.expanduser("~")
-    scan_roots = set()
-    for parent, count in parent_counts.items():
-        if parent != home:
-            scan_roots.add(parent)
+    drifts = _diff_registry(registry, current_projects, scan_global_config(), on_drift=on_drift)
+    return drifts, last_updated
 
-    # Scan filesystem for current state
-    current_projects = scan_projects(list(scan_roots)) if scan_roots else []
+
+def _diff_registry(registry, current_projects, current_global, on_drift=None):
+    """Compare a loaded registry with scan results. Returns drift entries.
+
+    on_drift, if given, is called with each entry as it is produced.
+    """
+    manifest = registry["manifest"]
+    drifts = []
+
+    def add(drift):
+        drifts.append(drift)
+        if on_drift:
+            on_drift(drift)
+
+    registered_projects = manifest.get("projects", {})
     current_by_name = {p["name"]: p for p in current_projects}
     registered_names = set(registered_projects.keys())
     current_names = set(current_by_name.keys())
@@ -108,7 +324,7 @@ def check_drift(context_dir):
     # Projects added on filesystem but not in registry
     for name in sorted(current_names - registered_names):
         p = current_by_name[name]
-        drifts.append({
+        add({
             "status": "ADDED",
             "path": p["path"],
             "detail": "not in registry",
@@ -116,84 +332,99 @@ def check_drift(context_dir):
 
     # Projects in registry but gone from filesystem
     for name in sorted(registered_names - current_names):
-        info = registered_projects[name]
-        path = info.get("path", name)
-        if not Path(path).exists():
-            drifts.append({
-                "status": "REMOVED",
-                "path": path,
-                "detail": "path gone, still in registry",
-            })
-        else:
-            # Path exists but no longer has Claude config
-            drifts.append({
-                "status": "REMOVED",
-                "path": path,
-                "detail": "Claude config removed, still in registry",
-            })
+        path = registered_projects[name].get("path", name)
+        add(_removed_entry(path))
 
     # Projects in both — check for content changes
     for name in sorted(registered_names & current_names):
         info = registered_projects[name]
         current = current_by_name[name]
-        record = load_project_record(context_dir, name)
-
-        changes = []
-
-        # Compare config files by hash
-        current_snap = snapshot_project(current)
-        if record:
-            for key in ("claude_md", "settings", "mcp"):
-                reg_path = record.get(key)
-                cur_path = current.get(key)
-
-                if reg_path and not cur_path:
-                    changes.append(f"{key} removed")
-                elif not reg_path and cur_path:
-                    changes.append(f"{key} added")
-                elif reg_path and cur_path:
-                    reg_hash = file_hash(reg_path)
-                    cur_hash = file_hash(cur_path)
-                    if reg_hash != cur_hash:
-                        changes.append(f"{key} content changed")
-
-            # Compare skills list
-            reg_skills = set(record.get("skills") or [])
-            cur_skills = set(current.get("skills") or [])
-            added_skills = cur_skills - reg_skills
-            removed_skills = reg_skills - cur_skills
-            if added_skills:
-                changes.append(f"skills added: {', '.join(sorted(added_skills))}")
-            if removed_skills:
-                changes.append(f"skills removed: {', '.join(sorted(removed_skills))}")
-
-            # Compare hooks count
-            reg_hooks = len(record.get("hooks") or [])
-            cur_hooks = len(current.get("hooks") or [])
-            if reg_hooks != cur_hooks:
-                changes.append(f"hooks changed ({reg_hooks} -> {cur_hooks})")
-
-            # Compare MCP servers
-            reg_mcps = set(record.get("mcp_servers") or [])
-            cur_mcps = set(m["name"] for m in (current.get("mcp_servers") or []))
-            if reg_mcps != cur_mcps:
-                changes.append(f"MCP servers changed")
+        record = registry["projects"].get(name)
 
+        changes = _project_changes(record, current)
         if changes:
-            drifts.append({
+            add({
                 "status": "CHANGED",
                 "path": info.get("path", name),
                 "detail": "; ".join(changes),
             })
         else:
-            drifts.append({
+            add({
                 "status": "OK",
                 "path": info.get("path", name),
                 "detail": "matches",
             })
 
     # Check global skills drift
-    current_global = scan_global_config()
+    for drift in _global_drift(manifest, current_global):
+        add(drift)
+
+    return drifts
+
+
+def _removed_entry(path):
+    """Drift entry for a registered project that no longer scans as a project."""
+    if not Path(path).exists():
+        return {"status": "REMOVED", "path": path, "detail": "path gone, still in registry"}
+    # Path exists but no longer has Claude config
+    return {"status": "REMOVED", "path": path, "detail": "Claude config removed, still in registry"}
+
+
+def _project_changes(record, current):
+    """Compare a registry project record with a fresh scan. Returns change strings."""
+    changes = []
+    if not record:
+        return changes
+
+    for key in ("claude_md", "settings", "mcp"):
+        reg_path = record.get(key)
+        cur_path = current.get(key)
+
+        if reg_path and not cur_path:
+            changes.append(f"{key} removed")
+        elif not reg_path and cur_path:
+            changes.append(f"{key} added")
+
+    # Compare tracked file contents against the hashes stored at
+    # registry write time (records from older registries have none)
+    changes.extend(_content_changes(record.get("files") or {}, tracked_files(current)))
+
+    # Compare skills list
+    reg_skills = set(record.get("skills") or [])
+    cur_skills = set(current.get("skills") or [])
+    added_skills = cur_skills - reg_skills
+    removed_skills = reg_skills - cur_skills
+    if added_skills:
+        changes.append(f"skills added: {', '.join(sorted(added_skills))}")
+    if removed_skills:
+        changes.append(f"skills removed: {', '.join(sorted(removed_skills))}")
+
+    # Compare hooks count
+    reg_hooks = len(record.get("hooks") or [])
+    cur_hooks = len(current.get("hooks") or [])
+    if reg_hooks != cur_hooks:
+        changes.append(f"hooks changed ({reg_hooks} -> {cur_hooks})")
+
+    # Compare MCP servers by name, then by config fingerprint
+    reg_mcps = set(record.get("mcp_servers") or [])
+    cur_mcps = set(m["name"] for m in (current.get("mcp_servers") or []))
+    if reg_mcps != cur_mcps:
+        changes.append(f"MCP servers changed")
+    else:
+        reg_fps = record.get("mcp_fingerprints") or {}
+        reconfigured = sorted(
+            m["name"] for m in (current.get("mcp_servers") or [])
+            if m["name"] in reg_fps and reg_fps[m["name"]] != m.get("fingerprint")
+        )
+        if reconfigured:
+            changes.append(f"MCP config changed: {', '.join(reconfigured)}")
+
+    return changes
+
+
+def _global_drift(manifest, current_global):
+    """Compare the manifest's global skills with a fresh global scan."""
+    drifts = []
     reg_skills = manifest.get("skills", {})
     cur_symlinked = set(s["name"] for s in current_global["skills"].get("symlinked", []))
     reg_symlinked = set(reg_skills.get("symlinked", []))
@@ -224,7 +455,28 @@ def check_drift(context_dir):
             "detail": f"count changed ({reg_count} -> {cur_count})",
         })
 
-    return drifts, last_updated
+    return drifts
+
+
+def _content_changes(stored, current):
+    """Compare stored file records with current files. Returns change strings.
+
+    A file whose size and mtime_ns match its record is taken as unchanged
+    without being read; only files whose stat differs are re-hashed.
+    """
+    changes = []
+    for label in sorted(set(stored) & set(current)):
+        rec = stored[label]
+        path = current[label]
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if rec.get("path") == path and (st.st_size, st.st_mtime_ns) == (rec.get("size"), rec.get("mtime_ns")):
+            continue
+        if file_hash(path) != rec.get("hash"):
+            changes.append(f"{label} content changed")
+    return changes
 
 
 def format_drift_report(drifts, last_updated):
@@ -266,51 +518,268 @@ def format_drift_report(drifts, last_updated):
     return "\n".join(lines)
 
 
-def update_registry(context_dir):
-    """Re-scan filesystem and update the registry. Print what changed."""
-    manifest = load_manifest(context_dir)
-
-    # Determine scan roots (same filtering as check_drift)
-    home = os.path.expanduser("~")
-    scan_roots = set()
-    if manifest:
-        for name, info in (manifest.get("projects") or {}).items():
-            path = info.get("path", "")
-            if path:
-                parent = str(Path(path).parent)
-                if parent != home:
-                    scan_roots.add(parent)
+def update_registry(context_dir, jobs=None, depth=None, nested=None, use_cache=True, stream=None):
+    """Re-scan filesystem and update the registry. Print what changed.
 
-    if not scan_roots:
-        scan_roots = {os.path.expanduser("~/repos")}
+    With a RecordStream the issues are emitted as records and the changes
+    are reported in its summary record.
+    """
+    manifest = load_manifest(context_dir)
+    settings = _scan_settings(manifest, depth, nested)
 
     # Get machine name from existing manifest
     machine_name = manifest.get("machine") if manifest else None
 
     # Re-scan
     global_config = scan_global_config()
-    projects = scan_projects(list(scan_roots))
+    projects = _scan_with_cache(context_dir, manifest, settings, jobs=jobs, use_cache=use_cache)
 
     # Compare counts for summary
     old_count = len(manifest.get("projects", {})) if manifest else 0
     new_count = len(projects)
 
     # Write updated registry
-    write_registry(str(context_dir), global_config, projects, machine_name=machine_name)
+    stats = write_registry(
+        str(context_dir), global_config, projects, machine_name=machine_name, scan=settings
+    )
+
+    issues = detect_issues(global_config, projects)
+    if stream:
+        for issue in issues:
+            stream.emit(issue_record(issue))
+        stream.close({
+            "command": "update",
+            "path": str(context_dir),
+            "projects": {"before": old_count, "after": new_count},
+            "files": {
+                "written": stats["written"],
+                "unchanged": stats["unchanged"],
+                "removed": len(stats["removed"]),
+            },
+            "issues": issue_counts(issues),
+        })
+        return
 
     print(f"Registry updated at {context_dir}/")
     print(f"  Projects: {old_count} -> {new_count}")
-
-    issues = detect_issues(global_config, projects)
+    print(f"  Files: {stats['written']} updated, {len(stats['removed'])} removed")
     if issues:
         print(f"  Issues: {len(issues)}")
 
 
+# Seconds without new events before a batch of changes is processed
+WATCH_DEBOUNCE = 0.3
+
+# Names in a candidate directory whose changes can alter its scan result
+WATCHED_NAMES = PROJECT_MARKERS | {".git"}
+
+
+def _emit(stream, record):
+    """Emit one --watch record, stamped with the current time."""
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    stream.emit({**record, "time": now})
+
+
+def watch_registry(context_dir, jobs=None, depth=None, nested=None, use_cache=True):
+    """Watch the filesystem and keep the registry in sync until interrupted.
+
+    Prints NDJSON records in the --format ndjson schema: {"type": "watching",
+    "version"} once watches are in place, a drift record for every project
+    or global skills change, and {"type": "resync"} when the kernel event
+    queue overflowed and a full re-scan was needed.
+    """
+    registry = load_registry(context_dir)
+    if not registry:
+        print(f"No registry found at {context_dir}/", file=sys.stderr)
+        print("Run init_context.py first to create the registry.", file=sys.stderr)
+        sys.exit(1)
+    try:
+        ino = inotify.Inotify()
+    except OSError as e:
+        print(f"--watch needs inotify: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    stream = RecordStream("ndjson")
+    manifest = registry["manifest"]
+    machine_name = manifest.get("machine")
+    settings = _scan_settings(manifest, depth, nested)
+    scan_roots = settings["roots"]
+    depth, nested = settings["depth"], settings["nested"]
+    skills_dir = expand_path("~/.claude/skills")
+
+    # wd -> (kind, path, level); kinds: candidate, project, global
+    watches = {}
+    state = {"registry": registry, "global": None, "projects": {}}
+
+    def add_watch(path, kind, owner, level=0):
+        wd = ino.add_watch(path)
+        if wd >= 0:
+            watches[wd] = (kind, owner, level)
+
+    def watch_project(path):
+        claude_dir = Path(path) / ".claude"
+        for sub in (claude_dir, claude_dir / "skills", claude_dir / "hooks"):
+            if sub.is_dir():
+                add_watch(sub, "project", path)
+        try:
+            with os.scandir(claude_dir / "skills") as it:
+                entries = list(it)
+        except OSError:
+            entries = []  # no skills dir, or removed since the event
+        for entry in entries:
+            if not entry.name.startswith(".") and entry.is_dir():
+                add_watch(entry.path, "project", path)
+
+    def watch_tree(top, level):
+        """Watch candidate directories from top down; returns their paths."""
+        found = []
+        for d in iter_candidate_dirs(top, depth=depth - level, nested=nested, scan_root=level == 0):
+            d_level = level + len(d.relative_to(top).parts) if d.is_relative_to(top) else level
+            add_watch(d, "candidate", str(d), d_level)
+            found.append(str(d))
+            if str(d) in state["projects"]:
+                watch_project(str(d))
+        return found
+
+    def full_sync(event=None):
+        projects = _scan_with_cache(
+            context_dir, state["registry"]["manifest"], settings, jobs=jobs, use_cache=use_cache
+        )
+        state["projects"] = {p["path"]: p for p in projects}
+        state["global"] = scan_global_config()
+        if event:
+            _emit(stream, {"type": event})
+        drifts = [
+            d for d in _diff_registry(state["registry"], projects, state["global"])
+            if d["status"] != "OK"
+        ]
+        publish(drifts)
+        watched = set()
+        for root in scan_roots:
+            root = expand_path(root)
+            if root.is_dir():
+                watched.update(watch_tree(root, 0))
+        # Registered projects outside the roots are watched on their own
+        for path in state["projects"]:
+            if path not in watched:
+                add_watch(path, "candidate", path, depth)
+                watch_project(path)
+        if skills_dir.is_dir():
+            add_watch(skills_dir, "global", str(skills_dir))
+
+    def publish(drifts):
+        if not drifts:
+            return
+        for d in drifts:
+            _emit(stream, drift_record(d))
+        projects = sorted(state["projects"].values(), key=lambda p: p["name"])
+        write_registry(
+            str(context_dir), state["global"], projects, machine_name=machine_name, scan=settings
+        )
+        state["registry"] = load_registry(context_dir)
+
+    def rescan(dirty, global_dirty):
+        registry = state["registry"]
+        by_path = {
+            info.get("path"): name
+            for name, info in (registry["manifest"].get("projects") or {}).items()
+        }
+        drifts = []
+        for path in sorted(dirty):
+            fresh = _scan_single_project(Path(path)) if os.path.isdir(path) else None
+            name = by_path.get(path)
+            if fresh:
+                state["projects"][path] = fresh
+                watch_project(path)
+            else:
+                state["projects"].pop(path, None)
+
+            if fresh and not name:
+                drifts.append({"status": "ADDED", "path": path, "detail": "not in registry"})
+            elif name and not fresh:
+                drifts.append(_removed_entry(path))
+            elif fresh:
+                changes = _project_changes(registry["projects"].get(name), fresh)
+                if changes:
+                    drifts.append({"status": "CHANGED", "path": path, "detail": "; ".join(changes)})
+
+        if global_dirty:
+            state["global"] = scan_global_config()
+            drifts.extend(_global_drift(registry["manifest"], state["global"]))
+        publish(drifts)
+
+    full_sync()
+    _emit(stream, {
+        "type": "watching",
+        "version": SCHEMA_VERSION,
+        "roots": [str(r) for r in scan_roots],
+        "depth": depth,
+        "watches": len(watches),
+        "projects": len(state["projects"]),
+    })
+
+    dirty = set()
+    global_dirty = False
+    overflow = False
+    created = inotify.IN_CREATE | inotify.IN_MOVED_TO
+    deleted = inotify.IN_DELETE | inotify.IN_MOVED_FROM
+    try:
+        while True:
+            events = ino.read_events(WATCH_DEBOUNCE if (dirty or global_dirty or overflow) else None)
+            if not events:
+                if overflow:
+                    watches.clear()
+                    full_sync(event="resync")
+                elif dirty or global_dirty:
+                    rescan(dirty, global_dirty)
+                dirty, global_dirty, overflow = set(), False, False
+                continue
+
+            for wd, mask, name in events:
+                if mask & inotify.IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                info = watches.get(wd)
+                if info is None:
+                    continue
+                if mask & inotify.IN_IGNORED:
+                    watches.pop(wd, None)
+                    continue
+                kind, owner, level = info
+                if kind == "global":
+                    global_dirty = True
+                elif kind == "project":
+                    dirty.add(owner)
+                elif name in WATCHED_NAMES or mask & (inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF):
+                    dirty.add(owner)
+                elif mask & inotify.IN_ISDIR:
+                    child = os.path.join(owner, name)
+                    # Scan roots' children are candidates whatever their name
+                    if mask & created and level < depth and not (
+                        name.startswith(".") or (level > 0 and name in IGNORED_DIRS)
+                    ):
+                        dirty.update(watch_tree(Path(child), level + 1))
+                    elif mask & deleted:
+                        dirty.update(
+                            p for p in state["projects"]
+                            if p == child or p.startswith(child + os.sep)
+                        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ino.close()
+
+
 def main():
     args = sys.argv[1:]
 
     context_dir = expand_path("~/.claude/context")
     mode = "check"
+    jobs = None
+    depth = None
+    nested = None
+    use_cache = True
+    fmt = "text"
 
     i = 0
     while i < len(args):
@@ -320,9 +789,38 @@ def main():
         elif args[i] == "--update":
             mode = "update"
             i += 1
+        elif args[i] == "--watch":
+            mode = "watch"
+            i += 1
         elif args[i] == "--context-dir" and i + 1 < len(args):
             context_dir = expand_path(args[i + 1])
             i += 2
+        elif args[i] == "--jobs" and i + 1 < len(args):
+            try:
+                jobs = int(args[i + 1])
+            except ValueError:
+                print(f"--jobs expects a number, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--depth" and i + 1 < len(args):
+            try:
+                depth = int(args[i + 1])
+            except ValueError:
+                print(f"--depth expects a number, got: {args[i + 1]}")
+                sys.exit(1)
+            i += 2
+        elif args[i] == "--nested":
+            nested = True
+            i += 1
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
+        elif args[i] == "--format" and i + 1 < len(args):
+            fmt = args[i + 1]
+            if fmt not in FORMATS:
+                print(f"--format must be one of: {', '.join(FORMATS)}")
+                sys.exit(1)
+            i += 2
         elif args[i] in ("-h", "--help"):
             print(__doc__)
             sys.exit(0)
@@ -332,19 +830,40 @@ def main():
             sys.exit(1)
 
     if mode == "check":
-        result = check_drift(context_dir)
+        stream = RecordStream(fmt) if fmt != "text" else None
+        result = check_drift(
+            context_dir, jobs=jobs, depth=depth, nested=nested, use_cache=use_cache,
+            on_drift=(lambda d: stream.emit(drift_record(d))) if stream else None,
+        )
         if result is None:
             sys.exit(1)
         drifts, last_updated = result
-        report = format_drift_report(drifts, last_updated)
-        print(report)
+        has_drift = any(d["status"] != "OK" for d in drifts)
+        if fmt == "text":
+            report = format_drift_report(drifts, last_updated)
+            print(report)
+        else:
+            counts = {"ADDED": 0, "REMOVED": 0, "CHANGED": 0, "OK": 0}
+            for d in drifts:
+                counts[d["status"]] = counts.get(d["status"], 0) + 1
+            stream.close({
+                "command": "check",
+                "last_updated": last_updated,
+                "counts": {status.lower(): n for status, n in counts.items()},
+                "drift": has_drift,
+            })
 
         # Exit code: 0 if no drift, 1 if drift detected
-        has_drift = any(d["status"] != "OK" for d in drifts)
         sys.exit(1 if has_drift else 0)
 
     elif mode == "update":
-        update_registry(context_dir)
+        stream = RecordStream(fmt) if fmt != "text" else None
+        update_registry(
+            context_dir, jobs=jobs, depth=depth, nested=nested, use_cache=use_cache, stream=stream
+        )
+
+    elif mode == "watch":
+        watch_registry(context_dir, jobs=jobs, depth=depth, nested=nested, use_cache=use_cache)
 
 
 if __name__ == "__main__":